@@ -0,0 +1,90 @@
+"""Benchmark the Gmsh partition wall clock time as the number of parts grows.
+
+Each benchmark model is a set of concentric spherical shell parts partitioned in a single call.
+
+.. code-block::
+
+   $ python benchmark_gmsh_partition.py --parts 1 2 4 8 16 -o benchmark_gmsh_partition.csv
+"""
+
+import argparse
+import pathlib
+import sys
+import time
+
+from turbo_turtle import _gmsh_python
+
+default_parts = [1, 2, 4, 8, 16]
+default_repeat = 3
+default_output = None
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Return the command-line parser."""
+    parser = argparse.ArgumentParser(description="Benchmark the Gmsh partition time as the number of parts grows")
+    parser.add_argument(
+        "-p",
+        "--parts",
+        nargs="+",
+        type=int,
+        default=default_parts,
+        help="Number of concentric spherical shell parts to partition (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=default_repeat,
+        help="Number of repetitions per part count. Report the minimum time. (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=pathlib.Path,
+        default=default_output,
+        help="Output CSV file. Print to STDOUT if not provided. (default: %(default)s)",
+    )
+    return parser
+
+
+def benchmark(parts: int) -> tuple[int, float]:
+    """Return the partitioned volume count and the partition wall clock time of a concentric shell model.
+
+    :param parts: number of concentric spherical shell parts
+
+    :returns: number of partitioned volumes, partition wall clock time in seconds
+    """
+    _gmsh_python.gmsh.initialize()
+    _gmsh_python.gmsh.option.setNumber("General.Verbosity", 0)
+    _gmsh_python.gmsh.model.add("benchmark")
+    part_names = [f"shell{number}" for number in range(parts)]
+    for number, part_name in enumerate(part_names):
+        _gmsh_python._sphere(float(number + 1), float(number + 2), revolution_angle=360.0, part_name=part_name)
+    start = time.perf_counter()
+    volumes = _gmsh_python._partition(part_name=part_names, big_number=float(parts + 2) * 2.0)
+    elapsed = time.perf_counter() - start
+    _gmsh_python.gmsh.finalize()
+    return len(volumes), elapsed
+
+
+def main() -> None:
+    """Run the Gmsh partition benchmark from a command-line interface."""
+    parser = get_parser()
+    args = parser.parse_args()
+
+    lines = ["parts,volumes,seconds"]
+    for parts in args.parts:
+        results = [benchmark(parts) for _ in range(args.repeat)]
+        volumes = results[0][0]
+        seconds = min(result[1] for result in results)
+        lines.append(f"{parts},{volumes},{seconds:.6f}")
+
+    text = "\n".join(lines) + "\n"
+    if args.output is not None:
+        args.output.write_text(text)
+    else:
+        sys.stdout.write(text)
+
+
+if __name__ == "__main__":
+    main()
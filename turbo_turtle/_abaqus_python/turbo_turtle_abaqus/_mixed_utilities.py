@@ -5,7 +5,9 @@ from __future__ import print_function
 import functools
 import os
 import re
+import shutil
 import sys
+import tempfile
 
 import numpy
 
@@ -189,20 +191,129 @@ def _element_type_regex(content, element_type):
     return re.sub(regex, subst, content, count=0, flags=re.MULTILINE | re.IGNORECASE)
 
 
+def _element_type_lines(mesh_file, element_type):
+    """Yield the lines of an orphan mesh file with element types substituted in the ``*Element`` keyword lines.
+
+    :param str mesh_file: existing orphan mesh file
+    :param str element_type: element type to substitute into the ``*Element`` keyword phrase
+
+    :returns: generator of (original line, substituted line) tuples
+    """
+    with open(mesh_file, "r") as orphan_mesh:
+        for line in orphan_mesh:
+            # Only keyword lines can contain the element keyword. Skip the regex for node and element data lines.
+            if "*" in line:
+                yield line, _element_type_regex(line, element_type)
+            else:
+                yield line, line
+
+
+def _replace_file(source, destination):
+    """Python 2/3 compatible ``os.replace``.
+
+    Abaqus Python 2 on Windows can not rename onto an existing file, so the destination is removed first, which is not
+    atomic.
+
+    :param str source: file to rename
+    :param str destination: file to replace
+    """
+    replace = getattr(os, "replace", None)
+    if replace is not None:
+        replace(source, destination)
+        return
+    if os.name == "nt" and os.path.exists(destination):
+        os.remove(destination)
+    os.rename(source, destination)
+
+
 def substitute_element_type(mesh_file, element_type):
     """Substitute element types in an existing orphan mesh file via the ``*Element`` keyword.
 
+    The file is streamed line by line, so memory use is bounded by the longest line. The file is read once to find a
+    changed ``*Element`` keyword line and is not rewritten if no element types change. Otherwise, the substituted lines
+    are streamed to a temporary file in the same directory, which replaces ``mesh_file`` with an atomic rename.
+
     :param str mesh_file: existing orphan mesh file
     :param str element_type: element type to substitute into the ``*Element`` keyword phrase
 
     :returns: re-writes ``mesh_file`` if element type changes have been made
     """
-    with open(mesh_file, "r") as orphan_mesh:
-        old_content = orphan_mesh.read()
-    new_content = _element_type_regex(old_content, element_type)
-    if new_content != old_content:
-        with open(mesh_file, "w") as orphan_mesh:
-            orphan_mesh.write(new_content)
+    if all(line == new_line for line, new_line in _element_type_lines(mesh_file, element_type)):
+        return
+    directory = os.path.dirname(os.path.abspath(mesh_file))
+    handle, temporary_file = tempfile.mkstemp(suffix=".inp", dir=directory)
+    try:
+        with os.fdopen(handle, "w") as new_mesh:
+            for _line, new_line in _element_type_lines(mesh_file, element_type):
+                new_mesh.write(new_line)
+        shutil.copymode(mesh_file, temporary_file)
+        _replace_file(temporary_file, mesh_file)
+    finally:
+        if os.path.exists(temporary_file):
+            os.remove(temporary_file)
+
+
+def _keyword_parameter(parameters, parameter):
+    """Return the value of an Abaqus keyword parameter without surrounding quotes.
+
+    :param list parameters: ``parameter=value`` strings of a keyword line split on commas
+    :param str parameter: parameter name to find
+
+    :returns: parameter value, or None if the parameter is not found
+    :rtype: str
+    """
+    for item in parameters:
+        key, _separator, value = item.partition("=")
+        if key.strip() == parameter:
+            return value.strip().strip('"')
+    return None
+
+
+def keyword_blocks(blocks, part_name):
+    """Extract part definitions and the assembly definition from Abaqus keyword blocks in a single pass.
+
+    The keyword block lines are scanned once with a state machine. A part definition is the text between the
+    ``*Part, name=part_name`` and ``*End Part`` keywords. The part name may be quoted and followed by other keyword
+    parameters. The assembly definition is the text between the first ``*Assembly`` and ``*End Assembly`` keywords.
+    Keywords and part names are matched case insensitively. Part definitions without ``*Node`` or ``*Element`` keywords
+    are omitted, e.g. the empty part definitions written for parts without a dependent instance.
+
+    :param blocks: keyword block strings, e.g. ``model.keywordBlock.sieBlocks``. Strings may contain multiple lines.
+    :param list part_name: part names to extract
+
+    :returns: ``(parts, assembly)`` tuple. ``parts`` is a dictionary of ``{part name: part definition}`` for the meshed
+        part definitions. ``assembly`` is the assembly definition string, or None if no assembly is found.
+    :rtype: tuple
+    """
+    requested = {name.lower(): name for name in part_name}
+    parts = {}
+    assembly = None
+    lines = None
+    target = None
+    meshed = False
+    for block in blocks:
+        for line in block.split("\n"):
+            keyword = line.strip().lower()
+            if lines is None:
+                parameters = keyword.split(",")
+                if parameters[0].replace(" ", "") == "*part":
+                    name = requested.get(_keyword_parameter(parameters[1:], "name"))
+                    if name is not None and name not in parts:
+                        lines, target, meshed = [], name, False
+                elif keyword.startswith("*assembly") and assembly is None:
+                    lines, target = [], None
+            elif target is not None and keyword.startswith("*end part"):
+                if meshed:
+                    parts[target] = "\n".join(lines).strip()
+                lines = None
+            elif target is None and keyword.startswith("*end assembly"):
+                assembly = "\n".join(lines)
+                lines = None
+            else:
+                if keyword.startswith(("*node", "*element")):
+                    meshed = True
+                lines.append(line)
+    return parts, assembly
 
 
 def cubit_part_names(part_name):
@@ -26,6 +26,7 @@ def main(
     element_type=parsers.export_defaults["element_type"],
     destination=parsers.export_defaults["destination"],
     assembly=parsers.export_defaults["assembly"],
+    single_pass=parsers.export_defaults["single_pass"],
 ):
     """Wrap orphan mesh export function for input file handling.
 
@@ -36,19 +37,25 @@ def main(
     :param str destination: write output orphan mesh files to this output directory
     :param str assembly: Assembly file for exporting the assembly keyword block. If provided and no instances are
         found, instance all part names before export.
+    :param bool single_pass: Export every part and the assembly block from a single keyword block scan with
+        :meth:`turbo_turtle_abaqus.export.export_single_pass`
     """
     input_file = os.path.splitext(input_file)[0] + ".cae"
     with _abaqus_utilities.AbaqusNamedTemporaryFile(input_file, suffix=".cae", dir="."):
-        export(
-            model_name=model_name,
-            part_name=part_name,
-            element_type=element_type,
-            destination=destination,
-            assembly=assembly,
-        )
+        try:
+            export(
+                model_name=model_name,
+                part_name=part_name,
+                element_type=element_type,
+                destination=destination,
+                assembly=assembly,
+                single_pass=single_pass,
+            )
+        except RuntimeError as err:
+            _mixed_utilities.sys_exit(str(err))
 
 
-def export(model_name, part_name, element_type, destination, assembly):
+def export(model_name, part_name, element_type, destination, assembly, single_pass=False):
     """Driver function for exporting part and assembly files.
 
     :param str model_name: model to query in the Abaqus model database
@@ -57,11 +64,23 @@ def export(model_name, part_name, element_type, destination, assembly):
     :param str destination: write output orphan mesh files to this output directory
     :param str assembly: Assembly file for exporting the assembly keyword block. If provided and no instances are
         found, instance all part names before export.
+    :param bool single_pass: Export every part and the assembly block from a single keyword block scan with
+        :meth:`turbo_turtle_abaqus.export.export_single_pass`
     """
     element_type = _mixed_utilities.validate_element_type_or_exit(
         length_part_name=len(part_name), element_type=element_type
     )
 
+    if single_pass:
+        export_single_pass(
+            model_name=model_name,
+            part_name=part_name,
+            element_type=element_type,
+            destination=destination,
+            assembly=assembly,
+        )
+        return
+
     export_multiple_parts(
         model_name=model_name, part_name=part_name, element_type=element_type, destination=destination
     )
@@ -97,6 +116,65 @@ def _export_assembly(assembly_file, model_name, part_name):
         output.write("\n")
 
 
+def export_single_pass(model_name, part_name, element_type, destination, assembly=None):
+    """Export orphan mesh files for multiple parts and the assembly keyword block from a single keyword block scan.
+
+    Synchronizes the model keyword block once and extracts every part definition and the assembly definition with
+    :meth:`turbo_turtle_abaqus._mixed_utilities.keyword_blocks`. No temporary models are created. Part definitions
+    contain the part mesh only for dependent part instances. If no instances are found, instance all part names as
+    dependent instances before the scan. Every requested part must have a dependent instance with a mesh. Use
+    :meth:`export_multiple_parts` for models with independent instances.
+
+    :param str model_name: model to query in the Abaqus model database
+    :param list part_name: list of parts to query in the specified Abaqus model
+    :param list element_type: list of element types, one per part name
+    :param str destination: write output orphan mesh files to this output directory
+    :param str assembly: Assembly file for exporting the assembly keyword block
+
+    :raises RuntimeError: if a part has no dependent instance, or if a meshed part or the requested assembly keyword
+        block is not found
+    """
+    import abaqus  # noqa: PLC0415
+    import abaqusConstants  # noqa: PLC0415
+
+    model = abaqus.mdb.models[model_name]
+    root_assembly = model.rootAssembly
+    if len(root_assembly.instances.keys()) == 0:
+        instance_names = part_name if len(part_name) > 0 else model.parts.keys()
+        for new_instance in instance_names:
+            part = model.parts[new_instance]
+            root_assembly.Instance(name=new_instance, part=part, dependent=abaqusConstants.ON)
+    dependent_parts = {
+        instance.partName for instance in root_assembly.instances.values() if instance.dependent == abaqusConstants.ON
+    }
+    independent = [name for name in part_name if name not in dependent_parts]
+    if independent:
+        raise RuntimeError(
+            "Single pass export requires a dependent instance of part(s): {}. Export without single pass for "
+            "independent instances".format(", ".join(independent))
+        )
+
+    model.keywordBlock.synchVersions()
+    parts, assembly_text = _mixed_utilities.keyword_blocks(model.keywordBlock.sieBlocks, part_name)
+    missing = [name for name in part_name if name not in parts]
+    if missing:
+        raise RuntimeError("Could not find a meshed part keyword block for part(s): {}".format(", ".join(missing)))
+    if assembly is not None and assembly_text is None:
+        raise RuntimeError("Could not find the assembly keyword block in model '{}'".format(model_name))
+
+    for new_part, new_element in zip(part_name, element_type):
+        mesh_output_file = os.path.join(destination, new_part) + ".inp"
+        with open(mesh_output_file, "w") as output:
+            output.write(parts[new_part])
+        if new_element is not None:
+            _mixed_utilities.substitute_element_type(mesh_output_file, new_element)
+    if assembly is not None:
+        assembly_file = os.path.splitext(assembly)[0] + ".inp"
+        with open(assembly_file, "w") as output:
+            output.write(assembly_text)
+            output.write("\n")
+
+
 def export_multiple_parts(model_name, part_name, element_type, destination):
     """Export orphan mesh files for multiple parts, and allow element type changes.
 
@@ -266,5 +344,6 @@ if __name__ == "__main__":
                 element_type=args.element_type,
                 destination=args.destination,
                 assembly=args.assembly,
+                single_pass=args.single_pass,
             )
         )
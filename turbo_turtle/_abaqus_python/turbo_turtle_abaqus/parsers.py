@@ -79,6 +79,7 @@ geometry_defaults = {
     "y_offset": 0.0,
     "rtol": None,
     "atol": None,
+    "jobs": 1,
 }
 geometry_cli_help = "Create 2D or 3D part(s) from XY coordinate list input file(s)"
 geometry_cli_description = (
@@ -193,6 +194,17 @@ def geometry_parser(basename="geometry.py", add_help=True, description=geometry_
         default=geometry_defaults["atol"],
         help="absolute tolerance used by ``numpy.isclose``. If not provided, use numpy defaults (default: %(default)s)",
     )
+    if cubit:
+        optional.add_argument(
+            "--jobs",
+            type=positive_int,
+            default=geometry_defaults["jobs"],
+            help=(
+                "Number of Abaqus CAE kernels creating disjoint shards of the input files. The shard model databases "
+                "are merged into the output file. Each kernel checks out an Abaqus license. Zero uses the CPU count. "
+                "Unused by Cubit and Gmsh implementations (default: %(default)s)"
+            ),
+        )
     return parser
 
 
@@ -494,7 +506,8 @@ sets_cli_description = (
     "workflow is to perform manual set creation on a nominal geometry model, record the set masks/IDs reported by "
     "the third-party software, and write the CLI options into a scripted workflow file. Abaqus reports CAE "
     "operations in the ``abaqus.rpy`` replay file, e.g. ``grep -A 1 'mask=' abaqus.rpy``. Cubit IDs can be found in "
-    "the model tree."
+    "the model tree. Gmsh masks are entity tags, ``box xmin ymin zmin xmax ymax zmax`` bounding boxes, or "
+    "``near x y z`` nearest entity points."
 )
 
 
@@ -579,6 +592,32 @@ mesh_defaults = {
     "part_name": "Part-1",
     "global_seed": 1.0,
     "edge_seeds": None,
+    "num_threads": None,
+    "algorithm_2d": None,
+    "algorithm_3d": None,
+    "distance_refinements": None,
+    "boundary_layers": None,
+    "curvature_elements": None,
+    "verbosity": None,
+    "log_file": None,
+}
+# Gmsh ``Mesh.Algorithm`` and ``Mesh.Algorithm3D`` option values by name
+mesh_gmsh_algorithm_2d = {
+    "meshadapt": 1,
+    "automatic": 2,
+    "delaunay": 5,
+    "frontal-delaunay": 6,
+    "bamg": 7,
+    "frontal-delaunay-quads": 8,
+    "packing-parallelograms": 9,
+    "quasi-structured-quad": 11,
+}
+mesh_gmsh_algorithm_3d = {
+    "delaunay": 1,
+    "frontal": 4,
+    "mmg3d": 7,
+    "r-tree": 9,
+    "hxt": 10,
 }
 mesh_cli_help = "Mesh a part from a global seed and optional edge seeds"
 # TODO: Write a more descriptive behavior message
@@ -663,11 +702,113 @@ def mesh_parser(basename="mesh_module.py", add_help=True, description=mesh_cli_d
         default=mesh_defaults["edge_seeds"],
         help="Edge seed (name, number) pairs. Repeat once per edge set. (default: %(default)s)",
     )
+    if cubit:
+        optional.add_argument(
+            "--num-threads",
+            type=positive_int,
+            default=mesh_defaults["num_threads"],
+            help=(
+                "Gmsh meshing thread count. Sets ``General.NumThreads`` and ``Mesh.MaxNumThreads{1,2,3}D``. Zero "
+                "uses the system default, e.g. ``OMP_NUM_THREADS``. Unused by Abaqus and Cubit implementations "
+                "(default: %(default)s)"
+            ),
+        )
+        optional.add_argument(
+            "--algorithm-2d",
+            choices=sorted(mesh_gmsh_algorithm_2d.keys()),
+            default=mesh_defaults["algorithm_2d"],
+            help=(
+                "Gmsh 2D meshing algorithm. 'meshadapt', 'delaunay', and 'frontal-delaunay' mesh surfaces in "
+                "parallel. Unused by Abaqus and Cubit implementations (default: %(default)s)"
+            ),
+        )
+        optional.add_argument(
+            "--algorithm-3d",
+            choices=sorted(mesh_gmsh_algorithm_3d.keys()),
+            default=mesh_defaults["algorithm_3d"],
+            help=(
+                "Gmsh 3D meshing algorithm. 'hxt' is the parallel Delaunay implementation. Unused by Abaqus and "
+                "Cubit implementations (default: %(default)s)"
+            ),
+        )
+        optional.add_argument(
+            "--distance-refinement",
+            dest="distance_refinements",
+            action="append",
+            nargs=4,
+            metavar=("name", "size", "distance_minimum", "distance_maximum"),
+            default=mesh_defaults["distance_refinements"],
+            help=(
+                "Gmsh distance/threshold size field refinement. Use the element size within the minimum distance of "
+                "the named entities and grade to the global seed at the maximum distance. Repeat once per entity "
+                "name. Unused by Abaqus and Cubit implementations (default: %(default)s)"
+            ),
+        )
+        optional.add_argument(
+            "--boundary-layer",
+            dest="boundary_layers",
+            action="append",
+            nargs=4,
+            metavar=("name", "size", "ratio", "thickness"),
+            default=mesh_defaults["boundary_layers"],
+            help=(
+                "Gmsh 2D boundary layer on the named curves with first layer size, growth ratio, and total "
+                "thickness. Repeat once per curve name. Unused by Abaqus and Cubit implementations "
+                "(default: %(default)s)"
+            ),
+        )
+        optional.add_argument(
+            "--curvature-elements",
+            type=positive_int,
+            default=mesh_defaults["curvature_elements"],
+            help=(
+                "Gmsh curvature based element size as the number of elements per 2 Pi radians. Unused by Abaqus and "
+                "Cubit implementations (default: %(default)s)"
+            ),
+        )
+        verbosity = optional.add_mutually_exclusive_group()
+        verbosity.add_argument(
+            "--verbose",
+            dest="verbosity",
+            action="store_const",
+            const="verbose",
+            default=mesh_defaults["verbosity"],
+            help=(
+                "Report Gmsh debug messages and meshing progress. Unused by Abaqus and Cubit implementations "
+                "(default: %(default)s)"
+            ),
+        )
+        verbosity.add_argument(
+            "--quiet",
+            dest="verbosity",
+            action="store_const",
+            const="quiet",
+            default=mesh_defaults["verbosity"],
+            help=(
+                "Report only Gmsh warnings and errors. Unused by Abaqus and Cubit implementations "
+                "(default: %(default)s)"
+            ),
+        )
+        optional.add_argument(
+            "--log-file",
+            type=str,
+            default=mesh_defaults["log_file"],
+            help=(
+                "Gmsh rotating log file. Gmsh messages are drained to the log file after every meshing stage. Unused "
+                "by Abaqus and Cubit implementations (default: %(default)s)"
+            ),
+        )
 
     return parser
 
 
-merge_defaults = {"merged_model_name": "Model-1", "model_name": [None], "part_name": [None]}
+merge_defaults = {
+    "merged_model_name": "Model-1",
+    "model_name": [None],
+    "part_name": [None],
+    "fragment": False,
+    "jobs": None,
+}
 merge_cli_help = "Merge parts from multiple model database files into a single model"
 merge_cli_description = (
     "Supply multiple model database files, model names, and part names to merge the parts into a "
@@ -729,6 +870,26 @@ def merge_parser(basename="merge.py", add_help=True, description=merge_cli_descr
         default=merge_defaults["part_name"],
         help=part_name_help,
     )
+    if cubit:
+        optional.add_argument(
+            "--fragment",
+            action="store_true",
+            help=(
+                "Fragment the merged Gmsh parts to create conformal part interfaces. Unused by Abaqus and Cubit "
+                "implementations (default: %(default)s)"
+            ),
+        )
+        optional.add_argument(
+            "--jobs",
+            type=positive_int,
+            default=merge_defaults["jobs"],
+            help=(
+                "Number of worker processes. None merges serially. Zero uses the CPU count. Gmsh reads and heals the "
+                "input files in the workers. Cubit merges the input files in rounds of concurrent worker merges and "
+                "each worker checks out a Cubit license. Unused by Abaqus and cubit-journal implementations "
+                "(default: %(default)s)"
+            ),
+        )
     return parser
 
 
@@ -738,6 +899,8 @@ export_defaults = {
     "element_type": [None],
     "destination": os.getcwd(),
     "assembly": None,
+    "single_pass": False,
+    "jobs": 1,
 }
 export_output_type_choices = ["abaqus", "genesis", "genesis-normal", "genesis-hdf5"]
 export_defaults["output_type"] = export_output_type_choices[0]
@@ -810,6 +973,16 @@ def export_parser(basename="export.py", add_help=True, description=export_cli_de
             "block (default: %(default)s)"
         ),
     )
+    optional.add_argument(
+        "--single-pass",
+        action="store_true",
+        default=export_defaults["single_pass"],
+        help=(
+            "Synchronize the model keyword block once and extract every part orphan mesh and the assembly block from a "
+            "single scan without temporary models. Requires dependent part instances. Unused by Cubit and Gmsh "
+            "implementations (default: %(default)s)"
+        ),
+    )
     if cubit:
         optional.add_argument(
             "--output-type",
@@ -821,6 +994,16 @@ def export_parser(basename="export.py", add_help=True, description=export_cli_de
                 "are output to a single file ``input_file``.g (default: %(default)s)"
             ),
         )
+        optional.add_argument(
+            "--jobs",
+            type=positive_int,
+            default=export_defaults["jobs"],
+            help=(
+                "Number of Cubit worker processes exporting disjoint subsets of the part names to Abaqus orphan "
+                "meshes. Each worker checks out a Cubit license. Zero uses the CPU count. Unused by Abaqus, Gmsh, and "
+                "genesis output type implementations (default: %(default)s)"
+            ),
+        )
 
     return parser
 
@@ -832,6 +1015,8 @@ image_defaults = {
     "image_size": [1920, 1080],
     "model_name": "Model-1",
     "part_name": None,
+    "views": None,
+    "offscreen": False,
 }
 image_cli_help = "Save an image of a model database file"
 image_cli_description = "Save a part or assembly view image for a given Abaqus input file"
@@ -947,4 +1132,28 @@ def image_parser(basename="image.py", add_help=True, description=image_cli_descr
         default=image_color_map_choices[0],
         help=color_map_help,
     )
+
+    if cubit:
+        optional.add_argument(
+            "--view",
+            dest="views",
+            action="append",
+            nargs=4,
+            metavar=("x_angle", "y_angle", "z_angle", "output_file"),
+            default=image_defaults["views"],
+            help=(
+                "Additional view rotation angles and output image file. All views are rendered from a single model "
+                "load. Repeat once per view. Unused by Abaqus implementation (default: %(default)s)"
+            ),
+        )
+        optional.add_argument(
+            "--offscreen",
+            action="store_true",
+            default=image_defaults["offscreen"],
+            help=(
+                "Render without a graphical interface context. Used automatically when no display is available. "
+                "Unused by Abaqus and Cubit implementations (default: %(default)s)"
+            ),
+        )
+
     return parser
@@ -7,7 +7,9 @@
 
 import inspect
 import os
+import shutil
 import sys
+import tempfile
 import unittest
 
 filename = inspect.getfile(lambda: None)
@@ -86,9 +88,44 @@ class TestMixedUtilities(unittest.TestCase):
             new_contents = _mixed_utilities._element_type_regex(content, element_type)
             self.assertEqual(new_contents, expected)
 
+    def test_keyword_blocks(self):
+        blocks = [
+            "*Heading",
+            "*Part, name=Part-1\n*Node\n1, 0., 0.\n*End Part",
+            "*Part, name=Part-2\n*Node\n*End Part",
+            "*Part, name=Part-3\n*End Part",
+            '*Part, name="Part 4", instance=Part-4-1\n*Node\n4, 0., 0.\n*End Part',
+            "*Assembly, name=Assembly\n*Instance, name=Part-1, part=Part-1\n*End Instance\n*End Assembly",
+        ]
+        parts, assembly = _mixed_utilities.keyword_blocks(blocks, ["Part-1", "Part-3", "Part 4"])
+        self.assertEqual(parts, {"Part-1": "*Node\n1, 0., 0.", "Part 4": "*Node\n4, 0., 0."})
+        self.assertEqual(assembly, "*Instance, name=Part-1, part=Part-1\n*End Instance")
+
     def test_substitute_element_type(self):
-        # TODO: Figure out how to mock file i/o with Python 2 unittest and no mock module
-        pass
+        tests = [
+            (
+                "*Element, type=C3D8\n1, 1, 2, 3, 4, 5, 6, 7, 8\n",
+                "C3D8R",
+                "*Element, type=C3D8R\n1, 1, 2, 3, 4, 5, 6, 7, 8\n",
+            ),
+            (
+                "*Element, type=C3D8R\n1, 1, 2, 3, 4, 5, 6, 7, 8\n",
+                "C3D8R",
+                "*Element, type=C3D8R\n1, 1, 2, 3, 4, 5, 6, 7, 8\n",
+            ),
+        ]
+        temporary_directory = tempfile.mkdtemp()
+        try:
+            mesh_file = os.path.join(temporary_directory, "mesh.inp")
+            for content, element_type, expected in tests:
+                with open(mesh_file, "w") as output:
+                    output.write(content)
+                _mixed_utilities.substitute_element_type(mesh_file, element_type)
+                with open(mesh_file, "r") as result:
+                    self.assertEqual(result.read(), expected)
+                self.assertEqual(os.listdir(temporary_directory), ["mesh.inp"])
+        finally:
+            shutil.rmtree(temporary_directory)
 
 
 if __name__ == "__main__":
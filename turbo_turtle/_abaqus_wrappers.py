@@ -1,27 +1,61 @@
 import argparse
+import concurrent.futures
+import math
+import os
+import pathlib
+import tempfile
 
 from turbo_turtle import _settings, _utilities
+from turbo_turtle._abaqus_python.turbo_turtle_abaqus import _mixed_utilities
 
 
 def geometry(args: argparse.Namespace, command: str) -> None:
     """Python 3 wrapper around the Abaqus Python
     :meth:`turbo_turtle._abaqus_python.turbo_turtle_abaqus.parsers.geometry_parser` CLI.
 
+    When more than one job is requested for more than one input file, split the input files into contiguous shards and
+    create each shard in a separate Abaqus CAE kernel. The shard model databases are merged into the output file with
+    the ``merge.py`` script.
+
     :param argparse.Namespace args: namespace of parsed arguments
     :param str command: abaqus executable path
     """  # noqa: D205
+    max_workers = min(args.jobs or os.cpu_count() or 1, len(args.input_file))
+    if max_workers > 1:
+        _geometry_sharded(args, command, max_workers)
+    else:
+        _utilities.run_command(_geometry_command(args, command, args.input_file, args.part_name, args.output_file))
+
+
+def _geometry_command(
+    args: argparse.Namespace,
+    command: str,
+    input_file: list[str],
+    part_name: list[str | None],
+    output_file: str,
+) -> str:
+    """Return the Abaqus Python ``geometry.py`` command for one set of input files.
+
+    :param argparse.Namespace args: namespace of parsed arguments
+    :param str command: abaqus executable path
+    :param input_file: input text file(s) with coordinates to draw
+    :param part_name: name(s) of part(s) being created
+    :param output_file: Abaqus CAE database to save the part(s)
+
+    :returns: command string
+    """
     script = _settings._abaqus_python_abspath / "geometry.py"
 
     command = f"{command} cae -noGui {script} -- "
-    command += f"--input-file {_utilities.character_delimited_list(args.input_file)} "
-    command += f"--output-file {args.output_file} "
+    command += f"--input-file {_utilities.character_delimited_list(input_file)} "
+    command += f"--output-file {output_file} "
     command += f"--unit-conversion {args.unit_conversion} "
     command += f"--euclidean-distance {args.euclidean_distance} "
     if args.planar:
         command += "--planar "
     command += f"--model-name {args.model_name} "
-    if args.part_name[0] is not None:
-        command += f"--part-name {_utilities.character_delimited_list(args.part_name)} "
+    if part_name[0] is not None:
+        command += f"--part-name {_utilities.character_delimited_list(part_name)} "
     command += f"--delimiter {args.delimiter} "
     command += f"--header-lines {args.header_lines} "
     command += f"--revolution-angle {args.revolution_angle} "
@@ -30,7 +64,90 @@ def geometry(args: argparse.Namespace, command: str) -> None:
         command += f"--rtol {args.rtol} "
     if args.atol is not None:
         command += f"--atol {args.atol} "
-    _utilities.run_command(command)
+    return command
+
+
+def _geometry_sharded(args: argparse.Namespace, command: str, max_workers: int) -> None:
+    """Create the geometry input files in concurrent Abaqus CAE kernels and merge the shard model databases.
+
+    Each kernel checks out an Abaqus license. The kernels are separate processes, so threads are sufficient to wait on
+    them. Every shard runs to completion before the failed shards are reported together.
+
+    :param argparse.Namespace args: namespace of parsed arguments
+    :param str command: abaqus executable path
+    :param int max_workers: number of concurrent Abaqus CAE kernels
+
+    :raises RuntimeError: if any shard fails. The message lists the failed parts and input files reported by each
+        failed shard. Every part of a shard that fails without reporting its failed parts is listed, followed by the
+        shard error message.
+    """
+    part_name = _mixed_utilities.validate_part_name(args.input_file, args.part_name)
+    shard_size = math.ceil(len(args.input_file) / max_workers)
+    shards = [
+        (args.input_file[start : start + shard_size], part_name[start : start + shard_size])
+        for start in range(0, len(args.input_file), shard_size)
+    ]
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        shard_files = [str(pathlib.Path(temporary_directory) / f"shard{number}.cae") for number in range(len(shards))]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _utilities.run_command,
+                    _geometry_command(args, command, shard_input, shard_part, shard_file),
+                    capture_stderr=True,
+                )
+                for (shard_input, shard_part), shard_file in zip(shards, shard_files, strict=True)
+            ]
+
+        failed_parts = []
+        shard_messages = []
+        for (shard_input, shard_part), future in zip(shards, futures, strict=True):
+            try:
+                future.result()
+            # Collect every shard failure before reporting
+            except RuntimeError as err:  # noqa: PERF203
+                shard_failed_parts = _shard_failed_parts(str(err), shard_part, shard_input)
+                failed_parts += shard_failed_parts or list(zip(shard_part, shard_input, strict=True))
+                if not shard_failed_parts and str(err).strip():
+                    shard_messages.append(str(err).strip())
+        if failed_parts:
+            error_message = [
+                (
+                    "Error: failed to create the following parts from input files in parallel Abaqus CAE shards. "
+                    "Check the XY coordinates for inadmissible Abaqus sketch connectivity. The "
+                    "``turbo-turtle geometry-xyplot`` subcommand can plot points to aid in troubleshooting."
+                )
+            ]
+            error_message += [f"    {this_part}, {this_file}" for this_part, this_file in failed_parts]
+            error_message += shard_messages
+            raise RuntimeError("\n".join(error_message))
+
+        merge_command = f"{command} cae -noGui {_settings._abaqus_python_abspath / 'merge.py'} -- "
+        merge_command += f"--input-file {_utilities.character_delimited_list(shard_files)} "
+        merge_command += f"--output-file {args.output_file} "
+        merge_command += f"--merged-model-name {args.model_name} "
+        merge_command += f"--model-name {args.model_name}"
+        _utilities.run_command(merge_command)
+
+
+def _shard_failed_parts(message: str, part_name: list[str], input_file: list[str]) -> list[tuple[str, str]]:
+    """Return the failed parts reported in a ``geometry.py`` shard error message.
+
+    The Abaqus Python ``geometry.py`` script lists each failed part as an indented ``part, file`` line.
+
+    :param message: shard error message, including STDERR
+    :param part_name: name(s) of the shard part(s)
+    :param input_file: the shard input text file(s)
+
+    :returns: list of ``(part name, input file)`` tuples reported as failed, in shard order
+    """
+    lines = {line.strip() for line in message.splitlines()}
+    return [
+        (this_part, this_file)
+        for this_part, this_file in zip(part_name, input_file, strict=True)
+        if f"{this_part}, {this_file}" in lines
+    ]
 
 
 def cylinder(args: argparse.Namespace, command: str) -> None:
@@ -177,6 +294,8 @@ def export(args: argparse.Namespace, command: str) -> None:
     if args.element_type[0] is not None:
         command += f"--element-type {_utilities.character_delimited_list(args.element_type)} "
     command += f"--destination {args.destination} "
+    if args.single_pass:
+        command += "--single-pass "
     if args.assembly is not None:
         command += f"--assembly {args.assembly}"
     _utilities.run_command(command)
@@ -0,0 +1,739 @@
+"""Compile Cubit operations into a single APREPRO journal file.
+
+Mirrors the :mod:`turbo_turtle._cubit_python` operations without importing Cubit. The compiled journal is executed by a
+single ``cubit -batch`` process, so hosts where ``import cubit`` fails can still run the operations, and the journal is
+a reproducible artifact that can be cached and replayed.
+
+Operations can not query the Cubit model while compiling. New entity IDs are captured in APREPRO variables with the
+Cubit ``Id`` function. Existing entities are selected by name prefix and sheet body state with the Cubit extended
+command line entity specification, e.g. ``volume with name "part*" and is_sheetbody``. Commands that require a
+non-empty selection are compiled inside APREPRO conditionals that count the selection at run time. Nodeset, sideset, and
+block IDs are numbered from one per operation, so input files must not already contain nodesets, sidesets, or blocks.
+
+.. code-block::
+
+   journal = _cubit_journal.Journal()
+   _cubit_journal.cylinder(journal, 1.0, 2.0, 1.0, "cylinder.cub")
+   _cubit_journal.mesh(journal, "cylinder.cub", "HEX")
+   journal.run("cylinder.jou", "cubit")
+"""
+
+import contextlib
+import functools
+import pathlib
+import typing
+
+import numpy
+
+from turbo_turtle import _utilities
+from turbo_turtle._abaqus_python.turbo_turtle_abaqus import _mixed_utilities, parsers, vertices
+
+
+class Journal:
+    """Accumulate Cubit APREPRO commands and the Python actions to run after the journal is executed."""
+
+    def __init__(self) -> None:
+        self.commands: list[str] = []
+        self.after: list[typing.Callable[[], None]] = []
+        self._variables: dict[str, int] = {}
+
+    def command(self, command: str) -> None:
+        """Append a Cubit APREPRO command.
+
+        :param command: Cubit APREPRO command
+        """
+        self.commands.append(command)
+
+    def new_id(self, entity_type: str) -> str:
+        """Capture the ID of the last created entity in a new APREPRO variable.
+
+        :param entity_type: Cubit entity type, e.g. "vertex", "curve", "surface", "volume"
+
+        :returns: APREPRO substitution string for the captured ID, e.g. ``{vertex1}``
+        """
+        variable = self._variable(entity_type)
+        self.commands.append(f'#{{{variable} = Id("{entity_type}")}}')
+        return f"{{{variable}}}"
+
+    @contextlib.contextmanager
+    def if_volumes(self, specification: str) -> typing.Iterator[None]:
+        """Compile the commands of the context to run only if the specification selects at least one volume.
+
+        The selected volumes are counted at run time in a temporary Cubit group and the commands are wrapped in an
+        APREPRO conditional.
+
+        :param specification: Cubit volume entity specification, e.g. from :meth:`turbo_turtle._cubit_journal._volumes`
+        """
+        variable = self._variable("volumes")
+        group = f"turbo_turtle_{variable}"
+        self.commands.append(f'group "{group}" add {specification}')
+        self.commands.append(f'#{{{variable} = NumTypeInGroup("{group}", "volume")}}')
+        self.commands.append(f'delete group with name "{group}"')
+        self.commands.append(f"#{{if({variable} > 0)}}")
+        yield
+        self.commands.append("#{endif}")
+
+    def _variable(self, prefix: str) -> str:
+        """Return a new APREPRO variable name.
+
+        :param prefix: variable name prefix, e.g. the entity type
+
+        :returns: variable name numbered from one per prefix, e.g. ``vertex1``
+        """
+        count = self._variables.get(prefix, 0) + 1
+        self._variables[prefix] = count
+        return f"{prefix}{count}"
+
+    def text(self) -> str:
+        """Return the journal file text.
+
+        :returns: newline delimited journal commands
+        """
+        return "".join(f"{command}\n" for command in self.commands)
+
+    def write(self, journal_file: str | pathlib.Path) -> pathlib.Path:
+        """Write the journal file.
+
+        :param journal_file: Cubit journal file to write
+
+        :returns: journal file path
+        """
+        journal_file = pathlib.Path(journal_file).with_suffix(".jou")
+        journal_file.write_text(self.text())
+        return journal_file
+
+    def run(self, journal_file: str | pathlib.Path, cubit_command: str | pathlib.Path) -> None:
+        """Write the journal file, execute it with a single ``cubit -batch`` process, and run the after actions.
+
+        Cubit journal errors do not change the ``cubit -batch`` exit status, so the Cubit output is checked for error
+        messages instead.
+
+        :param journal_file: Cubit journal file to write
+        :param cubit_command: Cubit executable path
+
+        :raises RuntimeError: if Cubit reports an error. The after actions are not run.
+        """
+        journal_file = self.write(journal_file)
+        output = _utilities.run_command(f"{cubit_command} -batch -nojournal {journal_file}", capture_stderr=True)
+        errors = [line.strip() for line in output.splitlines() if line.strip().startswith("ERROR:")]
+        if errors:
+            raise RuntimeError("\n".join([f"Cubit journal '{journal_file}' failed:", *errors]))
+        for action in self.after:
+            action()
+
+
+def _volumes(name: str, sheet_body: bool | None = None) -> str:
+    """Return the Cubit entity specification of all volumes with a name prefix.
+
+    :param name: volume name prefix
+    :param sheet_body: Select only sheet bodies when True, only volumes that are not sheet bodies when False, else all
+
+    :returns: Cubit entity specification
+    """
+    specification = f'volume with name "{name}*"'
+    if sheet_body is True:
+        specification = f"{specification} and is_sheetbody"
+    elif sheet_body is False:
+        specification = f"{specification} and not is_sheetbody"
+    return specification
+
+
+def _coordinates_string(point: typing.Sequence[float] | numpy.ndarray) -> str:
+    """Return a space delimited three-dimensional coordinate string.
+
+    :param point: (X, Y) or (X, Y, Z) coordinates. Two-dimensional coordinates are placed on the Z=0 plane.
+
+    :returns: space delimited (X, Y, Z) coordinates
+    """
+    point = numpy.array(point, dtype=float)
+    if point.shape[0] == 2:
+        point = numpy.append(point, 0.0)
+    return _utilities.character_delimited_list(point)
+
+
+def _vertex(journal: Journal, point: typing.Sequence[float] | numpy.ndarray) -> str:
+    """Create a vertex.
+
+    :param journal: Cubit journal to compile into
+    :param point: (X, Y) or (X, Y, Z) vertex coordinates
+
+    :returns: APREPRO substitution string of the vertex ID
+    """
+    journal.command(f"create vertex {_coordinates_string(point)}")
+    return journal.new_id("vertex")
+
+
+def _curve(
+    journal: Journal,
+    point1: typing.Sequence[float] | numpy.ndarray,
+    point2: typing.Sequence[float] | numpy.ndarray,
+) -> str:
+    """Create a straight curve between two points.
+
+    :param journal: Cubit journal to compile into
+    :param point1: First set of coordinates
+    :param point2: Second set of coordinates
+
+    :returns: APREPRO substitution string of the curve ID
+    """
+    vertex1 = _vertex(journal, point1)
+    vertex2 = _vertex(journal, point2)
+    journal.command(f"create curve vertex {vertex1} {vertex2}")
+    return journal.new_id("curve")
+
+
+def _spline(journal: Journal, coordinates: typing.Sequence[typing.Sequence[float]] | numpy.ndarray) -> str:
+    """Create a spline through a list of points.
+
+    :param journal: Cubit journal to compile into
+    :param coordinates: [N, 2] or [N, 3] array of coordinates
+
+    :returns: APREPRO substitution string of the curve ID
+
+    :raises RuntimeError: if fewer than two coordinates are provided
+    """
+    minimum = 2
+    if len(coordinates) < minimum:
+        raise RuntimeError(f"Requires at least {minimum} coordinates to create a spline")
+    vertex_ids = _utilities.character_delimited_list(_vertex(journal, point) for point in coordinates)
+    journal.command(f"create curve spline vertex {vertex_ids} delete")
+    return journal.new_id("curve")
+
+
+def _arc(
+    journal: Journal,
+    center: typing.Sequence[float] | numpy.ndarray,
+    point1: typing.Sequence[float] | numpy.ndarray,
+    point2: typing.Sequence[float] | numpy.ndarray,
+) -> str:
+    """Create a circular arc from the center and two points on the arc.
+
+    :param journal: Cubit journal to compile into
+    :param center: (X, Y, Z) location for the center of the circle arc
+    :param point1: (X, Y, Z) location for the first point on the arc
+    :param point2: (X, Y, Z) location for the second point on the arc
+
+    :returns: APREPRO substitution string of the curve ID
+    """
+    center_vertex = _vertex(journal, center)
+    # Cubit creates arcs with anticlockwise rotation. Order vertices with most negative Y axis coordinate first.
+    if not point1[1] < point2[1]:
+        point1, point2 = point2, point1
+    vertex1 = _vertex(journal, point1)
+    vertex2 = _vertex(journal, point2)
+    journal.command(f"create curve arc center vertex {center_vertex} {vertex1} {vertex2} normal 0 0 1")
+    curve = journal.new_id("curve")
+    journal.command(f"delete vertex {center_vertex}")
+    return curve
+
+
+def _surface(journal: Journal, curves: typing.Sequence[str]) -> tuple[str, str]:
+    """Create a sheet body surface from curves.
+
+    :param journal: Cubit journal to compile into
+    :param curves: APREPRO substitution strings of the curve IDs
+
+    :returns: APREPRO substitution strings of the surface ID and the sheet body volume ID
+    """
+    journal.command(f"create surface curve {_utilities.character_delimited_list(curves)}")
+    return journal.new_id("surface"), journal.new_id("volume")
+
+
+def _surface_from_coordinates(journal: Journal, coordinates: numpy.ndarray) -> tuple[str, str]:
+    """Create a sheet body surface from a closed perimeter of straight curves between [N, 3] coordinates.
+
+    :param journal: Cubit journal to compile into
+    :param coordinates: [N, 3] array of 3D coordinates where N > 2
+
+    :returns: APREPRO substitution strings of the surface ID and the sheet body volume ID
+
+    :raises RuntimeError: if fewer than three coordinates are provided
+    """
+    coordinates = numpy.array(coordinates)
+    if coordinates.shape[0] < 3:
+        raise RuntimeError("Requires at least 3 coordinates to create a surface")
+    coordinates_shift = numpy.roll(coordinates, 1, axis=0)
+    curves = [_curve(journal, point1, point2) for point1, point2 in zip(coordinates, coordinates_shift, strict=True)]
+    return _surface(journal, curves)
+
+
+def _draw_surface(
+    journal: Journal,
+    lines: list[tuple[tuple[float, float], tuple[float, float]]] | list[numpy.ndarray],
+    splines: list[typing.Sequence[tuple[float, float]]] | list[numpy.ndarray],
+) -> tuple[str, str]:
+    """Create a sheet body surface from ordered lists of line and spline coordinates.
+
+    :param journal: Cubit journal to compile into
+    :param lines: list of [2, 2] shaped arrays of (x, y) coordinates defining a line segment
+    :param splines: list of [N, 2] shaped arrays of (x, y) coordinates defining a spline
+
+    :returns: APREPRO substitution strings of the surface ID and the sheet body volume ID
+    """
+    curves = [_curve(journal, first, second) for first, second in lines]
+    curves.extend(_spline(journal, spline) for spline in splines)
+    return _surface(journal, curves)
+
+
+def _rename_and_sweep(
+    journal: Journal,
+    surface: str,
+    volume: str,
+    part_name: str,
+    center: tuple[float, float, float] | numpy.ndarray = (0.0, 0.0, 0.0),
+    planar: bool = parsers.geometry_defaults["planar"],  # type: ignore[assignment]
+    revolution_angle: float = parsers.geometry_defaults["revolution_angle"],  # type: ignore[assignment]
+) -> None:
+    """Sweep a sheet body if required and rename the body/volume by part name.
+
+    Hyphens are replaced by underscores to make the ACIS engine happy.
+
+    :param journal: Cubit journal to compile into
+    :param surface: APREPRO substitution string of the surface ID
+    :param volume: APREPRO substitution string of the sheet body volume ID
+    :param part_name: name of the part being created
+    :param center: center of the revolution axis
+    :param planar: switch to indicate that 2D model dimensionality is planar, not axisymmetric
+    :param revolution_angle: angle of solid revolution for ``3D`` geometries. Ignore when planar is True.
+    """
+    part_name = part_name.replace("-", "_")
+    if not planar and not numpy.isclose(revolution_angle, 0.0):
+        center_string = _utilities.character_delimited_list(numpy.array(center))
+        journal.command(f"sweep surface {surface} axis {center_string} 0 1 0 angle {revolution_angle} merge")
+        journal.command(f"regularize volume {volume}")
+    journal.command(f'volume {volume} name "{part_name}"')
+
+
+def geometry(
+    journal: Journal,
+    input_file: typing.Sequence[str | pathlib.Path],
+    output_file: str | pathlib.Path,
+    planar: bool = parsers.geometry_defaults["planar"],  # type: ignore[assignment]
+    part_name: typing.Sequence[str | None] = parsers.geometry_defaults["part_name"],  # type: ignore[assignment]
+    unit_conversion: float = parsers.geometry_defaults["unit_conversion"],  # type: ignore[assignment]
+    euclidean_distance: float = parsers.geometry_defaults["euclidean_distance"],  # type: ignore[assignment]
+    delimiter: str = parsers.geometry_defaults["delimiter"],  # type: ignore[assignment]
+    header_lines: int = parsers.geometry_defaults["header_lines"],  # type: ignore[assignment]
+    revolution_angle: float = parsers.geometry_defaults["revolution_angle"],  # type: ignore[assignment]
+    y_offset: float = parsers.geometry_defaults["y_offset"],  # type: ignore[assignment]
+    rtol: float = parsers.geometry_defaults["rtol"],  # type: ignore[assignment]
+    atol: float = parsers.geometry_defaults["atol"],  # type: ignore[assignment]
+) -> None:
+    """Compile :meth:`turbo_turtle._cubit_python.geometry`.
+
+    :param journal: Cubit journal to compile into
+    :param input_file: input text file(s) with coordinates to draw
+    :param output_file: Cubit ``*.cub`` database to save the part(s)
+    :param planar: switch to indicate that 2D model dimensionality is planar, not axisymmetric
+    :param part_name: name(s) of the part(s) being created
+    :param unit_conversion: multiplication factor applies to all coordinates
+    :param euclidean_distance: if the distance between two coordinates is greater than this, draw a straight line.
+    :param delimiter: character to use as a delimiter when reading the input file
+    :param header_lines: number of lines in the header to skip when reading the input file
+    :param revolution_angle: angle of solid revolution for ``3D`` geometries. Ignore when planar is True.
+    :param y_offset: vertical offset along the global Y-axis
+    :param rtol: relative tolerance for vertical/horizontal line checks
+    :param atol: absolute tolerance for vertical/horizontal line checks
+    """
+    part_names: list[str] = _mixed_utilities.cubit_part_names(
+        _mixed_utilities.validate_part_name(input_file, part_name)
+    )
+    output_file = pathlib.Path(output_file).with_suffix(".cub")
+    journal.command("reset")
+    bodies = []
+    for file_name in input_file:
+        coordinates = _mixed_utilities.return_genfromtxt(
+            file_name, delimiter, header_lines, expected_dimensions=2, expected_columns=2
+        )
+        coordinates = vertices.scale_and_offset_coordinates(coordinates, unit_conversion, y_offset)
+        lines, splines = vertices.lines_and_splines(coordinates, euclidean_distance, rtol=rtol, atol=atol)
+        bodies.append(_draw_surface(journal, lines, splines))
+    for (surface, volume), new_part in zip(bodies, part_names, strict=True):
+        _rename_and_sweep(journal, surface, volume, new_part, planar=planar, revolution_angle=revolution_angle)
+    journal.command(f"save as '{output_file}' overwrite")
+
+
+def cylinder(
+    journal: Journal,
+    inner_radius: float,
+    outer_radius: float,
+    height: float,
+    output_file: str | pathlib.Path,
+    part_name: str = parsers.cylinder_defaults["part_name"],  # type: ignore[assignment]
+    revolution_angle: float = parsers.geometry_defaults["revolution_angle"],  # type: ignore[assignment]
+    y_offset: float = parsers.cylinder_defaults["y_offset"],  # type: ignore[assignment]
+) -> None:
+    """Compile :meth:`turbo_turtle._cubit_python.cylinder`.
+
+    :param journal: Cubit journal to compile into
+    :param inner_radius: Radius of the hollow center
+    :param outer_radius: Outer radius of the cylinder
+    :param height: Height of the cylinder
+    :param output_file: Cubit ``*.cub`` database to save the part(s)
+    :param part_name: name of the part being created
+    :param revolution_angle: angle of solid revolution for ``3D`` geometries
+    :param y_offset: vertical offset along the global Y-axis
+    """
+    part_name = _mixed_utilities.cubit_part_names(part_name)
+    output_file = pathlib.Path(output_file).with_suffix(".cub")
+    journal.command("reset")
+    lines = vertices.cylinder_lines(inner_radius, outer_radius, height, y_offset=y_offset)
+    surface, volume = _draw_surface(journal, lines, [])
+    _rename_and_sweep(journal, surface, volume, part_name, revolution_angle=revolution_angle)
+    journal.command(f"save as '{output_file}' overwrite")
+
+
+def sphere(
+    journal: Journal,
+    inner_radius: float,
+    outer_radius: float,
+    output_file: str | pathlib.Path,
+    input_file: str | pathlib.Path | None = parsers.sphere_defaults["input_file"],  # type: ignore[assignment]
+    quadrant: typing.Literal["upper", "lower", "both"] = parsers.sphere_defaults["quadrant"],  # type: ignore[assignment]
+    revolution_angle: float = parsers.sphere_defaults["revolution_angle"],  # type: ignore[assignment]
+    y_offset: float = parsers.sphere_defaults["y_offset"],  # type: ignore[assignment]
+    part_name: str = parsers.sphere_defaults["part_name"],  # type: ignore[assignment]
+) -> None:
+    """Compile :meth:`turbo_turtle._cubit_python.sphere`.
+
+    :param journal: Cubit journal to compile into
+    :param inner_radius: inner radius (size of hollow)
+    :param outer_radius: outer radius (size of sphere)
+    :param output_file: output file name. Will be stripped of the extension and ``.cub`` will be used.
+    :param input_file: input file name. Will be stripped of the extension and ``.cub`` will be used.
+    :param quadrant: quadrant of XY plane for the sketch: upper (I), lower (IV), both
+    :param revolution_angle: angle of rotation 0.-360.0 degrees. Provide 0 for a 2D axisymmetric model.
+    :param y_offset: vertical offset along the global Y-axis
+    :param part_name: name of the part to be created
+    """
+    part_name = _mixed_utilities.cubit_part_names(part_name)
+    output_file = pathlib.Path(output_file).with_suffix(".cub")
+    journal.command("reset")
+    if input_file is not None:
+        journal.command(f"open '{pathlib.Path(input_file).with_suffix('.cub')}'")
+
+    center = numpy.array([0.0, y_offset, 0.0])
+    arc_points = vertices.sphere(center[:2], inner_radius, outer_radius, quadrant)
+    inner_point1, inner_point2, outer_point1, outer_point2 = (numpy.array([*point, 0.0]) for point in arc_points)
+    curves = []
+    if numpy.allclose(inner_point1, center) and numpy.allclose(inner_point2, center):
+        inner_point1 = center
+        inner_point2 = center
+    else:
+        curves.append(_arc(journal, center, inner_point1, inner_point2))
+    curves.append(_arc(journal, center, outer_point1, outer_point2))
+    curves.append(_curve(journal, inner_point1, outer_point1))
+    curves.append(_curve(journal, inner_point2, outer_point2))
+    surface, volume = _surface(journal, curves)
+    _rename_and_sweep(journal, surface, volume, part_name, revolution_angle=revolution_angle, center=center)
+    journal.command(f"save as '{output_file}' overwrite")
+
+
+def _pyramid_volumes(
+    journal: Journal,
+    center: numpy.ndarray,
+    xvector: numpy.ndarray,
+    zvector: numpy.ndarray,
+    size: float,
+) -> list[str]:
+    """Create the six (6) four-sided pyramid volumes defined by a cube's center point and six outer faces.
+
+    Surfaces are assigned to pyramids from the coordinate centroids, so no Cubit model query is required.
+
+    :param journal: Cubit journal to compile into
+    :param center: center location of the geometry
+    :param xvector: Local x-axis vector defined in global coordinates
+    :param zvector: Local z-axis vector defined in global coordinates
+    :param size: Half-length of the cube diagonals (length of the pyramid tip to corner)
+
+    :returns: APREPRO substitution strings of the pyramid volume IDs
+    """
+    yvector = numpy.cross(zvector, xvector)
+    surface_coordinates = vertices.pyramid_surfaces(center, xvector, zvector, size)
+    surfaces = [_surface_from_coordinates(journal, coordinates)[0] for coordinates in surface_coordinates]
+    directions = numpy.array([numpy.mean(coordinates, axis=0) for coordinates in surface_coordinates]) - center
+    pyramids = []
+    for vector in (yvector, -yvector, xvector, -xvector, zvector, -zvector):
+        vector_dot = directions @ vector
+        # Account for numerical errors in significant digits
+        vector_dot[numpy.isclose(vector_dot, 0.0)] = 0.0
+        pyramid_surfaces = [surface for surface, dot in zip(surfaces, vector_dot, strict=True) if dot > 0.0]
+        journal.command(f"create volume surface {_utilities.character_delimited_list(pyramid_surfaces)} heal keep")
+        pyramids.append(journal.new_id("volume"))
+    journal.command(f"delete surface {_utilities.character_delimited_list(surfaces)}")
+    return pyramids
+
+
+def partition(
+    journal: Journal,
+    input_file: str | pathlib.Path,
+    output_file: str | pathlib.Path | None = parsers.partition_defaults["output_file"],  # type: ignore[assignment]
+    center: tuple[float, float, float] | numpy.ndarray = parsers.partition_defaults["center"],  # type: ignore[assignment]
+    xvector: tuple[float, float, float] | numpy.ndarray = parsers.partition_defaults["xvector"],  # type: ignore[assignment]
+    zvector: tuple[float, float, float] | numpy.ndarray = parsers.partition_defaults["zvector"],  # type: ignore[assignment]
+    part_name: list[str] = parsers.partition_defaults["part_name"],  # type: ignore[assignment]
+    big_number: float = parsers.partition_defaults["big_number"],  # type: ignore[assignment]
+) -> None:
+    """Compile :meth:`turbo_turtle._cubit_python.partition`.
+
+    The pyramid partitions are created by webcutting the parts with each pyramid as a tool volume.
+
+    :param journal: Cubit journal to compile into
+    :param input_file: Cubit ``*.cub`` file to open that already contains parts/volumes to be meshed
+    :param output_file: Cubit ``*.cub`` file to write
+    :param center: center location of the geometry
+    :param xvector: Local x-axis vector defined in global coordinates
+    :param zvector: Local z-axis vector defined in global coordinates
+    :param part_name: part/volume name prefixes
+    :param big_number: Number larger than the outer radius of the part to partition.
+    """
+    part_name = _mixed_utilities.cubit_part_names(part_name)
+    if output_file is None:
+        output_file = input_file
+    input_file = pathlib.Path(input_file).with_suffix(".cub")
+    output_file = pathlib.Path(output_file).with_suffix(".cub")
+    center = numpy.array(center)
+    xvector = numpy.array(xvector)
+    zvector = numpy.array(zvector)
+
+    journal.command("reset")
+    journal.command(f"open '{input_file}'")
+
+    pyramids = _pyramid_volumes(journal, center, xvector, zvector, big_number)
+    for pyramid in pyramids:
+        for name in part_name:
+            journal.command(f"webcut {_volumes(name)} tool volume {pyramid}")
+    journal.command(f"delete volume {_utilities.character_delimited_list(pyramids)}")
+
+    for command in _utilities.cubit_primary_plane_webcuts(center, xvector, zvector, part_name):
+        journal.command(command)
+
+    for name in part_name:
+        journal.command(f"imprint {_volumes(name)}")
+        journal.command(f"merge {_volumes(name)}")
+    journal.command(f"save as '{output_file}' overwrite")
+
+
+def sets(
+    journal: Journal,
+    input_file: str | pathlib.Path,
+    output_file: str | pathlib.Path | None = parsers.sets_defaults["output_file"],
+    part_name: str | None = parsers.sets_defaults["part_name"],  # noqa: ARG001
+    face_sets: typing.Sequence[tuple[str, str | int]] | None = parsers.sets_defaults["face_sets"],  # type: ignore[assignment]
+    edge_sets: typing.Sequence[tuple[str, str | int]] | None = parsers.sets_defaults["edge_sets"],  # type: ignore[assignment]
+    vertex_sets: typing.Sequence[tuple[str, str | int]] | None = parsers.sets_defaults["vertex_sets"],  # type: ignore[assignment]
+) -> None:
+    """Compile :meth:`turbo_turtle._cubit_python.sets`.
+
+    :param journal: Cubit journal to compile into
+    :param input_file: Cubit ``*.cub`` file to open that already contains parts/volumes to be meshed
+    :param output_file: Cubit ``*.cub`` file to write
+    :param part_name: part/volume name prefix. Unused. Kept for API compatibility with
+        :meth:`turbo_turtle._cubit_python.sets`
+    :param face_sets: Face set tuples (name, mask)
+    :param edge_sets: Edge set tuples (name, mask)
+    :param vertex_sets: Vertex set tuples (name, mask)
+
+    :raises RuntimeError: if no sets are requested
+    """
+    if not any([face_sets, edge_sets, vertex_sets]):
+        raise RuntimeError("Must specify at least one of: face_sets, edge_sets, vertex_sets")
+    if output_file is None:
+        output_file = input_file
+    input_file = pathlib.Path(input_file).with_suffix(".cub")
+    output_file = pathlib.Path(output_file).with_suffix(".cub")
+
+    journal.command("reset")
+    journal.command(f"open '{input_file}'")
+    nodeset_id = 1
+    sideset_id = 1
+    for feature, name_mask in (("surface", face_sets), ("curve", edge_sets), ("vertex", vertex_sets)):
+        for name, mask in name_mask or []:
+            journal.command(f'{feature} {mask} name "{name}"')
+            journal.command(f"nodeset {nodeset_id} ADD {feature} {mask}")
+            journal.command(f'nodeset {nodeset_id} name "{name}"')
+            nodeset_id += 1
+            if feature != "vertex":
+                journal.command(f"sideset {sideset_id} ADD {feature} {mask}")
+                journal.command(f'sideset {sideset_id} name "{name}"')
+                sideset_id += 1
+    journal.command(f"save as '{output_file}' overwrite")
+
+
+def mesh(
+    journal: Journal,
+    input_file: str | pathlib.Path,
+    element_type: str,
+    output_file: str | pathlib.Path | None = parsers.mesh_defaults["output_file"],  # type: ignore[assignment]
+    part_name: str | None = parsers.mesh_defaults["part_name"],  # type: ignore[assignment]
+    global_seed: float = parsers.mesh_defaults["global_seed"],  # type: ignore[assignment]
+    edge_seeds: typing.Sequence[tuple[str, str | int | float]] | None = parsers.mesh_defaults["edge_seeds"],  # type: ignore[assignment]
+) -> None:
+    """Compile :meth:`turbo_turtle._cubit_python.mesh`.
+
+    :param journal: Cubit journal to compile into
+    :param input_file: Cubit ``*.cub`` file to open that already contains parts/volumes to be meshed
+    :param element_type: Cubit scheme "trimesh" or "tetmesh". Else ignored.
+    :param output_file: Cubit ``*.cub`` file to write
+    :param part_name: part/volume name prefix
+    :param global_seed: The global mesh seed size
+    :param edge_seeds: Edge seed tuples (name, number)
+
+    :raises ValueError: if an edge seed is not a positive number
+    """
+    part_name = _mixed_utilities.cubit_part_names(part_name)
+    element_type = element_type.lower()
+    if output_file is None:
+        output_file = input_file
+    input_file = pathlib.Path(input_file).with_suffix(".cub")
+    output_file = pathlib.Path(output_file).with_suffix(".cub")
+
+    journal.command("reset")
+    journal.command(f"open '{input_file}'")
+    for name, number in edge_seeds or []:
+        seed_number = float(number)
+        if seed_number <= 0.0:
+            raise ValueError("Feature seeds must be positive numbers")
+        seed = f"interval {int(seed_number)}" if seed_number.is_integer() else f"size {seed_number}"
+        journal.command(f'curve with name "{name}*" {seed}')
+
+    sheet_bodies = _volumes(part_name, sheet_body=True)
+    sheet_surfaces = f"surface in {sheet_bodies}"
+    with journal.if_volumes(sheet_bodies):
+        if element_type == "trimesh":
+            journal.command(f"{sheet_surfaces} scheme {element_type}")
+        journal.command(f"{sheet_surfaces} size {global_seed}")
+        journal.command(f"mesh {sheet_surfaces}")
+
+    volumes = _volumes(part_name, sheet_body=False)
+    with journal.if_volumes(volumes):
+        if element_type == "tetmesh":
+            journal.command(f"{volumes} scheme {element_type}")
+        journal.command(f"{volumes} size {global_seed}")
+        journal.command(f"mesh {volumes}")
+    journal.command(f"save as '{output_file}' overwrite")
+
+
+def merge(
+    journal: Journal,
+    input_file: typing.Sequence[str | pathlib.Path],
+    output_file: str | pathlib.Path,
+) -> None:
+    """Compile :meth:`turbo_turtle._cubit_python.merge`.
+
+    :param journal: Cubit journal to compile into
+    :param input_file: List of Cubit ``*.cub`` file(s) to merge
+    :param output_file: Cubit ``*.cub`` file to write
+    """
+    output_file = pathlib.Path(output_file).with_suffix(".cub")
+    journal.command("reset")
+    for path in input_file:
+        journal.command(f"import cubit '{pathlib.Path(path).with_suffix('.cub')}' unique_genesis_ids")
+    journal.command(f"save as '{output_file}' overwrite")
+
+
+def _volume_name_block(journal: Journal, block_id: int, name: str) -> None:
+    """Create a named block with all volumes prefixed by name. Sheet bodies are added as surfaces.
+
+    :param journal: Cubit journal to compile into
+    :param block_id: new block ID
+    :param name: Name for new block and prefix for volume search
+    """
+    sheet_bodies = _volumes(name, sheet_body=True)
+    with journal.if_volumes(sheet_bodies):
+        journal.command(f"block {block_id} add surface in {sheet_bodies}")
+    volumes = _volumes(name, sheet_body=False)
+    with journal.if_volumes(volumes):
+        journal.command(f"block {block_id} add {volumes}")
+    journal.command(f"block {block_id} name '{name}'")
+
+
+def export(
+    journal: Journal,
+    input_file: str | pathlib.Path,
+    part_name: list[str] = parsers.export_defaults["part_name"],  # type: ignore[assignment]
+    element_type: list[str | None] = parsers.export_defaults["element_type"],  # type: ignore[assignment]
+    destination: str | pathlib.Path = parsers.export_defaults["destination"],  # type: ignore[assignment]
+    output_type: typing.Literal["abaqus", "genesis", "genesis-normal", "genesis-hdf5"] = parsers.export_defaults[  # type: ignore[assignment]
+        "output_type"
+    ],
+) -> None:
+    """Compile :meth:`turbo_turtle._cubit_python.export`.
+
+    Abaqus element type substitutions are appended to the journal after actions.
+
+    :param journal: Cubit journal to compile into
+    :param input_file: Cubit ``*.cub`` file to open that already contains meshed parts/volumes
+    :param part_name: list of part/volume name prefix to export
+    :param element_type: list of element types, one per part name or one global replacement for every part name
+    :param destination: write output orphan mesh files to this output directory
+    :param output_type: String identifying genesis output type: abaqus, genesis (large format), genesis-normal,
+        genesis-hdf5
+
+    :raises RuntimeError: if the output type is unknown
+    """
+    part_name = _mixed_utilities.cubit_part_names(part_name)
+    element_type = _mixed_utilities.validate_element_type(length_part_name=len(part_name), element_type=element_type)
+    input_file = pathlib.Path(input_file).with_suffix(".cub")
+    destination = pathlib.Path(destination)
+    genesis_options = {
+        "genesis": "set large exodus file on",
+        "genesis-normal": "set large exodus file off",
+        "genesis-hdf5": "set exodus netcdf4 on",
+    }
+    if output_type != "abaqus" and output_type.lower() not in genesis_options:
+        raise RuntimeError(f"Uknown output type request '{output_type}'")
+
+    journal.command("reset")
+    journal.command(f"open '{input_file}'")
+    block_ids = list(range(1, len(part_name) + 1))
+    for block_id, name, element in zip(block_ids, part_name, element_type, strict=True):
+        _volume_name_block(journal, block_id, name)
+        if output_type == "abaqus":
+            output_file = (destination / name).with_suffix(".inp")
+            journal.command(f"export abaqus '{output_file}' block {block_id} partial overwrite")
+            if element is not None:
+                journal.after.append(functools.partial(_mixed_utilities.substitute_element_type, output_file, element))
+        elif element is not None:
+            journal.command(f"block {block_id} element type {element}")
+    if output_type != "abaqus":
+        journal.command(genesis_options[output_type.lower()])
+        output_file = destination / input_file.with_suffix(".g").name
+        journal.command(f"export mesh '{output_file}' block {_utilities.character_delimited_list(block_ids)} overwrite")
+
+
+def image(
+    journal: Journal,
+    input_file: str | pathlib.Path,
+    output_file: str | pathlib.Path,
+    x_angle: float = parsers.image_defaults["x_angle"],  # type: ignore[assignment]
+    y_angle: float = parsers.image_defaults["y_angle"],  # type: ignore[assignment]
+    z_angle: float = parsers.image_defaults["z_angle"],  # type: ignore[assignment]
+    image_size: tuple[int, int] = parsers.image_defaults["image_size"],  # type: ignore[assignment]
+    views: typing.Sequence[tuple[str | float, str | float, str | float, str | pathlib.Path]] | None = (
+        parsers.image_defaults["views"]  # type: ignore[assignment]
+    ),
+) -> None:
+    """Compile :meth:`turbo_turtle._cubit_python.image`.
+
+    :param journal: Cubit journal to compile into
+    :param input_file: Cubit ``*.cub`` file to open that already contains parts/volumes
+    :param output_file: Screenshot file to write
+    :param x_angle: Rotation about 'world' X-axis in degrees
+    :param y_angle: Rotation about 'world' Y-axis in degrees
+    :param z_angle: Rotation about 'world' Z-axis in degrees
+    :param image_size: Image size in pixels (width, height)
+    :param views: Additional view tuples (x angle, y angle, z angle, output file)
+    """
+    input_file = pathlib.Path(input_file).with_suffix(".cub")
+    all_views = _utilities.image_views(x_angle, y_angle, z_angle, output_file, views)
+    journal.command("reset")
+    journal.command(f"open '{input_file}'")
+    journal.command(f"graphics windowsize {image_size[0]} {image_size[1]}")
+    for number, (view_x_angle, view_y_angle, view_z_angle, view_output_file) in enumerate(all_views):
+        if number > 0:
+            journal.command("view reset")
+        journal.command(f"rotate {view_x_angle} about world x")
+        journal.command(f"rotate {view_y_angle} about world y")
+        journal.command(f"rotate {view_z_angle} about world z")
+        journal.command(f"hardcopy '{view_output_file}' {view_output_file.suffix.strip('.')}")
@@ -0,0 +1,215 @@
+"""Unpack command-line argparse namespace into compiled Cubit journal files.
+
+The wrapper functions must have the API form
+
+.. code-block::
+
+   def wrapper(args: argparse.Namespace, command: str) -> None:
+       pass
+
+Each wrapper compiles one :mod:`turbo_turtle._cubit_journal` operation into a journal file named after the output file
+and executes the journal with a single ``cubit -batch`` process. Does not import Cubit.
+"""
+
+import argparse
+import pathlib
+
+from turbo_turtle import _cubit_journal
+
+
+def geometry(args: argparse.Namespace, command: str) -> None:
+    """Python 3 wrapper around Cubit journals calling :meth:`turbo_turtle._cubit_journal.geometry`.
+
+    Unpack the argument namespace into the full function interface
+
+    :param argparse.Namespace args: namespace of parsed arguments
+    :param str command: cubit executable path
+    """
+    journal = _cubit_journal.Journal()
+    _cubit_journal.geometry(
+        journal,
+        args.input_file,
+        args.output_file,
+        planar=args.planar,
+        part_name=args.part_name,
+        unit_conversion=args.unit_conversion,
+        euclidean_distance=args.euclidean_distance,
+        delimiter=args.delimiter,
+        header_lines=args.header_lines,
+        revolution_angle=args.revolution_angle,
+        y_offset=args.y_offset,
+        rtol=args.rtol,
+        atol=args.atol,
+    )
+    journal.run(pathlib.Path(args.output_file).with_suffix(".jou"), command)
+
+
+def cylinder(args: argparse.Namespace, command: str) -> None:
+    """Python 3 wrapper around Cubit journals calling :meth:`turbo_turtle._cubit_journal.cylinder`.
+
+    Unpack the argument namespace into the full function interface
+
+    :param argparse.Namespace args: namespace of parsed arguments
+    :param str command: cubit executable path
+    """
+    journal = _cubit_journal.Journal()
+    _cubit_journal.cylinder(
+        journal,
+        args.inner_radius,
+        args.outer_radius,
+        args.height,
+        args.output_file,
+        part_name=args.part_name,
+        revolution_angle=args.revolution_angle,
+        y_offset=args.y_offset,
+    )
+    journal.run(pathlib.Path(args.output_file).with_suffix(".jou"), command)
+
+
+def sphere(args: argparse.Namespace, command: str) -> None:
+    """Python 3 wrapper around Cubit journals calling :meth:`turbo_turtle._cubit_journal.sphere`.
+
+    Unpack the argument namespace into the full function interface
+
+    :param argparse.Namespace args: namespace of parsed arguments
+    :param str command: cubit executable path
+    """
+    journal = _cubit_journal.Journal()
+    _cubit_journal.sphere(
+        journal,
+        args.inner_radius,
+        args.outer_radius,
+        args.output_file,
+        input_file=args.input_file,
+        quadrant=args.quadrant,
+        revolution_angle=args.revolution_angle,
+        y_offset=args.y_offset,
+        part_name=args.part_name,
+    )
+    journal.run(pathlib.Path(args.output_file).with_suffix(".jou"), command)
+
+
+def partition(args: argparse.Namespace, command: str) -> None:
+    """Python 3 wrapper around Cubit journals calling :meth:`turbo_turtle._cubit_journal.partition`.
+
+    Unpack the argument namespace into the full function interface
+
+    :param argparse.Namespace args: namespace of parsed arguments
+    :param str command: cubit executable path
+    """
+    journal = _cubit_journal.Journal()
+    _cubit_journal.partition(
+        journal,
+        args.input_file,
+        output_file=args.output_file,
+        center=args.center,
+        xvector=args.xvector,
+        zvector=args.zvector,
+        part_name=args.part_name,
+        big_number=args.big_number,
+    )
+    output_file = args.output_file if args.output_file is not None else args.input_file
+    journal.run(pathlib.Path(output_file).with_suffix(".jou"), command)
+
+
+def sets(args: argparse.Namespace, command: str) -> None:
+    """Python 3 wrapper around Cubit journals calling :meth:`turbo_turtle._cubit_journal.sets`.
+
+    Unpack the argument namespace into the full function interface
+
+    :param argparse.Namespace args: namespace of parsed arguments
+    :param str command: cubit executable path
+    """
+    journal = _cubit_journal.Journal()
+    _cubit_journal.sets(
+        journal,
+        args.input_file,
+        output_file=args.output_file,
+        part_name=args.part_name,
+        face_sets=args.face_sets,
+        edge_sets=args.edge_sets,
+        vertex_sets=args.vertex_sets,
+    )
+    output_file = args.output_file if args.output_file is not None else args.input_file
+    journal.run(pathlib.Path(output_file).with_suffix(".jou"), command)
+
+
+def mesh(args: argparse.Namespace, command: str) -> None:
+    """Python 3 wrapper around Cubit journals calling :meth:`turbo_turtle._cubit_journal.mesh`.
+
+    Unpack the argument namespace into the full function interface
+
+    :param argparse.Namespace args: namespace of parsed arguments
+    :param str command: cubit executable path
+    """
+    journal = _cubit_journal.Journal()
+    _cubit_journal.mesh(
+        journal,
+        args.input_file,
+        args.element_type,
+        output_file=args.output_file,
+        part_name=args.part_name,
+        global_seed=args.global_seed,
+        edge_seeds=args.edge_seeds,
+    )
+    output_file = args.output_file if args.output_file is not None else args.input_file
+    journal.run(pathlib.Path(output_file).with_suffix(".jou"), command)
+
+
+def merge(args: argparse.Namespace, command: str) -> None:
+    """Python 3 wrapper around Cubit journals calling :meth:`turbo_turtle._cubit_journal.merge`.
+
+    Unpack the argument namespace into the full function interface
+
+    :param argparse.Namespace args: namespace of parsed arguments
+    :param str command: cubit executable path
+    """
+    journal = _cubit_journal.Journal()
+    _cubit_journal.merge(
+        journal,
+        args.input_file,
+        args.output_file,
+    )
+    journal.run(pathlib.Path(args.output_file).with_suffix(".jou"), command)
+
+
+def export(args: argparse.Namespace, command: str) -> None:
+    """Python 3 wrapper around Cubit journals calling :meth:`turbo_turtle._cubit_journal.export`.
+
+    Unpack the argument namespace into the full function interface
+
+    :param argparse.Namespace args: namespace of parsed arguments
+    :param str command: cubit executable path
+    """
+    journal = _cubit_journal.Journal()
+    _cubit_journal.export(
+        journal,
+        args.input_file,
+        part_name=args.part_name,
+        element_type=args.element_type,
+        destination=args.destination,
+        output_type=args.output_type,
+    )
+    journal.run(pathlib.Path(args.destination) / pathlib.Path(args.input_file).with_suffix(".jou").name, command)
+
+
+def image(args: argparse.Namespace, command: str) -> None:
+    """Python 3 wrapper around Cubit journals calling :meth:`turbo_turtle._cubit_journal.image`.
+
+    Unpack the argument namespace into the full function interface
+
+    :param argparse.Namespace args: namespace of parsed arguments
+    :param str command: cubit executable path
+    """
+    journal = _cubit_journal.Journal()
+    _cubit_journal.image(
+        journal,
+        args.input_file,
+        args.output_file,
+        x_angle=args.x_angle,
+        y_angle=args.y_angle,
+        z_angle=args.z_angle,
+        image_size=args.image_size,
+        views=args.views,
+    )
+    journal.run(pathlib.Path(args.output_file).with_suffix(".jou"), command)
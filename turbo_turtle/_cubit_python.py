@@ -6,7 +6,14 @@ perform ``sys.path`` manipulation, so the importing/calling module/script *must*
 first.
 """
 
+import bisect
+import concurrent.futures
+import contextlib
+import math
+import multiprocessing
+import os
 import pathlib
+import tempfile
 import typing
 
 import numpy
@@ -16,6 +23,112 @@ from turbo_turtle._abaqus_python.turbo_turtle_abaqus import _mixed_utilities, pa
 
 cubit = _utilities.import_cubit()
 
+_session = {"open": False}
+_set_batch_size = 1_000
+
+
+@contextlib.contextmanager
+def session() -> typing.Iterator[None]:
+    """Initialize Cubit once for every :mod:`turbo_turtle._cubit_python` function called in the context.
+
+    Each function call in the context starts from an empty model with the Cubit ``reset`` command instead of a new
+    ``cubit.init`` call.
+
+    .. code-block::
+
+       with _cubit_python.session():
+           _cubit_python.cylinder(1.0, 2.0, 1.0, "cylinder.cub")
+           _cubit_python.mesh("cylinder.cub", "HEX")
+
+    :raises RuntimeError: if a Cubit session is already open
+    """
+    if _session["open"]:
+        raise RuntimeError("A Cubit session is already open")
+    cubit.init(["cubit", "-nojournal"])
+    _session["open"] = True
+    try:
+        yield
+    finally:
+        _session["open"] = False
+        cubit.cmd("reset")
+
+
+def _initialize() -> None:
+    """Initialize Cubit for a single function call or reset the model of the open session.
+
+    See :meth:`turbo_turtle._cubit_python.session`.
+    """
+    _registries.clear()
+    if _session["open"]:
+        cubit_command_or_exception("reset")
+    else:
+        cubit.init(["cubit", "-nojournal"])
+
+
+class _EntityRegistry:
+    """Index Cubit entity IDs of one entity type by name for name prefix lookups.
+
+    The index is updated from the difference between the model and the indexed entity IDs before every lookup, so only
+    new entities are queried for their names. The index must be discarded when existing entities are renamed or the
+    model is replaced.
+
+    :param entity_type: Cubit entity type, e.g. "volume", "surface", "curve"
+    """
+
+    def __init__(self, entity_type: str) -> None:
+        self.entity_type = entity_type
+        self.names: dict[int, str] = {}
+        self.index: list[tuple[str, int]] = []
+
+    def update(self) -> None:
+        """Add new model entities to and remove deleted model entities from the index."""
+        entity_ids = set(cubit.get_entities(self.entity_type))
+        indexed_ids = set(self.names)
+        added = entity_ids - indexed_ids
+        removed = indexed_ids - entity_ids
+        if not added and not removed:
+            return
+        for entity_id in removed:
+            del self.names[entity_id]
+        for entity_id in added:
+            self.names[entity_id] = cubit.get_entity_name(self.entity_type, entity_id)
+        self.index = sorted((name, entity_id) for entity_id, name in self.names.items())
+
+    def ids(self, prefix: str) -> list[int]:
+        """Return the sorted IDs of all entities with a name starting with ``prefix``.
+
+        :param prefix: Entity name prefix
+
+        :returns: list of entity IDs
+        """
+        self.update()
+        entity_ids = []
+        for name, entity_id in self.index[bisect.bisect_left(self.index, (prefix,)) :]:
+            if not name.startswith(prefix):
+                break
+            entity_ids.append(entity_id)
+        return sorted(entity_ids)
+
+
+_registries: dict[str, _EntityRegistry] = {}
+
+
+def _entity_ids_from_name(entity_type: str, name: str) -> list[int]:
+    """Return the IDs of all entities of ``entity_type`` with a name prefix of ``name``.
+
+    Look up names in an incrementally updated :class:`turbo_turtle._cubit_python._EntityRegistry` instead of a
+    ``cubit.get_all_ids_from_name`` model search.
+
+    :param entity_type: Cubit entity type, e.g. "volume", "surface", "curve"
+    :param name: Entity name prefix
+
+    :returns: list of entity IDs
+    """
+    entity_type = entity_type.lower()
+    if entity_type not in _registries:
+        _registries[entity_type] = _EntityRegistry(entity_type)
+    return _registries[entity_type].ids(name)
+
 
 def cubit_command_or_exception(command: str) -> bool:
     """Thin wrapper around ``cubit.cmd`` to raise an exception when returning False.
@@ -80,7 +193,7 @@ def geometry(
     """
     # TODO: Figure out how to log the Cubit operations without printing to console
     # TODO: Figure out how to get a better log of the non-APREPRO actions
-    cubit.init(["cubit", "-nojournal"])
+    _initialize()
     part_name = _mixed_utilities.validate_part_name(input_file, part_name)
     part_name = _mixed_utilities.cubit_part_names(part_name)
     output_file = pathlib.Path(output_file).with_suffix(".cub")
@@ -112,16 +225,88 @@ def _draw_surface(  # noqa: ANN202
     :returns: Cubit surface defined by the lines and splines input
     :rtype: cubit.Surface
     """
-    curves = []
-    for first, second in lines:
-        point1 = (*tuple(first), 0.0)
-        point2 = (*tuple(second), 0.0)
-        curves.append(create_curve_from_coordinates(point1, point2))
+    lines_3d = [numpy.append(numpy.array(line), numpy.zeros([2, 1]), axis=1) for line in lines]
+    splines_3d = [numpy.append(numpy.array(spline), numpy.zeros([len(spline), 1]), axis=1) for spline in splines]
+    return cubit.create_surface(_create_curves(lines_3d, splines_3d))
+
+
+def _playback_new_ids(entity_type: str, commands: list[str]) -> list[int]:
+    """Execute Cubit commands with a single playback and return the IDs of the entities they created.
+
+    :param entity_type: Cubit entity type, e.g. ``vertex`` or ``curve``
+    :param commands: Cubit APREPRO commands to execute in order
+
+    :returns: sorted list of new entity IDs, which matches the creation order
+
+    :raises RuntimeError: if the playback fails
+    """
+    existing = set(cubit.get_entities(entity_type))
+    if not _playback(commands):
+        raise RuntimeError(f"Failed to create {entity_type} entities with a journal playback")
+    return sorted(set(cubit.get_entities(entity_type)) - existing)
+
+
+def _create_vertices(coordinates: numpy.ndarray, separate: numpy.ndarray | None = None) -> list[int]:
+    """Create one Cubit vertex per unique coordinate with a single journal playback.
+
+    :param coordinates: [N, 3] array of coordinates (x, y, z)
+    :param separate: [M, 3] array of coordinates (x, y, z) created with one vertex per row in the same playback
+
+    :returns: vertex ID of each coordinate row followed by the vertex ID of each separate row. Repeated coordinates
+        share a vertex ID.
+
+    :raises RuntimeError: if Cubit does not create one vertex per unique coordinate and separate row
+    """
+    separate = numpy.empty((0, 3)) if separate is None else separate
+    unique, inverse = numpy.unique(coordinates, axis=0, return_inverse=True)
+    commands = [f"create vertex {_utilities.character_delimited_list(point)}" for point in (*unique, *separate)]
+    vertex_ids = _playback_new_ids("vertex", commands)
+    if len(vertex_ids) != len(commands):
+        raise RuntimeError(f"Expected {len(commands)} new vertices, but Cubit created {len(vertex_ids)}")
+    return [vertex_ids[index] for index in inverse.reshape(-1)] + vertex_ids[len(unique) :]
+
+
+# Cannot use Cubit object type annotations because Cubit may not be importable at build/runtime
+def _create_curves(  # noqa: ANN202
+    lines: list[numpy.ndarray],
+    splines: list[numpy.ndarray],
+):
+    """Create line and spline curves with one vertex and one curve journal playback.
+
+    Each unique line coordinate is created once, so line end points share vertex IDs. Spline vertices are not shared
+    because the spline command deletes them after creating the spline.
+
+    :param lines: list of [2, 3] shaped arrays of (x, y, z) coordinates defining a line segment
+    :param splines: list of [N, 3] shaped arrays of (x, y, z) coordinates defining a spline
+
+    :returns: Cubit curve objects in the order of the lines followed by the splines
+    :rtype: list[cubit.Curve]
+
+    :raises RuntimeError: if a spline has fewer than two coordinates or Cubit does not create one curve per command
+    """
+    minimum = 2
+    if any(len(spline) < minimum for spline in splines):
+        raise RuntimeError(f"Requires at least {minimum} coordinates to create a spline")
+    if not lines and not splines:
+        return []
+    vertex_ids = _create_vertices(
+        numpy.concatenate(lines) if lines else numpy.empty((0, 3)),
+        separate=numpy.concatenate(splines) if splines else None,
+    )
+
+    commands = []
+    start = 0
+    for _line in lines:
+        commands.append(f"create curve vertex {vertex_ids[start]} {vertex_ids[start + 1]}")
+        start += 2
     for spline in splines:
-        zero_column = numpy.zeros([len(spline), 1])
-        spline_3d = numpy.append(numpy.array(spline), zero_column, axis=1)
-        curves.append(create_spline_from_coordinates(spline_3d))
-    return cubit.create_surface(curves)
+        vertex_ids_text = _utilities.character_delimited_list(vertex_ids[start : start + len(spline)])
+        commands.append(f"create curve spline vertex {vertex_ids_text} delete")
+        start += len(spline)
+    curve_ids = _playback_new_ids("curve", commands)
+    if len(curve_ids) != len(commands):
+        raise RuntimeError(f"Expected {len(commands)} new curves, but Cubit created {len(curve_ids)}")
+    return [cubit.curve(curve_id) for curve_id in curve_ids]
 
 
 # Cannot use Cubit object type annotations because Cubit may not be importable at build/runtime
@@ -218,12 +403,10 @@ def create_surface_from_coordinates(  # noqa: ANN202
     coordinates = numpy.array(coordinates)
     if coordinates.shape[0] < 3:
         raise RuntimeError("Requires at least 3 coordinates to create a surface")
-    curves = []
     last = numpy.array([coordinates[-1]])
     coordinates_shift = numpy.append(last, coordinates[0:-1], axis=0)
-    for point1, point2 in zip(coordinates, coordinates_shift, strict=True):
-        curves.append(create_curve_from_coordinates(point1, point2))
-    return cubit.create_surface(curves)
+    lines = [numpy.array([point1, point2]) for point1, point2 in zip(coordinates, coordinates_shift, strict=True)]
+    return cubit.create_surface(_create_curves(lines, []))
 
 
 def _surface_numbers(surfaces: typing.Sequence | numpy.ndarray) -> list[int]:
@@ -236,16 +419,16 @@ def _surface_numbers(surfaces: typing.Sequence | numpy.ndarray) -> list[int]:
     return [surface.surfaces()[0].id() for surface in surfaces]
 
 
-def _surface_centroids(surfaces: list) -> list[numpy.ndarray]:
-    """Return a list of 3D surface centroids from the provided list of surface objects.
+def _surface_centroids(surfaces: list) -> numpy.ndarray:
+    """Return the 3D surface centroids of the provided list of surface objects.
 
     :param surfaces: list of Cubit surface objects
 
-    :returns: list of surface centroids
+    :returns: [N, 3] array of surface centroids
     """
     surface_ids = _surface_numbers(surfaces)
-    surface_centroids = [numpy.array(cubit.get_surface_centroid(_id)) for _id in surface_ids]
-    return surface_centroids
+    surface_centroids = [cubit.get_surface_centroid(_id) for _id in surface_ids]
+    return numpy.array(surface_centroids, dtype=float).reshape(-1, 3)
 
 
 def _surfaces_for_volumes(volumes: list) -> list:
@@ -262,30 +445,29 @@ def _surfaces_for_volumes(volumes: list) -> list:
     return surfaces
 
 
-def _surfaces_by_vector(
+def _surfaces_by_vectors(
     surfaces: list,
-    principal_vector: numpy.ndarray,
+    principal_vectors: typing.Sequence[typing.Sequence[float]] | numpy.ndarray,
     center: tuple[float, float, float] | numpy.ndarray = (0.0, 0.0, 0.0),
-) -> numpy.ndarray:
-    """Return a flat list of Cubit surface objects that meet the requirement of a positive dot product between a given
-    vector and the vector between two points: a user provided center point and a surface object centroid.
+) -> list[numpy.ndarray]:
+    """Return one array of Cubit surface objects per principal vector that meet the requirement of a positive dot
+    product between the principal vector and the vector between two points: a user provided center point and a surface
+    object centroid.
+
+    The surface centroids are queried once and classified against every principal vector with a single matrix product.
 
     :param surfaces: list of Cubit surface objects
-    :param principal_vector: Local principal axis vector defined in global coordinates
+    :param principal_vectors: [M, 3] array of local principal axis vectors defined in global coordinates
     :param center: center location of the geometry
 
-    :returns: numpy.array of Cubit surface objects
+    :returns: list of M numpy.array of Cubit surface objects
     """  # noqa: D205
-    center = numpy.array(center)
-    surface_centroids = _surface_centroids(surfaces)
-    direction_vectors = [numpy.subtract(centroid, center) for centroid in surface_centroids]
-
-    vector_dot = numpy.array(
-        ([numpy.dot(direction_vector, principal_vector) for direction_vector in direction_vectors])
-    )
+    direction_vectors = _surface_centroids(surfaces) - numpy.array(center, dtype=float)
+    vector_dot = direction_vectors @ numpy.array(principal_vectors, dtype=float).T
     # Account for numerical errors in significant digits
     vector_dot[numpy.isclose(vector_dot, 0.0)] = 0.0
-    return numpy.array(surfaces)[numpy.where(vector_dot > 0.0)]
+    surfaces_array = numpy.array(surfaces, dtype=object)
+    return [surfaces_array[vector_dot[:, column] > 0.0] for column in range(vector_dot.shape[1])]
 
 
 # Cannot use Cubit object type annotations because Cubit may not be importable at build/runtime
@@ -351,13 +533,14 @@ def _rename_and_sweep(  # noqa: ANN202
         cubit_command_or_exception(f"regularize volume {volume_id}")
 
     return_object.set_entity_name(part_name)
+    _registries.pop("volume", None)
     return return_object
 
 
 def _get_volumes_from_name(names: list[str]) -> list:
     """Return all volume objects with a prefix from the ``names`` list.
 
-    :param names: Name(s) prefix to search for with ``cubit.get_all_ids_from_name``
+    :param names: Name(s) prefix to search for with :meth:`turbo_turtle._cubit_python._entity_ids_from_name`
 
     :returns: list of Cubit volumes with name prefix
     :rtype: list of cubit.Volume objects
@@ -366,7 +549,7 @@ def _get_volumes_from_name(names: list[str]) -> list:
         names = [names]
     parts = []
     for name in names:
-        parts.extend([cubit.volume(number) for number in cubit.get_all_ids_from_name("volume", name)])
+        parts.extend([cubit.volume(number) for number in _entity_ids_from_name("volume", name)])
     if len(parts) < 1:
         raise RuntimeError(f"Could not find any volumes with prefix '{name}'")
     return parts
@@ -393,7 +576,7 @@ def cylinder(
     :param revolution_angle: angle of solid revolution for ``3D`` geometries
     :param y_offset: vertical offset along the global Y-axis
     """
-    cubit.init(["cubit", "-nojournal"])
+    _initialize()
     part_name = _mixed_utilities.cubit_part_names(part_name)
     output_file = pathlib.Path(output_file).with_suffix(".cub")
 
@@ -425,7 +608,7 @@ def sphere(
     :param y_offset: vertical offset along the global Y-axis
     :param part_name: name of the part to be created in the Abaqus model
     """
-    cubit.init(["cubit", "-nojournal"])
+    _initialize()
 
     # Preserve the (X, Y) center implementation, but use the simpler y-offset interface
     center = (0.0, y_offset)
@@ -501,17 +684,24 @@ def _sphere(
     _rename_and_sweep(surface, part_name, revolution_angle=revolution_angle, center=center_3d)
 
 
-def imprint_and_merge(names: list[str]) -> None:
+def imprint_and_merge(names: list[str], independent: bool = False) -> None:
     """Imprint and merge all volume objects with a prefix from the ``names`` list.
 
-    :param names: Name(s) prefix to search for with ``cubit.get_all_ids_from_name``
-    """
-    parts = _get_volumes_from_name(names)
-    part_ids = [part.id() for part in parts]
-    part_string = _utilities.character_delimited_list(part_ids)
+    :param names: Name(s) prefix to search for with :meth:`turbo_turtle._cubit_python._entity_ids_from_name`
+    :param independent: Imprint and merge the volumes of each name prefix separately instead of all volumes together.
+        The commands for every name prefix are executed as a single journal file playback.
 
-    cubit_command_or_exception(f"imprint volume {part_string}")
-    cubit_command_or_exception(f"merge volume {part_string}")
+    :raises RuntimeError: if Cubit reports errors during the imprint or merge
+    """
+    groups = [[name] for name in names] if independent else [names]
+    commands = []
+    for group in groups:
+        parts = _get_volumes_from_name(group)
+        part_ids = [part.id() for part in parts]
+        part_string = _utilities.character_delimited_list(part_ids)
+        commands.extend([f"imprint volume {part_string}", f"merge volume {part_string}"])
+    if not _playback(commands):
+        raise RuntimeError("Imprint and merge returned an error. Please see the Cubit log for details.")
 
 
 def webcut_local_coordinate_primary_planes(
@@ -522,37 +712,22 @@ def webcut_local_coordinate_primary_planes(
 ) -> list:
     """Webcut all volumes with a prefix in the ``names`` list on the local coordinate system primary planes.
 
+    The planes are defined by their normal vector and the center point instead of construction surfaces. The webcuts
+    of every plane and name prefix are executed as a single journal file playback.
+
     :param center: center location of the geometry
     :param xvector: Local x-axis vector defined in global coordinates
     :param zvector: Local z-axis vector defined in global coordinates
-    :param names: Volume name prefix(es) to search for with ``cubit.get_all_ids_from_name``
+    :param names: Volume name prefix(es) to search for with :meth:`turbo_turtle._cubit_python._entity_ids_from_name`
 
     :returns: list of Cubit volumes with name prefix(es)
     :rtype: list of cubit.Volume objects
-    """
-    center = numpy.array(center)
-    xvector = numpy.array(xvector)
-    zvector = numpy.array(zvector)
-    yvector = numpy.cross(zvector, xvector)
-    # Create local coordinate system primary planes
-    surface_coordinates = [
-        numpy.array([center, center + xvector, center + yvector]),
-        numpy.array([center, center + yvector, center + zvector]),
-        numpy.array([center, center + zvector, center + xvector]),
-    ]
-    primary_surfaces = [create_surface_from_coordinates(coordinates) for coordinates in surface_coordinates]
-    primary_surface_numbers = _surface_numbers(primary_surfaces)
-    primary_surface_string = _utilities.character_delimited_list(primary_surface_numbers)
-
-    # Webcut with local coordinate system primary planes
-    for number in primary_surface_numbers:
-        parts = _get_volumes_from_name(names)
-        part_ids = [part.id() for part in parts]
-        part_string = _utilities.character_delimited_list(part_ids)
-        cubit_command_or_exception(f"webcut volume {part_string} with plane from surface {number}")
 
-    # Clean up primary surfaces
-    cubit_command_or_exception(f"delete surface {primary_surface_string}")
+    :raises RuntimeError: if Cubit reports errors during the webcuts
+    """
+    commands = _utilities.cubit_primary_plane_webcuts(center, xvector, zvector, names)
+    if not _playback(commands):
+        raise RuntimeError("Primary plane webcuts returned an error. Please see the Cubit log for details.")
 
     return _get_volumes_from_name(names)
 
@@ -583,14 +758,8 @@ def create_pyramid_volumes(
     pyramid_surfaces = [create_surface_from_coordinates(coordinates) for coordinates in surface_coordinates]
 
     # Identify surfaces for individual pyramid volumes based on location relative to local coordinate system
-    pyramid_volume_surfaces = [
-        _surfaces_by_vector(pyramid_surfaces, yvector, center),  # +Y
-        _surfaces_by_vector(pyramid_surfaces, -yvector, center),  # -Y
-        _surfaces_by_vector(pyramid_surfaces, xvector, center),  # +X
-        _surfaces_by_vector(pyramid_surfaces, -xvector, center),  # -X
-        _surfaces_by_vector(pyramid_surfaces, zvector, center),  # +Z
-        _surfaces_by_vector(pyramid_surfaces, -zvector, center),  # -Z
-    ]
+    principal_vectors = numpy.array([yvector, -yvector, xvector, -xvector, zvector, -zvector])  # +Y, -Y, +X, -X, +Z, -Z
+    pyramid_volume_surfaces = _surfaces_by_vectors(pyramid_surfaces, principal_vectors, center)
     pyramid_volumes = [_create_volume_from_surfaces(surface_list) for surface_list in pyramid_volume_surfaces]
 
     # Remove pyramidal construction surfaces
@@ -602,23 +771,71 @@ def create_pyramid_volumes(
     return pyramid_volumes
 
 
+def _bounding_boxes_overlap(
+    first: typing.Sequence[float], second: typing.Sequence[float], tolerance: float = 1.0e-6
+) -> bool:
+    """Return True if two axis aligned bounding boxes overlap.
+
+    :param first: Bounding box ``(xmin, ymin, zmin, xmax, ymax, zmax)``
+    :param second: Bounding box ``(xmin, ymin, zmin, xmax, ymax, zmax)``
+    :param tolerance: Absolute tolerance added to the box extents
+
+    :returns: True if the bounding boxes overlap, else False
+    """
+    first_array = numpy.array(first, dtype=float)
+    second_array = numpy.array(second, dtype=float)
+    return bool(
+        numpy.all(first_array[:3] <= second_array[3:] + tolerance)
+        and numpy.all(second_array[:3] <= first_array[3:] + tolerance)
+    )
+
+
+def _intersection_pairs(pyramids: list, parts: list, bounding_box_filter: bool = True) -> list[tuple[int, int]]:
+    """Return the (pyramid ID, part ID) pairs to intersect.
+
+    :param pyramids: list of Cubit pyramid volume objects
+    :param parts: list of Cubit part volume objects
+    :param bounding_box_filter: Skip pairs with non-overlapping bounding boxes
+
+    :returns: list of (pyramid ID, part ID) tuples ordered by pyramid
+    """
+    if not bounding_box_filter:
+        return [(pyramid.id(), part.id()) for pyramid in pyramids for part in parts]
+    part_boxes = [(part.id(), part.bounding_box()) for part in parts]
+    pairs: list[tuple[int, int]] = []
+    for pyramid in pyramids:
+        pyramid_box = pyramid.bounding_box()
+        pyramid_id = pyramid.id()
+        pairs.extend(
+            (pyramid_id, part_id) for part_id, part_box in part_boxes if _bounding_boxes_overlap(pyramid_box, part_box)
+        )
+    return pairs
+
+
 def create_pyramid_partitions(
     center: tuple[float, float, float] | numpy.ndarray,
     xvector: tuple[float, float, float] | numpy.ndarray,
     zvector: tuple[float, float, float] | numpy.ndarray,
     size: float,
     names: list[str],
+    bounding_box_filter: bool = True,
 ) -> list:
     """Partition all volumes with a prefix in the ``names`` list with the size pyramids defined by a cube.
 
+    The intersections of all pyramid and part pairs are executed as a single journal file playback and the original
+    parts are deleted with a single command.
+
     :param center: center location of the geometry
     :param xvector: Local x-axis vector defined in global coordinates
     :param zvector: Local z-axis vector defined in global coordinates
     :param size: Half-length of the cube diagonals (length of the pyramid tip to corner)
-    :param names: Volume name prefix(es) to search for with ``cubit.get_all_ids_from_name``
+    :param names: Volume name prefix(es) to search for with :meth:`turbo_turtle._cubit_python._entity_ids_from_name`
+    :param bounding_box_filter: Skip the intersection of pyramid and part pairs with non-overlapping bounding boxes
 
     :returns: list of Cubit volumes
     :rtype: list of cubit.Volume objects
+
+    :raises RuntimeError: if Cubit reports errors during the pyramid intersections
     """
     # Create pyramid partitioning (intersecting) volumes
     pyramid_volumes = create_pyramid_volumes(center, xvector, zvector, size)
@@ -627,12 +844,13 @@ def create_pyramid_partitions(
 
     # Create pyramidal intersections/partitions
     parts = _get_volumes_from_name(names)
-    for volume in pyramid_volumes:
-        volume_id = volume.id()
-        for part in parts:
-            cubit_command_or_exception(f"intersect volume {volume_id} with volume {part.id()} keep")
-    for part in parts:
-        cubit_command_or_exception(f"delete volume {part.id()}")
+    part_ids = [part.id() for part in parts]
+    pairs = _intersection_pairs(pyramid_volumes, parts, bounding_box_filter=bounding_box_filter)
+    commands = [f"intersect volume {pyramid_id} with volume {part_id} keep" for pyramid_id, part_id in pairs]
+    if commands and not _playback(commands):
+        raise RuntimeError("Pyramid intersections returned an error. Please see the Cubit log for details.")
+    if part_ids:
+        cubit_command_or_exception(f"delete volume {_utilities.character_delimited_list(part_ids)}")
 
     # Clean up pyramid volumes
     cubit_command_or_exception(f"delete volume {pyramid_volume_string}")
@@ -660,7 +878,7 @@ def partition(
     :param part_name: part/volume name prefixes
     :param big_number: Number larger than the outer radius of the part to partition.
     """  # noqa: D205
-    cubit.init(["cubit", "-nojournal"])
+    _initialize()
     part_name = _mixed_utilities.cubit_part_names(part_name)
 
     if output_file is None:
@@ -699,30 +917,111 @@ def _partition(
     # Webcut with local coordinate system primary planes
     webcut_local_coordinate_primary_planes(center, xvector, zvector, part_name)
 
-    # Imprint and merge
-    for current_part_name in part_name:
-        imprint_and_merge([current_part_name])
+    # Imprint and merge each part independently
+    imprint_and_merge(part_name, independent=True)
+
+
+def _playback(commands: typing.Iterable[str]) -> bool:
+    """Execute Cubit commands with a single playback of a temporary journal file.
+
+    :param commands: Cubit APREPRO commands to execute in order
+
+    :returns: True if the playback succeeded and Cubit reported no new errors, else False
+    """
+    error_count = cubit.get_error_count()
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        journal_path = pathlib.Path(temporary_directory) / "commands.jou"
+        journal_path.write_text("".join(f"{command}\n" for command in commands))
+        try:
+            success = cubit.cmd(f"playback '{journal_path}'")
+        # Cubit >=17 unknown commands raise a syntaxerror
+        except SyntaxError:
+            success = False
+    return bool(success) and cubit.get_error_count() == error_count
+
+
+def _set_commands(feature: str, name: str, mask: str | int, nodeset_id: int, sideset_id: int | None) -> list[str]:
+    """Return the Cubit commands to create a named feature with associated node and sideset.
+
+    :param feature: Cubit feature name
+    :param name: Feature, nodeset, and sideset name
+    :param mask: Feature ID string
+    :param nodeset_id: Nodeset ID to create
+    :param sideset_id: Sideset ID to create. No sideset is created when None.
+
+    :returns: list of Cubit APREPRO commands
+    """
+    commands = [
+        f'{feature} {mask} name "{name}"',
+        f"nodeset {nodeset_id} ADD {feature} {mask}",
+        f'nodeset {nodeset_id} name "{name}"',
+    ]
+    if sideset_id is not None:
+        commands.extend([f"sideset {sideset_id} ADD {feature} {mask}", f'sideset {sideset_id} name "{name}"'])
+    return commands
+
+
+def _set_error_message(
+    feature: str,
+    name_mask: typing.Sequence[tuple[str, str | int]],
+    nodeset_ids: typing.Sequence[int],
+    sideset_ids: typing.Sequence[int | None],
+) -> str:
+    """Return an error message naming the sets of a failed batch that were not created.
+
+    If every nodeset and sideset of the batch exists, all sets of the batch are reported.
+
+    :param feature: Cubit feature name
+    :param name_mask: Feature set tuples (name, ID string) of the failed batch
+    :param nodeset_ids: Pre-allocated nodeset IDs of the failed batch
+    :param sideset_ids: Pre-allocated sideset IDs of the failed batch. None when no sideset was requested.
+
+    :returns: error message
+    """
+    nodesets = set(cubit.get_nodeset_id_list())
+    sidesets = set(cubit.get_sideset_id_list())
+    failed = [
+        f"'{name}' ({feature} {mask})"
+        for (name, mask), nodeset_id, sideset_id in zip(name_mask, nodeset_ids, sideset_ids, strict=True)
+        if nodeset_id not in nodesets or (sideset_id is not None and sideset_id not in sidesets)
+    ]
+    if not failed:
+        failed = [f"'{name}' ({feature} {mask})" for name, mask in name_mask]
+    return f"Could not create {feature} set(s) {', '.join(failed)}. Please see the Cubit log for details."
 
 
 def _set_from_mask(feature: str, name_mask: typing.Sequence[tuple[str, str | int]]) -> None:
     """Create named features, with associated node and sidesets, by feature ID.
 
+    Nodeset and sideset IDs are allocated once for all sets. The set commands are executed as journal file playbacks of
+    up to ``_set_batch_size`` sets each.
+
     :param feature: Cubit feature name
     :param name_mask: Feature set tuples (name, ID string)
+
+    :raises RuntimeError: naming the sets that could not be created
     """
     feature = feature.lower()
-
-    for name, mask in name_mask:
-        cubit_command_or_exception(f'{feature} {mask} name "{name}"')
-
-        nodeset_id = cubit.get_next_nodeset_id()
-        cubit_command_or_exception(f"nodeset {nodeset_id} ADD {feature} {mask}")
-        cubit_command_or_exception(f'nodeset {nodeset_id} name "{name}"')
-
-        if feature not in ("vertex", "node"):
-            sideset_id = cubit.get_next_sideset_id()
-            cubit_command_or_exception(f"sideset {sideset_id} ADD {feature} {mask}")
-            cubit_command_or_exception(f'sideset {sideset_id} name "{name}"')
+    name_mask = list(name_mask)
+    nodeset_start = cubit.get_next_nodeset_id()
+    sideset_start = cubit.get_next_sideset_id() if feature not in ("vertex", "node") else None
+
+    for start in range(0, len(name_mask), _set_batch_size):
+        batch = name_mask[start : start + _set_batch_size]
+        nodeset_ids = list(range(nodeset_start + start, nodeset_start + start + len(batch)))
+        if sideset_start is not None:
+            sideset_ids: list[int | None] = list(range(sideset_start + start, sideset_start + start + len(batch)))
+        else:
+            sideset_ids = [None] * len(batch)
+        commands = [
+            command
+            for (name, mask), nodeset_id, sideset_id in zip(batch, nodeset_ids, sideset_ids, strict=True)
+            for command in _set_commands(feature, name, mask, nodeset_id, sideset_id)
+        ]
+        success = _playback(commands)
+        _registries.pop(feature, None)
+        if not success:
+            raise RuntimeError(_set_error_message(feature, batch, nodeset_ids, sideset_ids))
 
 
 def _feature_seeds(feature: str, name_number: typing.Sequence[tuple[str, str | int | float]]) -> None:
@@ -739,7 +1038,7 @@ def _feature_seeds(feature: str, name_number: typing.Sequence[tuple[str, str | i
     if not all(positive_numbers):
         raise ValueError("Feature seeds must be positive numbers")
     for name, number in zip(names, float_numbers, strict=True):
-        feature_ids = _utilities.character_delimited_list(cubit.get_all_ids_from_name(feature, name))
+        feature_ids = _utilities.character_delimited_list(_entity_ids_from_name(feature, name))
         if number.is_integer():
             cubit_command_or_exception(f"{feature} {feature_ids} interval {int(number)}")
         else:
@@ -784,7 +1083,7 @@ def sets(
     :param edge_sets: Edge set tuples (name, mask)
     :param vertex_sets: Vertex set tuples (name, mask)
     """
-    cubit.init(["cubit", "-nojournal"])
+    _initialize()
     part_name = _mixed_utilities.cubit_part_names(part_name)
 
     if not any([face_sets, edge_sets, vertex_sets]):
@@ -817,7 +1116,7 @@ def mesh(
     :param global_seed: The global mesh seed size
     :param edge_seeds: Edge seed tuples (name, number)
     """
-    cubit.init(["cubit", "-nojournal"])
+    _initialize()
     part_name = _mixed_utilities.cubit_part_names(part_name)
 
     if output_file is None:
@@ -830,66 +1129,61 @@ def mesh(
         cubit_command_or_exception(f"save as '{output_file}' overwrite")
 
 
-def _mesh_sheet_body(
-    # Cannot use Cubit object type annotations because Cubit may not be importable at build/runtime
-    volume,  # noqa: ANN001
-    global_seed: float,
-    element_type: str | None = None,
-) -> None:
-    """Mesh a volume that is a sheet body.
+def _mesh_sheet_bodies(volumes: list, global_seed: float, element_type: str | None = None) -> None:
+    """Mesh volumes that are sheet bodies with a single Cubit command set.
 
-    Assumes ``cubit.is_sheet_body(volume.id())`` is ``True``.
+    Assumes ``cubit.is_sheet_body(volume.id())`` is ``True`` for every volume.
 
-    :param cubit.Volume volume: Cubit volume to mesh as a sheet body
+    :param volumes: list of Cubit volume objects to mesh as sheet bodies
     :param global_seed: Seed size, e.g. ``cubit.cmd(surface {} size {global_seed}``
     :param element_type: Cubit meshing scheme. Accepts 'trimesh' or is ignored.
     """
-    # TODO: Process multiple sheet bodies with a single Cubit command set
-    # https://re-git.lanl.gov/aea/python-projects/turbo-turtle/-/issues/80
-    surface_objects = volume.surfaces()
-    surfaces = [surface.id() for surface in surface_objects]
+    surfaces = [surface.id() for volume in volumes for surface in volume.surfaces()]
+    if not surfaces:
+        return
     surface_string = _utilities.character_delimited_list(surfaces)
     if element_type == "trimesh":
         cubit_command_or_exception(f"surface {surface_string} scheme {element_type}")
     cubit_command_or_exception(f"surface {surface_string} size {global_seed}")
-    for surface in surface_objects:
-        surface.mesh()
+    cubit_command_or_exception(f"mesh surface {surface_string}")
 
 
-def _mesh_volume(
-    # Cannot use Cubit object type annotations because Cubit may not be importable at build/runtime
-    volume,  # noqa: ANN001
-    global_seed: float,
-    element_type: str | None = None,
-) -> None:
-    """Mesh a volume.
+def _mesh_volumes(volumes: list, global_seed: float, element_type: str | None = None) -> None:
+    """Mesh volumes with a single Cubit command set.
 
-    :param cubit.Volume volume: Cubit volume to mesh
+    :param volumes: list of Cubit volume objects to mesh
     :param global_seed: Seed size, e.g. ``cubit.cmd(volume {} size {global_seed}``
     :param element_type: Cubit meshing scheme. Accepts 'tetmesh' or is ignored.
     """
-    # TODO: Process multiple volumes with a single Cubit command set
-    # https://re-git.lanl.gov/aea/python-projects/turbo-turtle/-/issues/80
-    volume_id = volume.id()
+    if not volumes:
+        return
+    volume_string = _utilities.character_delimited_list(volume.id() for volume in volumes)
     if element_type == "tetmesh":
-        cubit_command_or_exception(f"volume {volume_id} scheme {element_type}")
-    cubit_command_or_exception(f"volume {volume_id} size {global_seed}")
-    volume.mesh()
+        cubit_command_or_exception(f"volume {volume_string} scheme {element_type}")
+    cubit_command_or_exception(f"volume {volume_string} size {global_seed}")
+    cubit_command_or_exception(f"mesh volume {volume_string}")
 
 
 def _mesh_multiple_volumes(volumes: list, global_seed: float, element_type: str | None = None) -> None:
     """Mesh ``cubit.Volume`` objects as volumes or sheet bodies.
 
+    Volumes are grouped by kind so that all sheet bodies and all volumes are each meshed with a single Cubit command
+    set.
+
     :param volumes: list of Cubit volume objects to mesh
+    :param global_seed: The global mesh seed size
+    :param element_type: Cubit meshing scheme. Accepts 'trimesh' for sheet bodies, 'tetmesh' for volumes, or is
+        ignored.
     """
-    # TODO: Process all sheet bodies and all volumes with a single Cubit command set
-    # https://re-git.lanl.gov/aea/python-projects/turbo-turtle/-/issues/80
+    sheet_bodies = []
+    solids = []
     for volume in volumes:
-        volume_id = volume.id()
-        if cubit.is_sheet_body(volume_id):
-            _mesh_sheet_body(volume, global_seed, element_type=element_type)
+        if cubit.is_sheet_body(volume.id()):
+            sheet_bodies.append(volume)
         else:
-            _mesh_volume(volume, global_seed, element_type=element_type)
+            solids.append(volume)
+    _mesh_sheet_bodies(sheet_bodies, global_seed, element_type=element_type)
+    _mesh_volumes(solids, global_seed, element_type=element_type)
 
 
 def _mesh(
@@ -914,20 +1208,101 @@ def _mesh(
     _mesh_multiple_volumes(parts, global_seed, element_type=element_type)
 
 
-def merge(input_file: typing.Sequence[str | pathlib.Path], output_file: str | pathlib.Path) -> None:
+def merge(
+    input_file: typing.Sequence[str | pathlib.Path],
+    output_file: str | pathlib.Path,
+    jobs: int | None = parsers.merge_defaults["jobs"],  # type: ignore[assignment]
+) -> None:
     """Merge Cubit ``*.cub`` files with forced unique block IDs and save to output file.
 
     :param input_file: List of Cubit ``*.cub`` file(s) to merge
     :param output_file: Cubit ``*.cub`` file to write
+    :param jobs: number of worker processes for a tree reduction merge. None merges every file in the calling process.
+        Zero uses the CPU count. See :meth:`turbo_turtle._cubit_python._merge_tree`.
     """
-    cubit.init(["cubit", "-nojournal"])
-    input_file = [pathlib.Path(path).with_suffix(".cub") for path in input_file]
+    cub_files = [pathlib.Path(path).with_suffix(".cub") for path in input_file]
     output_file = pathlib.Path(output_file).with_suffix(".cub")
+    max_workers = 1 if jobs is None else min(jobs or os.cpu_count() or 1, len(cub_files))
+    if max_workers > 1:
+        _merge_tree(cub_files, output_file, max_workers)
+        return
+
+    _initialize()
+    _import_and_save(cub_files, output_file)
+
+
+def _import_and_save(input_file: list[pathlib.Path], output_file: pathlib.Path) -> None:
+    """Import Cubit ``*.cub`` files with forced unique block IDs into the current model and save to output file.
+
+    :param input_file: List of Cubit ``*.cub`` file(s) to import
+    :param output_file: Cubit ``*.cub`` file to write
+    """
     for path in input_file:
         cubit_command_or_exception(f"import cubit '{path}' unique_genesis_ids")
     cubit_command_or_exception(f"save as '{output_file}' overwrite")
 
 
+def _merge_groups(input_file: list[pathlib.Path], max_workers: int) -> list[list[pathlib.Path]]:
+    """Split an ordered list of files into contiguous merge groups, at most one group per worker process.
+
+    :param input_file: List of Cubit ``*.cub`` file(s) to merge
+    :param max_workers: number of worker processes
+
+    :returns: contiguous groups of at least two files, except for a single trailing file
+    """
+    arity = max(2, math.ceil(len(input_file) / max_workers))
+    return [input_file[start : start + arity] for start in range(0, len(input_file), arity)]
+
+
+def _merge_tree(input_file: list[pathlib.Path], output_file: pathlib.Path, max_workers: int) -> None:
+    """Merge Cubit ``*.cub`` files in rounds of concurrent k-ary merges until a single file remains.
+
+    Each round merges contiguous groups of files in worker processes, so the number of rounds grows with the logarithm
+    of the number of input files. Every worker initializes a dedicated Cubit session, which checks out a Cubit license.
+    Every import forces unique block IDs and preserves the volume names. Intermediate files are written to a temporary
+    directory. Single file groups are carried over to the next round without a merge.
+
+    :param input_file: List of Cubit ``*.cub`` file(s) to merge
+    :param output_file: Cubit ``*.cub`` file to write
+    :param max_workers: number of worker processes
+    """
+    # Forked workers would inherit the Cubit state of the main process
+    context = multiprocessing.get_context("spawn")
+    with (
+        tempfile.TemporaryDirectory() as temporary_directory,
+        concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor,
+    ):
+        files = input_file
+        round_number = 0
+        while len(files) > 1:
+            groups = _merge_groups(files, max_workers)
+            if len(groups) == 1:
+                outputs = [output_file]
+            else:
+                outputs = [
+                    pathlib.Path(temporary_directory) / f"round{round_number}_group{number}.cub"
+                    if len(group) > 1
+                    else group[0]
+                    for number, group in enumerate(groups)
+                ]
+            merges = [(group, output) for group, output in zip(groups, outputs, strict=True) if len(group) > 1]
+            list(executor.map(_merge_worker, [group for group, _ in merges], [output for _, output in merges]))
+            files = outputs
+            round_number += 1
+
+
+def _merge_worker(input_file: list[pathlib.Path], output_file: pathlib.Path) -> None:
+    """Merge Cubit ``*.cub`` files in a dedicated Cubit session and save to output file.
+
+    Intended for worker processes. See :meth:`turbo_turtle._cubit_python._merge_tree`.
+
+    :param input_file: List of Cubit ``*.cub`` file(s) to merge
+    :param output_file: Cubit ``*.cub`` file to write
+    """
+    cubit.init(["cubit", "-nojournal"])
+    _import_and_save(input_file, output_file)
+
+
 def export(
     input_file: str | pathlib.Path,
     part_name: list[str] = parsers.export_defaults["part_name"],  # type: ignore[assignment]
@@ -936,6 +1311,7 @@ def export(
     output_type: typing.Literal["abaqus", "genesis", "genesis-normal", "genesis-hdf5"] = parsers.export_defaults[  # type: ignore[assignment]
         "output_type"
     ],
+    jobs: int = parsers.export_defaults["jobs"],  # type: ignore[assignment]
 ) -> None:
     """Open a Cubit ``*.cub`` file and export ``part_name`` prefixed volumes as ``part_name``.inp.
 
@@ -945,13 +1321,20 @@ def export(
     :param destination: write output orphan mesh files to this output directory
     :param output_type: String identifying genesis output type: abaqus, genesis (large format), genesis-normal,
         genesis-hdf5
+    :param jobs: number of worker processes for the abaqus output type. Zero uses the CPU count. One exports every
+        part in the calling process.
     """
-    cubit.init(["cubit", "-nojournal"])
     part_name = _mixed_utilities.cubit_part_names(part_name)
     element_type = _mixed_utilities.validate_element_type(length_part_name=len(part_name), element_type=element_type)
     input_file = pathlib.Path(input_file).with_suffix(".cub")
     destination = pathlib.Path(destination)
 
+    max_workers = min(jobs or os.cpu_count() or 1, len(part_name))
+    if output_type == "abaqus" and max_workers > 1:
+        _export_abaqus_parallel(input_file, part_name, element_type, destination, max_workers)
+        return
+
+    _initialize()
     cubit_command_or_exception(f"open '{input_file}'")
 
     if output_type == "abaqus":
@@ -1052,6 +1435,57 @@ def _export_abaqus_list(part_name: list[str], element_type: list[str | None], de
             _mixed_utilities.substitute_element_type(output_file, element)
 
 
+def _export_abaqus_parallel(
+    input_file: pathlib.Path,
+    part_name: list[str],
+    element_type: list[str | None],
+    destination: pathlib.Path,
+    max_workers: int,
+) -> None:
+    """Export one Abaqus orphan mesh per part from worker processes that each open the Cubit file.
+
+    Part names are distributed round-robin, so each worker exports a disjoint subset of the part names. Every worker
+    initializes a dedicated Cubit session, which checks out a Cubit license. The input file is never saved.
+
+    :param input_file: Cubit ``*.cub`` file to open that already contains meshed parts/volumes
+    :param part_name: list of part/volume names to create as blocks from all volumes with a matching prefix
+    :param element_type: List of element type strings
+    :param destination: Parent directory for orphan mesh files
+    :param max_workers: number of worker processes
+    """
+    part_subsets = [part_name[worker::max_workers] for worker in range(max_workers)]
+    element_subsets = [element_type[worker::max_workers] for worker in range(max_workers)]
+    # Forked workers would inherit the Cubit state of the main process
+    context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+        list(
+            executor.map(
+                _export_abaqus_worker,
+                [input_file] * max_workers,
+                part_subsets,
+                element_subsets,
+                [destination] * max_workers,
+            )
+        )
+
+
+def _export_abaqus_worker(
+    input_file: pathlib.Path, part_name: list[str], element_type: list[str | None], destination: pathlib.Path
+) -> None:
+    """Open a Cubit file in a dedicated Cubit session and export one Abaqus orphan mesh per part.
+
+    Intended for worker processes. See :meth:`turbo_turtle._cubit_python._export_abaqus_parallel`.
+
+    :param input_file: Cubit ``*.cub`` file to open that already contains meshed parts/volumes
+    :param part_name: list of part/volume names to create as blocks from all volumes with a matching prefix
+    :param element_type: List of element type strings
+    :param destination: Parent directory for orphan mesh files
+    """
+    cubit.init(["cubit", "-nojournal"])
+    cubit_command_or_exception(f"open '{input_file}'")
+    _export_abaqus_list(part_name, element_type, destination)
+
+
 def _export_abaqus(output_file: pathlib.Path, part_name: str) -> None:
     """Create a part-named block, add all volumes/surfaces with name prefix, export an Abaqus orphan mesh file.
 
@@ -1070,12 +1504,15 @@ def image(
     y_angle: float = parsers.image_defaults["y_angle"],  # type: ignore[assignment]
     z_angle: float = parsers.image_defaults["z_angle"],  # type: ignore[assignment]
     image_size: tuple[int, int] = parsers.image_defaults["image_size"],  # type: ignore[assignment]
+    views: typing.Sequence[tuple[str | float, str | float, str | float, str | pathlib.Path]] | None = (
+        parsers.image_defaults["views"]  # type: ignore[assignment]
+    ),
 ) -> None:
-    """Open a Cubit ``*.cub`` file and save an image.
+    """Open a Cubit ``*.cub`` file and save one image per view.
 
     Uses the Cubit APREPRO `hardcopy`_ command, which accepts jpg, gif, bmp, pnm, tiff, and eps file extensions. This
-    command only works in batch mode from Cubit APREPRO journal files, so an ``input_file``.jou is created for
-    execution.
+    command only works in batch mode from Cubit APREPRO journal files, so an ``output_file``.jou is created for
+    execution. The journal opens the input file once and resets the view before each additional view.
 
     :param str input_file: Cubit ``*.cub`` file to open that already contains parts/volumes to be meshed
     :param str output_file: Screenshot file to write
@@ -1083,19 +1520,23 @@ def image(
     :param float y_angle: Rotation about 'world' Y-axis in degrees
     :param float z_angle: Rotation about 'world' Z-axis in degrees
     :param tuple image_size: Image size in pixels (width, height)
+    :param views: Additional view tuples (x angle, y angle, z angle, output file)
     """
     input_file = pathlib.Path(input_file).with_suffix(".cub")
     output_file = pathlib.Path(output_file)
-    output_type = output_file.suffix.strip(".")
+    all_views = _utilities.image_views(x_angle, y_angle, z_angle, output_file, views)
 
     journal_path = output_file.with_suffix(".jou")
     with journal_path.open("w") as journal_file:
         journal_file.write(f"open '{input_file}'\n")
         journal_file.write(f"graphics windowsize {image_size[0]} {image_size[1]}\n")
-        journal_file.write(f"rotate {x_angle} about world x\n")
-        journal_file.write(f"rotate {y_angle} about world y\n")
-        journal_file.write(f"rotate {z_angle} about world z\n")
-        journal_file.write(f"hardcopy '{output_file}' {output_type}\n")
+        for number, (view_x_angle, view_y_angle, view_z_angle, view_output_file) in enumerate(all_views):
+            if number > 0:
+                journal_file.write("view reset\n")
+            journal_file.write(f"rotate {view_x_angle} about world x\n")
+            journal_file.write(f"rotate {view_y_angle} about world y\n")
+            journal_file.write(f"rotate {view_z_angle} about world z\n")
+            journal_file.write(f"hardcopy '{view_output_file}' {view_output_file.suffix.strip('.')}\n")
 
     command = f"{cubit_command} -batch {journal_path}"
     _utilities.run_command(command)
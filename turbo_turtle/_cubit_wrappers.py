@@ -148,6 +148,7 @@ def merge(args: argparse.Namespace, command: str) -> None:  # noqa: ARG001
     _cubit_python.merge(
         args.input_file,
         args.output_file,
+        jobs=args.jobs,
     )
 
 
@@ -165,6 +166,7 @@ def export(args: argparse.Namespace, command: str) -> None:  # noqa: ARG001
         element_type=args.element_type,
         destination=args.destination,
         output_type=args.output_type,
+        jobs=args.jobs,
     )
 
 
@@ -184,4 +186,5 @@ def image(args: argparse.Namespace, command: str) -> None:
         y_angle=args.y_angle,
         z_angle=args.z_angle,
         image_size=args.image_size,
+        views=args.views,
     )
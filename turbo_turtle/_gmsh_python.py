@@ -1,15 +1,246 @@
 """Python 3 module that imports python-gmsh."""
 
+import concurrent.futures
+import contextlib
+import logging
+import logging.handlers
+import math
+import multiprocessing
+import os
 import pathlib
+import sys
+import tempfile
+import time
 import typing
 
+import matplotlib.collections
+import matplotlib.figure
 import numpy
 
-from turbo_turtle import _utilities
+from turbo_turtle import _mesh_writers, _utilities
 from turbo_turtle._abaqus_python.turbo_turtle_abaqus import _mixed_utilities, parsers, vertices
 
 gmsh = _utilities.import_gmsh()
 
+_geometry_suffixes = (".step", ".brep", ".xao")
+_physical_group_suffixes = (".xao", ".step", ".brep")
+_mesh_suffixes = (".msh",)
+# Node count above which ``*.msh`` files are written in the binary MSH4 format
+_binary_mesh_nodes = 100_000
+
+_logger = logging.getLogger(__name__)
+_logger.addHandler(logging.NullHandler())
+_gmsh_verbosity = {"quiet": 2, "verbose": 99}
+_log_levels = {"quiet": logging.WARNING, None: logging.INFO, "verbose": logging.DEBUG}
+_message_levels = {
+    "Debug": logging.DEBUG,
+    "Info": logging.INFO,
+    "Progress": logging.INFO,
+    "Warning": logging.WARNING,
+    "Error": logging.ERROR,
+}
+_log_file_bytes = 10_000_000
+_log_file_backups = 3
+_session_options: dict[str, typing.Any] = {"verbosity": None, "log_file": None}
+
+
+@contextlib.contextmanager
+def session(
+    verbosity: typing.Literal["verbose", "quiet"] | None = parsers.mesh_defaults["verbosity"],  # type: ignore[assignment]
+    log_file: str | pathlib.Path | None = parsers.mesh_defaults["log_file"],  # type: ignore[assignment]
+) -> typing.Iterator[None]:
+    """Open a Gmsh session shared by every :mod:`turbo_turtle._gmsh_python` function called in the context.
+
+    Gmsh is initialized once and the logger is started once for the whole context. Each function call in the context
+    starts from an empty model and the default options, as if it had opened a dedicated session. Turbo-Turtle messages,
+    e.g. the meshing rate, are reported on STDERR for the whole context. See
+    :meth:`turbo_turtle._gmsh_python._stream_handler`.
+
+    .. code-block::
+
+       with _gmsh_python.session():
+           _gmsh_python.cylinder(1.0, 2.0, 1.0, "cylinder.step")
+           _gmsh_python.mesh("cylinder.step", "unused", output_file="cylinder.msh")
+
+    :param verbosity: Gmsh message verbosity. See :meth:`turbo_turtle._gmsh_python._set_verbosity`.
+    :param log_file: Gmsh rotating log file. See :meth:`turbo_turtle._gmsh_python._log_file_handler`.
+
+    :raises RuntimeError: if Gmsh is already initialized
+    """
+    if gmsh.isInitialized():
+        raise RuntimeError("Gmsh is already initialized")
+    gmsh.initialize()
+    _set_verbosity(verbosity)
+    _session_options.update({"verbosity": verbosity, "log_file": log_file})
+    gmsh.logger.start()
+    try:
+        with _stream_handler(verbosity), _log_file_handler(log_file, verbosity):
+            try:
+                yield
+            finally:
+                _drain_log()
+    finally:
+        _session_options.update({"verbosity": None, "log_file": None})
+        gmsh.logger.stop()
+        gmsh.finalize()
+
+
+@contextlib.contextmanager
+def _call_session(
+    verbosity: typing.Literal["verbose", "quiet"] | None = parsers.mesh_defaults["verbosity"],  # type: ignore[assignment]
+    log_file: str | pathlib.Path | None = parsers.mesh_defaults["log_file"],  # type: ignore[assignment]
+) -> typing.Iterator[None]:
+    """Open a dedicated Gmsh session for a single function call or reset the open session.
+
+    An open session is reset to the default options and the verbosity of the open session. The open session log file
+    keeps receiving messages. See :meth:`turbo_turtle._gmsh_python.session`.
+
+    :param verbosity: Gmsh message verbosity. See :meth:`turbo_turtle._gmsh_python._set_verbosity`. If None, use the
+        open session verbosity.
+    :param log_file: Gmsh rotating log file. See :meth:`turbo_turtle._gmsh_python._log_file_handler`. The open session
+        log file is not attached a second time.
+    """
+    if gmsh.isInitialized():
+        gmsh.clear()
+        gmsh.option.restoreDefaults()
+        if verbosity is None:
+            verbosity = _session_options["verbosity"]
+        session_log_file = _session_options["log_file"]
+        if (
+            log_file is not None
+            and session_log_file is not None
+            and pathlib.Path(log_file).resolve() == pathlib.Path(session_log_file).resolve()
+        ):
+            log_file = None
+        _set_verbosity(verbosity)
+        with _log_file_handler(log_file, verbosity):
+            try:
+                yield
+            finally:
+                _drain_log()
+    else:
+        with session(verbosity=verbosity, log_file=log_file):
+            yield
+
+
+def _set_verbosity(verbosity: typing.Literal["verbose", "quiet"] | None = None) -> None:
+    """Set the Gmsh terminal message verbosity.
+
+    :param verbosity: ``verbose`` reports debug messages and progress, ``quiet`` reports only warnings and errors.
+        None keeps the Gmsh default verbosity.
+
+    :raises RuntimeError: if the verbosity is not recognized
+    """
+    if verbosity is None:
+        return
+    if verbosity not in _gmsh_verbosity:
+        raise RuntimeError(f"Unknown Gmsh verbosity '{verbosity}'. Choose from: {list(_gmsh_verbosity.keys())}")
+    gmsh.option.setNumber("General.Verbosity", _gmsh_verbosity[verbosity])
+    gmsh.option.setNumber("General.Terminal", 1)
+
+
+@contextlib.contextmanager
+def _stream_handler(verbosity: typing.Literal["verbose", "quiet"] | None = None) -> typing.Iterator[None]:
+    """Attach a STDERR handler to the module logger for the duration of the context.
+
+    Forwarded Gmsh messages are not reported because Gmsh prints them to the terminal. See
+    :meth:`turbo_turtle._gmsh_python._drain_log`.
+
+    :param verbosity: message level filter. See :meth:`turbo_turtle._gmsh_python._set_verbosity`.
+    """
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setLevel(_log_levels[verbosity])
+    handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+    handler.addFilter(lambda record: not getattr(record, "gmsh", False))
+    _logger.addHandler(handler)
+    level = _logger.level
+    _logger.setLevel(min(_log_levels.values()))
+    try:
+        yield
+    finally:
+        _logger.setLevel(level)
+        _logger.removeHandler(handler)
+
+
+@contextlib.contextmanager
+def _log_file_handler(
+    log_file: str | pathlib.Path | None = None,
+    verbosity: typing.Literal["verbose", "quiet"] | None = None,
+) -> typing.Iterator[None]:
+    """Attach a rotating log file handler to the Gmsh message logger for the duration of the context.
+
+    :param log_file: Gmsh rotating log file. None does not write a log file.
+    :param verbosity: message level filter. See :meth:`turbo_turtle._gmsh_python._set_verbosity`.
+    """
+    if log_file is None:
+        yield
+        return
+    handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=_log_file_bytes, backupCount=_log_file_backups, encoding="utf-8"
+    )
+    handler.setLevel(_log_levels[verbosity])
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s: %(message)s"))
+    _logger.addHandler(handler)
+    level = _logger.level
+    _logger.setLevel(min(_log_levels.values()))
+    try:
+        yield
+    finally:
+        _logger.setLevel(level)
+        _logger.removeHandler(handler)
+        handler.close()
+
+
+def _drain_log() -> None:
+    """Forward the accumulated Gmsh logger messages to the module logger and empty the Gmsh logger.
+
+    The Gmsh logger keeps every message until it is stopped, so restarting the Gmsh logger after each stage keeps the
+    message memory bounded by the messages of a single stage.
+    """
+    messages = gmsh.logger.get()
+    gmsh.logger.stop()
+    gmsh.logger.start()
+    for message in messages:
+        level_name, _separator, text = message.partition(": ")
+        _logger.log(
+            _message_levels.get(level_name, logging.INFO), text if _separator else message, extra={"gmsh": True}
+        )
+
+
+def _file_with_suffix(path: str | pathlib.Path, suffixes: typing.Sequence[str] = _geometry_suffixes) -> pathlib.Path:
+    """Return the path with a supported Gmsh file extension.
+
+    Paths with an unsupported extension use the first supported extension, e.g. ``.step`` for geometry files.
+
+    :param path: file path
+    :param suffixes: supported file extensions. The first extension is the default.
+
+    :returns: file path with a supported file extension
+    """
+    path = pathlib.Path(path)
+    if path.suffix.lower() in suffixes:
+        return path
+    return path.with_suffix(suffixes[0])
+
+
+def _write(output_file: str | pathlib.Path) -> None:
+    """Write the current Gmsh model with the file format selected by the output file extension.
+
+    Only ``*.xao`` geometry files preserve physical groups. ``*.msh`` files are written in the binary MSH4 format when
+    the mesh has more than :attr:`turbo_turtle._gmsh_python._binary_mesh_nodes` nodes.
+
+    :param output_file: Gmsh geometry or mesh file to write
+    """
+    _drain_log()
+    output_file = pathlib.Path(output_file)
+    if output_file.suffix.lower() == ".msh":
+        number_of_nodes = len(gmsh.model.mesh.getNodes()[0])
+        gmsh.option.setNumber("Mesh.MshFileVersion", 4.1)
+        gmsh.option.setNumber("Mesh.Binary", int(number_of_nodes > _binary_mesh_nodes))
+    # FIXME: Write physical groups to STEP and BRep geometry output files
+    # https://re-git.lanl.gov/aea/python-projects/turbo-turtle/-/issues/221
+    gmsh.write(str(output_file))
+
 
 def geometry(
     input_file: typing.Sequence[str | pathlib.Path],
@@ -31,11 +262,11 @@ def geometry(
     Note that 2D axisymmetric sketches and sketches for 3D bodies of revolution about the global Y-axis must lie
     entirely on the positive-X side of the global Y-axis.
 
-    This function can create multiple surfaces or volumes in the same Gmsh ``*.step`` file. If no part (body/volume)
+    This function can create multiple surfaces or volumes in the same Gmsh geometry file. If no part (body/volume)
     names are provided, the body/volume will be named after the input file base name.
 
     :param input_file: input text file(s) with coordinates to draw
-    :param output_file: Gmsh ``*.step`` database to save the part(s)
+    :param output_file: Gmsh ``*.step``, ``*.brep``, or ``*.xao`` file to save the part(s)
     :param planar: switch to indicate that 2D model dimensionality is planar, not axisymmetric
     :param model_name: name of the Gmsh model in which to create the part
     :param part_name: name(s) of the part(s) being created
@@ -50,41 +281,35 @@ def geometry(
     :param rtol: relative tolerance for vertical/horizontal line checks
     :param atol: absolute tolerance for vertical/horizontal line checks
 
-    :returns: writes ``{output_file}.step``
+    :returns: writes ``{output_file}``. Unsupported extensions are replaced by ``.step``
     """
-    # Universally required setup
-    gmsh.initialize()
-    gmsh.logger.start()
+    with _call_session():
+        # Input/Output setup
+        output_file = _file_with_suffix(output_file)
 
-    # Input/Output setup
-    # TODO: allow other output formats supported by Gmsh
-    output_file = pathlib.Path(output_file).with_suffix(".step")
-
-    # Model setup
-    gmsh.model.add(model_name)
-    part_name = _mixed_utilities.validate_part_name(input_file, part_name)
-    part_name = _mixed_utilities.cubit_part_names(part_name)
-
-    # Create part(s)
-    surfaces = []
-    for file_name, _new_part in zip(input_file, part_name, strict=True):
-        coordinates = _mixed_utilities.return_genfromtxt(
-            file_name, delimiter, header_lines, expected_dimensions=2, expected_columns=2
-        )
-        coordinates = vertices.scale_and_offset_coordinates(coordinates, unit_conversion, y_offset)
-        lines_and_splines = vertices.ordered_lines_and_splines(coordinates, euclidean_distance, rtol=rtol, atol=atol)
-        surfaces.append(_draw_surface(lines_and_splines))
+        # Model setup
+        gmsh.model.add(model_name)
+        part_name = _mixed_utilities.validate_part_name(input_file, part_name)
+        part_name = _mixed_utilities.cubit_part_names(part_name)
+
+        # Create part(s)
+        surfaces = []
+        for file_name, _new_part in zip(input_file, part_name, strict=True):
+            coordinates = _mixed_utilities.return_genfromtxt(
+                file_name, delimiter, header_lines, expected_dimensions=2, expected_columns=2
+            )
+            coordinates = vertices.scale_and_offset_coordinates(coordinates, unit_conversion, y_offset)
+            lines_and_splines = vertices.ordered_lines_and_splines(
+                coordinates, euclidean_distance, rtol=rtol, atol=atol
+            )
+            surfaces.append(_draw_surface(lines_and_splines))
 
-    # Conditionally create the 3D revolved shape
-    for surface, new_part in zip(surfaces, part_name, strict=True):
-        _rename_and_sweep(surface, new_part, planar=planar, revolution_angle=revolution_angle)
+        # Conditionally create the 3D revolved shape
+        for surface, new_part in zip(surfaces, part_name, strict=True):
+            _rename_and_sweep(surface, new_part, planar=planar, revolution_angle=revolution_angle)
 
-    # Output and cleanup
-    # FIXME: Write physical groups to geometry output files
-    # https://re-git.lanl.gov/aea/python-projects/turbo-turtle/-/issues/221
-    gmsh.write(str(output_file))
-    gmsh.logger.stop()
-    gmsh.finalize()
+        # Output
+        _write(output_file)
 
 
 def _draw_surface(lines_and_splines: list[numpy.ndarray]) -> int:
@@ -173,10 +398,11 @@ def _rename_and_sweep(
             *revolution_axis,
             numpy.radians(revolution_angle),
         )
-        dim_tag = dimTags[0]
+        # Gmsh returns the top surface first, followed by the revolved volume and the lateral surfaces
+        dim_tag = next(dim_tag for dim_tag in dimTags if dim_tag[0] == 3)
 
     part_dimension = dim_tag[0]
-    part_tag = dim_tag[0]
+    part_tag = dim_tag[1]
     part_name = _mixed_utilities.cubit_part_names(part_name)
     gmsh.model.occ.synchronize()
     part_tag = gmsh.model.addPhysicalGroup(part_dimension, [part_tag], name=part_name)
@@ -201,34 +427,26 @@ def cylinder(
     :param inner_radius: Radius of the hollow center
     :param outer_radius: Outer radius of the cylinder
     :param height: Height of the cylinder
-    :param output_file: Gmsh ``*.step`` file to save the part(s)
+    :param output_file: Gmsh ``*.step``, ``*.brep``, or ``*.xao`` file to save the part(s)
     :param model_name: name of the Gmsh model in which to create the part
     :param part_name: name(s) of the part(s) being created
     :param revolution_angle: angle of solid revolution for ``3D`` geometries
     :param y_offset: vertical offset along the global Y-axis
     """
-    # Universally required setup
-    gmsh.initialize()
-    gmsh.logger.start()
-
-    # Input/Output setup
-    # TODO: allow other output formats supported by Gmsh
-    output_file = pathlib.Path(output_file).with_suffix(".step")
-    gmsh.model.add(model_name)
+    with _call_session():
+        # Input/Output setup
+        output_file = _file_with_suffix(output_file)
+        gmsh.model.add(model_name)
 
-    # Create the 2D axisymmetric shape
-    lines = vertices.cylinder_lines(inner_radius, outer_radius, height, y_offset=y_offset)
-    surface_tag = _draw_surface(lines)
+        # Create the 2D axisymmetric shape
+        lines = vertices.cylinder_lines(inner_radius, outer_radius, height, y_offset=y_offset)
+        surface_tag = _draw_surface(lines)
 
-    # Conditionally create the 3D revolved shape
-    _rename_and_sweep(surface_tag, part_name, revolution_angle=revolution_angle)
+        # Conditionally create the 3D revolved shape
+        _rename_and_sweep(surface_tag, part_name, revolution_angle=revolution_angle)
 
-    # Output and cleanup
-    # FIXME: Write physical groups to geometry output files
-    # https://re-git.lanl.gov/aea/python-projects/turbo-turtle/-/issues/221
-    gmsh.write(str(output_file))
-    gmsh.logger.stop()
-    gmsh.finalize()
+        # Output
+        _write(output_file)
 
 
 def sphere(
@@ -246,32 +464,38 @@ def sphere(
 
     :param inner_radius: inner radius (size of hollow)
     :param outer_radius: outer radius (size of sphere)
-    :param output_file: output file name. Will be stripped of the extension and ``.step`` will be used.
-    :param input_file: input file name. Will be stripped of the extension and ``.step`` will be used.
+    :param output_file: output file name. Unsupported extensions are replaced by ``.step``.
+    :param input_file: input file name. Unsupported extensions are replaced by ``.step``.
     :param quadrant: quadrant of XY plane for the sketch: upper (I), lower (IV), both
     :param revolution_angle: angle of rotation 0.-360.0 degrees. Provide 0 for a 2D axisymmetric model.
     :param y_offset: vertical offset along the global Y-axis
     :param model_name: name of the Gmsh model in which to create the part
     :param part_name: name of the part to be created in the Abaqus model
     """
-    # Universally required setup
-    gmsh.initialize()
-    gmsh.logger.start()
-
-    # Input/Output setup
-    # TODO: allow other output formats supported by Gmsh
-    output_file = pathlib.Path(output_file).with_suffix(".step")
-
-    # Preserve the (X, Y) center implementation, but use the simpler y-offset interface
-    center = (0.0, y_offset)
-
-    if input_file is not None:
-        # TODO: allow other input formats supported by Gmsh
-        input_file = pathlib.Path(input_file).with_suffix(".step")
-        # Avoid modifying the contents or timestamp on the input file.
-        # Required to get conditional re-builds with a build system such as GNU Make, CMake, or SCons
-        with _utilities.NamedTemporaryFileCopy(input_file, suffix=".step", dir=".") as copy_file:
-            gmsh.open(copy_file.name)
+    with _call_session():
+        # Input/Output setup
+        output_file = _file_with_suffix(output_file)
+
+        # Preserve the (X, Y) center implementation, but use the simpler y-offset interface
+        center = (0.0, y_offset)
+
+        if input_file is not None:
+            input_file = _file_with_suffix(input_file)
+            # Avoid modifying the contents or timestamp on the input file.
+            # Required to get conditional re-builds with a build system such as GNU Make, CMake, or SCons
+            with _utilities.NamedTemporaryFileCopy(input_file, suffix=input_file.suffix, dir=".") as copy_file:
+                gmsh.open(copy_file.name)
+                _sphere(
+                    inner_radius,
+                    outer_radius,
+                    quadrant=quadrant,
+                    revolution_angle=revolution_angle,
+                    center=center,
+                    part_name=part_name,
+                )
+                _write(output_file)
+        else:
+            gmsh.model.add(model_name)
             _sphere(
                 inner_radius,
                 outer_radius,
@@ -280,26 +504,7 @@ def sphere(
                 center=center,
                 part_name=part_name,
             )
-            # FIXME: Write physical groups to geometry output files
-            # https://re-git.lanl.gov/aea/python-projects/turbo-turtle/-/issues/221
-            gmsh.write(str(output_file))
-    else:
-        gmsh.model.add(model_name)
-        _sphere(
-            inner_radius,
-            outer_radius,
-            quadrant=quadrant,
-            revolution_angle=revolution_angle,
-            center=center,
-            part_name=part_name,
-        )
-        # FIXME: Write physical groups to geometry output files
-        # https://re-git.lanl.gov/aea/python-projects/turbo-turtle/-/issues/221
-        gmsh.write(str(output_file))
-
-    # Output and cleanup
-    gmsh.logger.stop()
-    gmsh.finalize()
+            _write(output_file)
 
 
 def _sphere(
@@ -366,15 +571,388 @@ def _create_arc_from_coordinates(
     return gmsh.model.occ.addCircleArc(point1_tag, center_tag, point2_tag, center=True)
 
 
-# TODO: Remove ``noqa: ARG001`` when this function is implemented.
-# https://re-git.lanl.gov/aea/python-projects/turbo-turtle/-/issues/212
-def partition(*args, **kwargs) -> typing.NoReturn:  # noqa: ARG001
-    raise RuntimeError("partition subcommand is not yet implemented")
+def partition(
+    input_file: str | pathlib.Path,
+    output_file: str | pathlib.Path | None = parsers.partition_defaults["output_file"],  # type: ignore[assignment]
+    center: tuple[float, float, float] | numpy.ndarray = parsers.partition_defaults["center"],  # type: ignore[assignment]
+    xvector: tuple[float, float, float] | numpy.ndarray = parsers.partition_defaults["xvector"],  # type: ignore[assignment]
+    zvector: tuple[float, float, float] | numpy.ndarray = parsers.partition_defaults["zvector"],  # type: ignore[assignment]
+    part_name: list[str] = parsers.partition_defaults["part_name"],  # type: ignore[assignment]
+    big_number: float = parsers.partition_defaults["big_number"],  # type: ignore[assignment]
+) -> None:
+    """Partition Gmsh files with the local coordinate planes and the pyramid surfaces defined by a cube's center and
+    vertices.
+
+    :param input_file: Gmsh ``*.step``, ``*.brep``, or ``*.xao`` file to open that already contains parts/volumes to
+        be partitioned
+    :param output_file: Gmsh ``*.step``, ``*.brep``, or ``*.xao`` file to write. If none is provided, use the input
+        file.
+    :param center: center location of the geometry
+    :param xvector: Local x-axis vector defined in global coordinates
+    :param zvector: Local z-axis vector defined in global coordinates
+    :param part_name: physical group or entity name prefixes
+    :param big_number: Number larger than the outer radius of the part to partition.
+    """  # noqa: D205
+    with _call_session():
+        # Input/Output setup
+        if output_file is None:
+            output_file = input_file
+        input_file = _file_with_suffix(input_file)
+        output_file = _file_with_suffix(output_file)
+
+        with _utilities.NamedTemporaryFileCopy(input_file, suffix=input_file.suffix, dir=".") as copy_file:
+            gmsh.open(copy_file.name)
+            _partition(center, xvector, zvector, part_name, big_number)
+            _write(output_file)
+
+
+def _partition(
+    center: tuple[float, float, float] | numpy.ndarray = parsers.partition_defaults["center"],  # type: ignore[assignment]
+    xvector: tuple[float, float, float] | numpy.ndarray = parsers.partition_defaults["xvector"],  # type: ignore[assignment]
+    zvector: tuple[float, float, float] | numpy.ndarray = parsers.partition_defaults["zvector"],  # type: ignore[assignment]
+    part_name: list[str] = parsers.partition_defaults["part_name"],  # type: ignore[assignment]
+    big_number: float = parsers.partition_defaults["big_number"],  # type: ignore[assignment]
+) -> list[tuple[int, int]]:
+    """Partition Gmsh parts with a single boolean fragment operation.
+
+    All parts are fragmented in one operation against the three local coordinate planes and the twelve triangular
+    pyramid side surfaces. The fragment operation also makes the part interfaces conformal, so no separate imprint and
+    merge is required. Tool surface pieces outside of the parts are removed and the part physical groups are recreated
+    from the fragmented entities.
+
+    :param center: center location of the geometry
+    :param xvector: Local x-axis vector defined in global coordinates
+    :param zvector: Local z-axis vector defined in global coordinates
+    :param part_name: physical group or entity name prefixes
+    :param big_number: Number larger than the outer radius of the part to partition.
+
+    :returns: sorted list of the partitioned part Gmsh dimTags (dimension, tag)
+    """
+    part_name = _mixed_utilities.cubit_part_names(part_name)
+    dim_tags = sorted({dim_tag for name in part_name for dim_tag in _part_entities(name, fallback=True)})
+    dimension = max(dim_tag[0] for dim_tag in dim_tags)
+    dim_tags = [dim_tag for dim_tag in dim_tags if dim_tag[0] == dimension]
+
+    physical_groups = [
+        (
+            group_dimension,
+            group_tag,
+            gmsh.model.getPhysicalName(group_dimension, group_tag),
+            [int(tag) for tag in gmsh.model.getEntitiesForPhysicalGroup(group_dimension, group_tag)],
+        )
+        for group_dimension, group_tag in gmsh.model.getPhysicalGroups()
+    ]
+
+    tool_coordinates = _partition_tool_coordinates(center, xvector, zvector, big_number, planar=dimension < 3)
+    tools = [(2, _create_surface_from_coordinates(coordinates)) for coordinates in tool_coordinates]
+
+    # Single boolean operation for all parts and tools
+    touched = _entity_closure(dim_tags)
+    _out_dim_tags, out_dim_tags_map = gmsh.model.occ.fragment(dim_tags, tools)
+    part_map = dict(zip(dim_tags, out_dim_tags_map[: len(dim_tags)], strict=True))
+    part_pieces = {tuple(child) for children in part_map.values() for child in children}
+    tool_pieces = {tuple(child) for children in out_dim_tags_map[len(dim_tags) :] for child in children}
+    gmsh.model.occ.remove(sorted(tool_pieces - part_pieces), recursive=True)
+    gmsh.model.occ.synchronize()
+
+    _restore_physical_groups(physical_groups, part_map, touched)
+
+    return sorted(part_pieces)
+
+
+def _partition_tool_coordinates(
+    center: tuple[float, float, float] | numpy.ndarray,
+    xvector: tuple[float, float, float] | numpy.ndarray,
+    zvector: tuple[float, float, float] | numpy.ndarray,
+    big_number: float,
+    planar: bool = False,
+) -> list[numpy.ndarray]:
+    """Return the partitioning tool surface coordinates of the local coordinate planes and the pyramid side surfaces.
+
+    The outer square faces of the pyramids lie outside of the part and are not required as partitioning tools. For
+    planar and axisymmetric parts, tool surfaces coplanar with the global XY plane are excluded.
+
+    :param center: center location of the geometry
+    :param xvector: Local x-axis vector defined in global coordinates
+    :param zvector: Local z-axis vector defined in global coordinates
+    :param big_number: Number larger than the outer radius of the part to partition.
+    :param planar: switch to exclude tool surfaces coplanar with the global XY plane
+
+    :returns: list of [N, 3] surface coordinate arrays. Three square local coordinate planes followed by twelve
+        triangular pyramid surfaces.
+    """
+    origin = numpy.array(center, dtype=float)
+    pyramid_surfaces = vertices.pyramid_surfaces(origin, xvector, zvector, big_number)
+    x_axis = numpy.array(vertices.normalize_vector(xvector), dtype=float)
+    z_axis = numpy.array(vertices.normalize_vector(zvector), dtype=float)
+    y_axis = numpy.cross(z_axis, x_axis)
+
+    surfaces = [
+        numpy.array(
+            [
+                origin + big_number * (first + second),
+                origin + big_number * (-first + second),
+                origin + big_number * (-first - second),
+                origin + big_number * (first - second),
+            ]
+        )
+        for first, second in ((x_axis, y_axis), (y_axis, z_axis), (z_axis, x_axis))
+    ]
+    surfaces.extend(pyramid_surfaces[0:12])
+
+    if planar:
+        global_zvector = numpy.array([0.0, 0.0, 1.0])
+        surfaces = [
+            surface
+            for surface in surfaces
+            if not numpy.allclose(
+                numpy.cross(numpy.cross(surface[1] - surface[0], surface[2] - surface[0]), global_zvector), 0.0
+            )
+        ]
+
+    return surfaces
+
+
+def _create_surface_from_coordinates(coordinates: numpy.ndarray) -> int:
+    """Create a Gmsh plane surface from a closed polygon of coordinates.
+
+    :param coordinates: [N, 3] array of polygon vertex coordinates
+
+    :returns: Gmsh surface tag
+    """
+    points = [gmsh.model.occ.addPoint(*tuple(point)) for point in coordinates]
+    lines = [gmsh.model.occ.addLine(start, end) for start, end in zip(points, points[1:] + points[:1], strict=True)]
+    curve_loop = gmsh.model.occ.addCurveLoop(lines)
+    return gmsh.model.occ.addPlaneSurface([curve_loop])
+
+
+def _entity_closure(dim_tags: typing.Sequence[tuple[int, int]]) -> set[tuple[int, int]]:
+    """Return the Gmsh dimTags of the entities and all of their lower dimension boundary entities.
+
+    :param dim_tags: Gmsh dimTags (dimension, tag)
+
+    :returns: set of Gmsh dimTags (dimension, tag)
+    """
+    closure = set(dim_tags)
+    boundary = [dim_tag for dim_tag in dim_tags if dim_tag[0] > 0]
+    while boundary:
+        children = {
+            (int(dimension), abs(int(tag)))
+            for dimension, tag in gmsh.model.getBoundary(boundary, combined=False, oriented=False)
+        }
+        boundary = sorted(dim_tag for dim_tag in children - closure if dim_tag[0] > 0)
+        closure |= children
+    return closure
+
+
+def _restore_physical_groups(
+    physical_groups: typing.Sequence[tuple[int, int, str, list[int]]],
+    dim_tags_map: dict[tuple[int, int], list[tuple[int, int]]],
+    touched: typing.Collection[tuple[int, int]] = (),
+) -> None:
+    """Recreate physical groups after a boolean operation.
 
+    Entities found in the boolean operation map are replaced by their child entities. Entities touched by the boolean
+    operation, but missing from the map, may be renumbered and are dropped. Entities no longer found in the model are
+    dropped. Physical groups without any remaining entities are not recreated. Physical group tags and names are
+    preserved.
 
-# TODO: Remove ``noqa: ARG001`` when this function is implemented.
-def sets(*args, **kwargs) -> typing.NoReturn:  # noqa: ARG001
-    raise RuntimeError("sets subcommand is not yet implemented")
+    :param physical_groups: physical group tuples (dimension, physical tag, name, entity tags)
+    :param dim_tags_map: map from the original Gmsh dimTags to the resulting child dimTags
+    :param touched: original Gmsh dimTags modified by the boolean operation
+    """
+    gmsh.model.removePhysicalGroups()
+    # Gmsh keeps the removed group names, which prevents re-using the names for new groups
+    for _dimension, _physical_tag, name, _tags in physical_groups:
+        gmsh.model.removePhysicalName(name)
+    for dimension, physical_tag, name, tags in physical_groups:
+        existing = {tag for _dimension, tag in gmsh.model.getEntities(dimension)}
+        new_tags: set[int] = set()
+        for tag in tags:
+            if (dimension, tag) in dim_tags_map:
+                children = dim_tags_map[(dimension, tag)]
+                new_tags.update(child_tag for child_dimension, child_tag in children if child_dimension == dimension)
+            elif (dimension, tag) not in touched:
+                new_tags.add(tag)
+        new_tags &= existing
+        if new_tags:
+            gmsh.model.addPhysicalGroup(dimension, sorted(new_tags), tag=physical_tag, name=name)
+
+
+# Argument(s) retained for compatibility with ``_cubit_python.sets`` API
+def sets(
+    input_file: str | pathlib.Path,
+    output_file: str | pathlib.Path | None = parsers.sets_defaults["output_file"],
+    part_name: str | None = parsers.sets_defaults["part_name"],  # noqa: ARG001
+    face_sets: typing.Sequence[tuple[str, str | int]] | None = parsers.sets_defaults["face_sets"],  # type: ignore[assignment]
+    edge_sets: typing.Sequence[tuple[str, str | int]] | None = parsers.sets_defaults["edge_sets"],  # type: ignore[assignment]
+    vertex_sets: typing.Sequence[tuple[str, str | int]] | None = parsers.sets_defaults["vertex_sets"],  # type: ignore[assignment]
+) -> None:
+    """Create Gmsh physical groups from entity masks.
+
+    Masks are interpreted by :meth:`turbo_turtle._gmsh_python._mask_entities`.
+
+    :param input_file: Gmsh ``*.step``, ``*.brep``, or ``*.xao`` file to open that already contains the entities
+    :param output_file: Gmsh ``*.xao`` file to write. Only ``*.xao`` files preserve physical groups. If none is
+        provided, use the input file with the ``.xao`` extension.
+    :param part_name: part name, unused. Kept for API compatibility with :meth:`turbo_turtle._cubit_python.sets`.
+    :param face_sets: Face set tuples (name, mask)
+    :param edge_sets: Edge set tuples (name, mask)
+    :param vertex_sets: Vertex set tuples (name, mask)
+
+    :raises RuntimeError: if the output file is a ``*.step`` or ``*.brep`` file, which do not preserve physical groups
+    """
+    if not any([face_sets, edge_sets, vertex_sets]):
+        raise RuntimeError("Must specify at least one of: face_sets, edge_sets, vertex_sets")
+
+    # Input/Output setup
+    input_file = _file_with_suffix(input_file)
+    if output_file is None:
+        output_file = input_file.with_suffix(".xao")
+    output_file = _file_with_suffix(output_file, _physical_group_suffixes)
+    if output_file.suffix.lower() != ".xao":
+        raise RuntimeError(
+            f"Gmsh sets output file '{output_file}' must be an ``*.xao`` file. Only ``*.xao`` files preserve "
+            "physical groups."
+        )
+
+    with (
+        _call_session(),
+        _utilities.NamedTemporaryFileCopy(input_file, suffix=input_file.suffix, dir=".") as copy_file,
+    ):
+        gmsh.open(copy_file.name)
+        _sets(face_sets, edge_sets, vertex_sets)
+        _write(output_file)
+
+
+def _sets(
+    face_sets: typing.Sequence[tuple[str, str | int]] | None = parsers.sets_defaults["face_sets"],  # type: ignore[assignment]
+    edge_sets: typing.Sequence[tuple[str, str | int]] | None = parsers.sets_defaults["edge_sets"],  # type: ignore[assignment]
+    vertex_sets: typing.Sequence[tuple[str, str | int]] | None = parsers.sets_defaults["vertex_sets"],  # type: ignore[assignment]
+) -> dict[tuple[int, str], list[int]]:
+    """Create Gmsh physical groups from entity masks in bulk.
+
+    The model is synchronized once and the entity tags and bounding boxes are indexed once per dimension. All masks are
+    resolved against the index before any physical group is created.
+
+    :param face_sets: Face set tuples (name, mask)
+    :param edge_sets: Edge set tuples (name, mask)
+    :param vertex_sets: Vertex set tuples (name, mask)
+
+    :returns: map from (dimension, name) to the sorted list of Gmsh entity tags
+    """
+    dimension_sets = {2: face_sets, 1: edge_sets, 0: vertex_sets}
+    dimension_sets = {dimension: name_mask for dimension, name_mask in dimension_sets.items() if name_mask}
+
+    gmsh.model.occ.synchronize()
+    index = {dimension: _entity_index(dimension) for dimension in dimension_sets}
+
+    groups = {}
+    for dimension, name_mask in dimension_sets.items():
+        for name, mask in name_mask or []:
+            groups[(dimension, name)] = _mask_entities(str(mask), *index[dimension], dimension=dimension)
+
+    for (dimension, name), tags in groups.items():
+        gmsh.model.addPhysicalGroup(dimension, tags, name=name)
+
+    return groups
+
+
+def _entity_index(dimension: int) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Return the Gmsh entity tags and bounding boxes of a dimension.
+
+    :param dimension: Gmsh entity dimension
+
+    :returns: entity tags [N], bounding boxes [N, 6] (xmin, ymin, zmin, xmax, ymax, zmax)
+    """
+    tags = numpy.array([tag for _dimension, tag in gmsh.model.getEntities(dimension)], dtype=int)
+    boxes = numpy.array([gmsh.model.getBoundingBox(dimension, tag) for tag in tags], dtype=float).reshape(-1, 6)
+    return tags, boxes
+
+
+def _mask_entities(
+    mask: str,
+    tags: numpy.ndarray,
+    boxes: numpy.ndarray,
+    dimension: int,
+) -> list[int]:
+    """Return the Gmsh entity tags selected by a mask string.
+
+    Masks take one of the following forms. Values may be separated by spaces or commas.
+
+    * ``tag [tag ...]``: Gmsh entity tags
+    * ``box xmin ymin zmin xmax ymax zmax``: entities with a bounding box inside the box
+    * ``near x y z [x y z ...]``: the entity nearest to each point
+
+    :param mask: entity mask string
+    :param tags: entity tags [N] of the dimension index
+    :param boxes: entity bounding boxes [N, 6] of the dimension index
+    :param dimension: Gmsh entity dimension
+
+    :returns: sorted list of unique Gmsh entity tags
+
+    :raises RuntimeError: if the mask is malformed or selects no entities
+    """
+    words = mask.replace(",", " ").split()
+    if not words:
+        raise RuntimeError("Gmsh set masks must not be empty")
+    keyword = words[0].lower()
+    try:
+        if keyword == "box":
+            values = numpy.array(words[1:], dtype=float)
+            if values.size != 6:
+                raise RuntimeError(f"Gmsh bounding box mask '{mask}' requires six (6) values")
+            selected = tags[numpy.all((boxes[:, 0:3] >= values[0:3]) & (boxes[:, 3:6] <= values[3:6]), axis=1)]
+        elif keyword == "near":
+            values = numpy.array(words[1:], dtype=float)
+            if values.size == 0 or values.size % 3 != 0:
+                raise RuntimeError(f"Gmsh nearest entity mask '{mask}' requires (x, y, z) point triplets")
+            selected = numpy.array([_nearest_entity(point, tags, boxes, dimension) for point in values.reshape(-1, 3)])
+        else:
+            selected = numpy.array(words, dtype=int)
+            missing = numpy.setdiff1d(selected, tags)
+            if missing.size > 0:
+                raise RuntimeError(f"Could not find {dimension}D Gmsh entities with tags {missing.tolist()}")
+    except ValueError as err:
+        raise RuntimeError(f"Could not interpret Gmsh set mask '{mask}'") from err
+    if selected.size == 0:
+        raise RuntimeError(f"Gmsh set mask '{mask}' did not select any {dimension}D entities")
+    return sorted({int(tag) for tag in selected})
+
+
+def _nearest_entity(point: numpy.ndarray, tags: numpy.ndarray, boxes: numpy.ndarray, dimension: int) -> int:
+    """Return the tag of the Gmsh entity nearest to a point.
+
+    The point to bounding box distance is a lower bound of the point to entity distance. Entities are visited in order
+    of increasing lower bound and the search stops when the lower bound exceeds the nearest distance found, so only a
+    few closest point queries are required per point.
+
+    :param point: (x, y, z) coordinates
+    :param tags: entity tags [N] of the dimension index
+    :param boxes: entity bounding boxes [N, 6] of the dimension index
+    :param dimension: Gmsh entity dimension
+
+    :returns: Gmsh entity tag
+
+    :raises RuntimeError: if the index is empty
+    """
+    if tags.size == 0:
+        raise RuntimeError(f"Could not find any {dimension}D Gmsh entities")
+    lower_bounds = numpy.linalg.norm(point - numpy.clip(point, boxes[:, 0:3], boxes[:, 3:6]), axis=1)
+    # Point bounding boxes are exact
+    if dimension == 0:
+        return int(tags[numpy.argmin(lower_bounds)])
+    nearest_tag = int(tags[0])
+    nearest_distance = numpy.inf
+    for position in numpy.argsort(lower_bounds, kind="stable"):
+        if lower_bounds[position] > nearest_distance:
+            break
+        closest_coordinates, _parametric_coordinates = gmsh.model.getClosestPoint(dimension, int(tags[position]), point)
+        distance = numpy.linalg.norm(numpy.array(closest_coordinates) - point)
+        if distance < nearest_distance:
+            nearest_tag = int(tags[position])
+            nearest_distance = float(distance)
+    return nearest_tag
 
 
 # Argument(s) retained for compatibility with ``_cubit_python.mesh`` API
@@ -383,61 +961,738 @@ def mesh(
     element_type: str,  # noqa: ARG001
     output_file: str | pathlib.Path | None = parsers.mesh_defaults["output_file"],  # type: ignore[assignment]
     model_name: str | None = parsers.mesh_defaults["model_name"],  # type: ignore[assignment] # noqa: ARG001
-    part_name: str | None = parsers.mesh_defaults["part_name"],  # type: ignore[assignment] # noqa: ARG001
+    part_name: str | None = parsers.mesh_defaults["part_name"],  # type: ignore[assignment]
     global_seed: float = parsers.mesh_defaults["global_seed"],  # type: ignore[assignment]
-    edge_seeds: typing.Sequence[tuple[str, str | int | float]] | None = parsers.mesh_defaults["edge_seeds"],  # type: ignore[assignment] # noqa: ARG001
+    edge_seeds: typing.Sequence[tuple[str, str | int | float]] | None = parsers.mesh_defaults["edge_seeds"],  # type: ignore[assignment]
+    num_threads: int | None = parsers.mesh_defaults["num_threads"],  # type: ignore[assignment]
+    algorithm_2d: str | None = parsers.mesh_defaults["algorithm_2d"],  # type: ignore[assignment]
+    algorithm_3d: str | None = parsers.mesh_defaults["algorithm_3d"],  # type: ignore[assignment]
+    distance_refinements: typing.Sequence[tuple[str, ...]] | None = parsers.mesh_defaults["distance_refinements"],  # type: ignore[assignment]
+    boundary_layers: typing.Sequence[tuple[str, ...]] | None = parsers.mesh_defaults["boundary_layers"],  # type: ignore[assignment]
+    curvature_elements: int | None = parsers.mesh_defaults["curvature_elements"],  # type: ignore[assignment]
+    verbosity: typing.Literal["verbose", "quiet"] | None = parsers.mesh_defaults["verbosity"],  # type: ignore[assignment]
+    log_file: str | pathlib.Path | None = parsers.mesh_defaults["log_file"],  # type: ignore[assignment]
 ) -> None:
     """Mesh Gmsh physical entities by part name.
 
-    :param input_file: Gmsh ``*.step`` file to open that already contains physical entities to be meshed
+    Only the entities matching the part name prefix are meshed and only up to the highest entity dimension found for
+    the part name, e.g. planar and axisymmetric sheet bodies are meshed to 2D. If no part name is provided or no
+    entities match the part name prefix, all entities of the highest dimension in the model are meshed.
+
+    :param input_file: Gmsh ``*.step``, ``*.brep``, or ``*.xao`` file to open that already contains physical entities
+        to be meshed
     :param element_type: Gmsh scheme.
-    :param output_file: Gmsh mesh file to write
+    :param output_file: Gmsh mesh file to write. ``*.msh`` files of large meshes are written in the binary format.
     :param model_name: name of the Gmsh model in which to create the part
-    :param part_name: physical entity name prefix
+    :param part_name: physical group or entity name prefix
     :param global_seed: The global mesh seed size
     :param edge_seeds: Edge seed tuples (name, number)
+    :param num_threads: Gmsh meshing thread count. Zero uses the system default. None keeps the Gmsh defaults.
+    :param algorithm_2d: Gmsh 2D meshing algorithm name. Must be a key of
+        :attr:`turbo_turtle._abaqus_python.turbo_turtle_abaqus.parsers.mesh_gmsh_algorithm_2d`.
+    :param algorithm_3d: Gmsh 3D meshing algorithm name. Must be a key of
+        :attr:`turbo_turtle._abaqus_python.turbo_turtle_abaqus.parsers.mesh_gmsh_algorithm_3d`.
+    :param distance_refinements: Distance refinement tuples (name, size, distance minimum, distance maximum)
+    :param boundary_layers: 2D boundary layer tuples (curve name, first layer size, growth ratio, thickness)
+    :param curvature_elements: Number of elements per 2 Pi radians of curvature
+    :param verbosity: Gmsh message verbosity: verbose, quiet, or None for the Gmsh default
+    :param log_file: Gmsh rotating log file. Messages are drained to the log file after every meshing stage.
     """
-    # Universally required setup
-    gmsh.initialize()
-    gmsh.logger.start()
+    with _call_session(verbosity=verbosity, log_file=log_file):
+        _set_mesh_options(num_threads=num_threads, algorithm_2d=algorithm_2d, algorithm_3d=algorithm_3d)
+
+        # Input/Output setup
+        input_file = _file_with_suffix(input_file)
+        if output_file is None:
+            output_file = input_file.with_suffix(".msh")
+        output_file = pathlib.Path(output_file)
+
+        gmsh.option.setNumber("Mesh.SaveGroupsOfElements", 1)
+        gmsh.option.setNumber("Mesh.SaveGroupsOfNodes", 1)
+        with _utilities.NamedTemporaryFileCopy(input_file, suffix=input_file.suffix, dir=".") as copy_file:
+            gmsh.open(copy_file.name)
+            _mesh(
+                part_name,
+                global_seed,
+                edge_seeds=edge_seeds,
+                distance_refinements=distance_refinements,
+                boundary_layers=boundary_layers,
+                curvature_elements=curvature_elements,
+            )
+            _write(output_file)
 
-    # Input/Output setup
-    # TODO: allow other output formats supported by Gmsh
-    input_file = pathlib.Path(input_file).with_suffix(".step")
-    if output_file is None:
-        output_file = input_file.with_suffix(".msh")
-    output_file = pathlib.Path(output_file)
 
-    with _utilities.NamedTemporaryFileCopy(input_file, suffix=input_file.suffix, dir=".") as copy_file:
-        gmsh.open(copy_file.name)
-        # TODO: Move to dedicated meshing function
-        # TODO: Do physical group names apply to all dimensional entities associated with original name? Can we jump
-        # straight to points with matching physical/entity names?
-        # FIXME: The physical groups are not getting saved. Stop global application of seed without regard to
-        # part/entity name.
-        # https://re-git.lanl.gov/aea/python-projects/turbo-turtle/-/issues/222
-        points = gmsh.model.getEntities(dim=0)
-        gmsh.model.mesh.setSize(points, global_seed)
-        gmsh.model.mesh.generate(3)
+def _mesh(
+    part_name: str | None = parsers.mesh_defaults["part_name"],  # type: ignore[assignment]
+    global_seed: float = parsers.mesh_defaults["global_seed"],  # type: ignore[assignment]
+    edge_seeds: typing.Sequence[tuple[str, str | int | float]] | None = parsers.mesh_defaults["edge_seeds"],  # type: ignore[assignment]
+    distance_refinements: typing.Sequence[tuple[str, ...]] | None = parsers.mesh_defaults["distance_refinements"],  # type: ignore[assignment]
+    boundary_layers: typing.Sequence[tuple[str, ...]] | None = parsers.mesh_defaults["boundary_layers"],  # type: ignore[assignment]
+    curvature_elements: int | None = parsers.mesh_defaults["curvature_elements"],  # type: ignore[assignment]
+) -> None:
+    """Mesh the entities of the open Gmsh model by part name prefix without file I/O handling.
+
+    Mesh sizes are applied only to the points bounding the part entities. When the part entities are a subset of the
+    model entities, the remaining entities are hidden and ``Mesh.MeshOnlyVisible`` is enabled so that untouched parts
+    are not meshed.
+
+    :param part_name: physical group or entity name prefix
+    :param global_seed: The global mesh seed size
+    :param edge_seeds: Edge seed tuples (name, number)
+    :param distance_refinements: Distance refinement tuples (name, size, distance minimum, distance maximum)
+    :param boundary_layers: 2D boundary layer tuples (curve name, first layer size, growth ratio, thickness)
+    :param curvature_elements: Number of elements per 2 Pi radians of curvature
+    """
+    if part_name is not None:
+        part_name = _mixed_utilities.cubit_part_names(part_name)
+    dim_tags = _part_entities(part_name, fallback=True)
+    dimension = dim_tags[0][0]
+
+    # FIXME: The physical groups are not getting saved to STEP files. Falls back to global application of the seed
+    # when the part name can not be found.
+    # https://re-git.lanl.gov/aea/python-projects/turbo-turtle/-/issues/222
+    points = gmsh.model.getBoundary(dim_tags, combined=False, oriented=False, recursive=True)
+    points = sorted({(0, abs(tag)) for _dimension, tag in points})
+    gmsh.model.mesh.setSize(points, global_seed)
+
+    if len(dim_tags) < len(gmsh.model.getEntities(dim=dimension)):
+        gmsh.model.setVisibility(gmsh.model.getEntities(), 0)
+        gmsh.model.setVisibility(dim_tags, 1, recursive=True)
+        gmsh.option.setNumber("Mesh.MeshOnlyVisible", 1)
+
+    if edge_seeds is not None:
+        _edge_seeds(edge_seeds)
+    _size_fields(global_seed, distance_refinements=distance_refinements, boundary_layers=boundary_layers)
+    if curvature_elements is not None:
+        gmsh.option.setNumber("Mesh.MeshSizeFromCurvature", curvature_elements)
+
+    _generate_mesh(dimension)
+
+
+def _positive_numbers(numbers: typing.Iterable[str | int | float], message: str) -> list[float]:
+    """Convert numbers to floats and raise an exception if any number is not positive.
+
+    :param numbers: numbers or number strings to convert
+    :param message: exception message
+
+    :returns: list of floats
+
+    :raises ValueError: if any number is zero or negative
+    """
+    float_numbers = [float(number) for number in numbers]
+    if not all(number > 0.0 for number in float_numbers):
+        raise ValueError(message)
+    return float_numbers
+
+
+def _entities_of_dimension(name: str, dimension: int) -> list[int]:
+    """Return entity tags of a single dimension by name prefix.
+
+    Entities with a higher dimension are reduced to their boundary entities of the requested dimension. Entities with a
+    lower dimension are ignored.
+
+    :param name: physical group or entity name prefix
+    :param dimension: entity dimension to return
+
+    :returns: sorted list of Gmsh entity tags
+
+    :raises RuntimeError: if no entities match the name prefix
+    """
+    dim_tags = _entities_from_name(name)
+    if not dim_tags:
+        raise RuntimeError(f"Could not find any entities with prefix '{name}'")
+    tags = {tag for entity_dimension, tag in dim_tags if entity_dimension == dimension}
+    higher = [dim_tag for dim_tag in dim_tags if dim_tag[0] > dimension]
+    while higher:
+        boundary = gmsh.model.getBoundary(higher, combined=False, oriented=False)
+        tags.update(abs(tag) for entity_dimension, tag in boundary if entity_dimension == dimension)
+        higher = sorted(
+            {(entity_dimension, abs(tag)) for entity_dimension, tag in boundary if entity_dimension > dimension}
+        )
+    return sorted(tags)
+
+
+def _edge_seeds(name_number: typing.Sequence[tuple[str, str | int | float]]) -> None:
+    """Seed curves by name with transfinite curve constraints.
+
+    If the number is an integer, seed by number of elements. If the number is a float, seed by size, where the number
+    of elements is the curve length divided by the size, rounded up.
+
+    :param name_number: Edge seed tuples (name, number)
+
+    :raises ValueError: if any seed number is zero or negative
+    """
+    names, numbers = zip(*name_number, strict=True)
+    float_numbers = _positive_numbers(numbers, "Edge seeds must be positive numbers")
+    for name, number in zip(names, float_numbers, strict=True):
+        for tag in _entities_of_dimension(name, 1):
+            if number.is_integer():
+                elements = int(number)
+            else:
+                elements = max(1, math.ceil(gmsh.model.occ.getMass(1, tag) / number))
+            gmsh.model.mesh.setTransfiniteCurve(tag, elements + 1)
+
+
+def _distance_field(name: str) -> int:
+    """Create a Gmsh ``Distance`` field measured from the points, curves, and surfaces of a name prefix.
+
+    Volumes are measured by their boundary surfaces.
+
+    :param name: physical group or entity name prefix
+
+    :returns: Gmsh field tag
+    """
+    dim_tags = _entities_from_name(name)
+    entity_lists = {
+        "PointsList": [tag for dimension, tag in dim_tags if dimension == 0],
+        "CurvesList": [tag for dimension, tag in dim_tags if dimension == 1],
+        "SurfacesList": _entities_of_dimension(name, 2),
+    }
+    distance_field = gmsh.model.mesh.field.add("Distance")
+    for option, tags in entity_lists.items():
+        if tags:
+            gmsh.model.mesh.field.setNumbers(distance_field, option, tags)
+    return distance_field
+
+
+def _size_fields(
+    global_seed: float,
+    distance_refinements: typing.Sequence[tuple[str, ...]] | None = parsers.mesh_defaults["distance_refinements"],  # type: ignore[assignment]
+    boundary_layers: typing.Sequence[tuple[str, ...]] | None = parsers.mesh_defaults["boundary_layers"],  # type: ignore[assignment]
+) -> None:
+    """Create local refinement size fields and set the minimum of all refinements as the background field.
+
+    Distance refinements use a Gmsh ``Threshold`` field on a ``Distance`` field. The element size is ``size`` within
+    ``distance minimum`` of the named entities and grades to the global seed at ``distance maximum``. Volumes are
+    measured by their boundary surfaces.
+
+    Boundary layers use a Gmsh ``BoundaryLayer`` field on the named curves, or the boundary curves of named surfaces.
+    Gmsh boundary layer fields only apply to 2D meshes.
+
+    :param global_seed: The global mesh seed size
+    :param distance_refinements: Distance refinement tuples (name, size, distance minimum, distance maximum)
+    :param boundary_layers: 2D boundary layer tuples (curve name, first layer size, growth ratio, thickness)
+
+    :raises ValueError: if any size, distance, ratio, or thickness is zero or negative
+    """
+    threshold_fields = []
+    if distance_refinements is not None:
+        for name, *numbers in distance_refinements:
+            size, distance_minimum, distance_maximum = _positive_numbers(
+                numbers, "Distance refinement size and distances must be positive numbers"
+            )
+            distance_field = _distance_field(name)
+            threshold_field = gmsh.model.mesh.field.add("Threshold")
+            gmsh.model.mesh.field.setNumber(threshold_field, "InField", distance_field)
+            gmsh.model.mesh.field.setNumber(threshold_field, "SizeMin", size)
+            gmsh.model.mesh.field.setNumber(threshold_field, "SizeMax", global_seed)
+            gmsh.model.mesh.field.setNumber(threshold_field, "DistMin", distance_minimum)
+            gmsh.model.mesh.field.setNumber(threshold_field, "DistMax", distance_maximum)
+            threshold_fields.append(threshold_field)
+    if threshold_fields:
+        minimum_field = gmsh.model.mesh.field.add("Min")
+        gmsh.model.mesh.field.setNumbers(minimum_field, "FieldsList", threshold_fields)
+        gmsh.model.mesh.field.setAsBackgroundMesh(minimum_field)
+
+    if boundary_layers is not None:
+        for name, *numbers in boundary_layers:
+            size, ratio, thickness = _positive_numbers(
+                numbers, "Boundary layer size, ratio, and thickness must be positive numbers"
+            )
+            boundary_layer_field = gmsh.model.mesh.field.add("BoundaryLayer")
+            gmsh.model.mesh.field.setNumbers(boundary_layer_field, "CurvesList", _entities_of_dimension(name, 1))
+            gmsh.model.mesh.field.setNumber(boundary_layer_field, "Size", size)
+            gmsh.model.mesh.field.setNumber(boundary_layer_field, "Ratio", ratio)
+            gmsh.model.mesh.field.setNumber(boundary_layer_field, "Thickness", thickness)
+            gmsh.model.mesh.field.setAsBoundaryLayer(boundary_layer_field)
+
+
+def _entities_from_name(name: str) -> list[tuple[int, int]]:
+    """Return the Gmsh dimTags of all entities with a physical group or entity name prefix.
+
+    Physical group names are searched first. Entity names are only searched when no physical group matches. Entity
+    names imported from STEP files are hierarchical, e.g. ``Shapes/name``, so only the final name component is compared.
+
+    :param name: physical group or entity name prefix
+
+    :returns: sorted list of Gmsh dimTags (dimension, tag)
+    """
+    dim_tags: set[tuple[int, int]] = set()
+    for dimension, physical_tag in gmsh.model.getPhysicalGroups():
+        if gmsh.model.getPhysicalName(dimension, physical_tag).startswith(name):
+            tags = gmsh.model.getEntitiesForPhysicalGroup(dimension, physical_tag)
+            dim_tags.update((dimension, int(tag)) for tag in tags)
+    if not dim_tags:
+        for dimension, tag in gmsh.model.getEntities():
+            entity_name = gmsh.model.getEntityName(dimension, tag).split("/")[-1]
+            if entity_name.startswith(name):
+                dim_tags.add((dimension, tag))
+    return sorted(dim_tags)
+
+
+def _part_entities(part_name: str | None = None, fallback: bool = False) -> list[tuple[int, int]]:
+    """Return the highest dimension Gmsh dimTags of a part name prefix.
+
+    If no part name is provided, return all entities of the highest dimension found in the model.
+
+    :param part_name: physical group or entity name prefix
+    :param fallback: if no entities match the part name prefix, warn and return all entities of the highest dimension
+        found in the model
+
+    :returns: sorted list of Gmsh dimTags (dimension, tag) with a common dimension
+
+    :raises RuntimeError: if no entities match the part name prefix without fallback or if the model has no entities
+    """
+    dim_tags = _entities_from_name(part_name) if part_name is not None else []
+    if not dim_tags:
+        if part_name is not None:
+            if not fallback:
+                raise RuntimeError(f"Could not find any entities with prefix '{part_name}'")
+            _logger.warning(f"Could not find any entities with prefix '{part_name}'. Using all model entities.")
+        dim_tags = gmsh.model.getEntities()
+    if not dim_tags:
+        raise RuntimeError("Could not find any entities in the Gmsh model")
+    dimension = max(dim_tag[0] for dim_tag in dim_tags)
+    return sorted(dim_tag for dim_tag in dim_tags if dim_tag[0] == dimension)
+
+
+def _set_mesh_options(
+    num_threads: int | None = parsers.mesh_defaults["num_threads"],  # type: ignore[assignment]
+    algorithm_2d: str | None = parsers.mesh_defaults["algorithm_2d"],  # type: ignore[assignment]
+    algorithm_3d: str | None = parsers.mesh_defaults["algorithm_3d"],  # type: ignore[assignment]
+) -> None:
+    """Set the Gmsh meshing thread count and algorithm options.
+
+    Options provided as None are left at the Gmsh defaults. Parallel 2D meshing applies to the MeshAdapt, Delaunay, and
+    Frontal-Delaunay algorithms. Parallel 3D meshing requires the HXT algorithm.
+
+    :param num_threads: Gmsh meshing thread count. Zero uses the system default, e.g. ``OMP_NUM_THREADS``.
+    :param algorithm_2d: Gmsh 2D meshing algorithm name
+    :param algorithm_3d: Gmsh 3D meshing algorithm name
+
+    :raises RuntimeError: if an algorithm name is not recognized
+    """
+    if num_threads is not None:
+        gmsh.option.setNumber("General.NumThreads", num_threads)
+        for dimension in (1, 2, 3):
+            gmsh.option.setNumber(f"Mesh.MaxNumThreads{dimension}D", num_threads)
+    if algorithm_2d is not None:
+        if algorithm_2d not in parsers.mesh_gmsh_algorithm_2d:
+            raise RuntimeError(f"Unknown Gmsh 2D meshing algorithm '{algorithm_2d}'")
+        gmsh.option.setNumber("Mesh.Algorithm", parsers.mesh_gmsh_algorithm_2d[algorithm_2d])
+    if algorithm_3d is not None:
+        if algorithm_3d not in parsers.mesh_gmsh_algorithm_3d:
+            raise RuntimeError(f"Unknown Gmsh 3D meshing algorithm '{algorithm_3d}'")
+        gmsh.option.setNumber("Mesh.Algorithm3D", parsers.mesh_gmsh_algorithm_3d[algorithm_3d])
+
+
+def _generate_mesh(dimension: int) -> int:
+    """Generate the Gmsh mesh one dimension at a time and report the meshing rate in elements per second.
+
+    :param dimension: highest entity dimension to mesh
+
+    :returns: number of elements of the meshed dimension
+    """
+    elapsed = 0.0
+    # Mesh one dimension at a time to drain the Gmsh messages between stages
+    for stage in range(1, dimension + 1):
+        start = time.perf_counter()
+        gmsh.model.mesh.generate(stage)
+        elapsed += time.perf_counter() - start
+        _drain_log()
+    _element_types, element_tags, _node_tags = gmsh.model.mesh.getElements(dim=dimension)
+    number_of_elements = sum(len(tags) for tags in element_tags)
+    rate = number_of_elements / elapsed if elapsed > 0.0 else float("inf")
+    _logger.info(
+        f"Meshed {number_of_elements} {dimension}D elements in {elapsed:.3f} s ({rate:.1f} elements per second)"
+    )
+    return number_of_elements
+
+
+def merge(
+    input_file: typing.Sequence[str | pathlib.Path],
+    output_file: str | pathlib.Path,
+    merged_model_name: str = parsers.merge_defaults["merged_model_name"],  # type: ignore[assignment]
+    part_name: list[str | None] = parsers.merge_defaults["part_name"],  # type: ignore[assignment]
+    fragment: bool = parsers.merge_defaults["fragment"],  # type: ignore[assignment]
+    jobs: int | None = parsers.merge_defaults["jobs"],  # type: ignore[assignment]
+) -> None:
+    """Merge Gmsh geometry files into a single model and save to output file.
+
+    The input files are read and healed concurrently in worker processes and serialized as BRep files. The BRep files
+    are assembled in a single Gmsh model by the main process. Part names are added as physical groups, which are only
+    preserved by ``*.xao`` output files. Input files without entity names, e.g. ``*.step`` files written by Gmsh, use
+    the input file stem as the part name.
+
+    :param input_file: List of Gmsh ``*.step``, ``*.brep``, or ``*.xao`` file(s) to merge
+    :param output_file: Gmsh ``*.xao``, ``*.step``, or ``*.brep`` file to write. Unsupported extensions use ``.xao``.
+        ``*.step`` and ``*.brep`` output files do not preserve the part names and log a warning.
+    :param merged_model_name: name of the merged Gmsh model
+    :param part_name: part name prefixes to merge. If None, merge all parts.
+    :param fragment: fragment the merged parts to create conformal part interfaces
+    :param jobs: number of worker processes. None reads the input files in a single worker process. Zero uses the CPU
+        count.
+    """
+    input_file = [_file_with_suffix(path) for path in input_file]
+    output_file = _file_with_suffix(output_file, _physical_group_suffixes)
+    part_names: list[str] = [name for name in part_name if name is not None]
+    if part_names:
+        part_names = _mixed_utilities.cubit_part_names(part_names)
+
+    # Load in worker processes before initializing the main process Gmsh session
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        serialized = [pathlib.Path(temporary_directory) / f"{number}.brep" for number in range(len(input_file))]
+        max_workers = 1 if jobs is None else min(jobs or os.cpu_count() or 1, len(input_file))
+        # Forked workers would inherit the Gmsh state of an open session
+        context = multiprocessing.get_context("spawn") if gmsh.isInitialized() else None
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+            loaded = list(executor.map(_load_shapes, input_file, serialized))
+
+        with _call_session():
+            if output_file.suffix.lower() != ".xao":
+                _logger.warning(
+                    f"Merged part names are not preserved by '{output_file}'. Write an ``*.xao`` file instead."
+                )
+            gmsh.model.add(merged_model_name)
+
+            dim_tags, names = _merge(serialized, loaded, part_name=part_names, fragment=fragment)
+            _add_named_physical_groups(dim_tags, names)
+
+            _write(output_file)
+
+
+def _load_shapes(
+    input_file: str | pathlib.Path, output_file: str | pathlib.Path
+) -> list[tuple[str, float, tuple[float, float, float]]]:
+    """Read and heal the highest dimension shapes of a geometry file and serialize them to a BRep file.
+
+    Intended for worker processes. Initializes and finalizes a dedicated Gmsh session.
+
+    :param input_file: Gmsh readable geometry file, e.g. ``*.step``
+    :param output_file: BRep file to write
+
+    :returns: list of (name, mass, center of mass) tuples, one per shape. Unnamed shapes use the input file stem.
+    """
+    input_file = pathlib.Path(input_file)
+    gmsh.initialize()
+    gmsh.option.setNumber("General.Terminal", 0)
+    try:
+        if input_file.suffix.lower() == ".xao":
+            # XAO files are not supported by the shape import, but preserve the entity names
+            gmsh.open(str(input_file))
+            dim_tags = gmsh.model.occ.getEntities()
+            dimension = max((dim_tag[0] for dim_tag in dim_tags), default=0)
+            dim_tags = [dim_tag for dim_tag in dim_tags if dim_tag[0] == dimension]
+        else:
+            dim_tags = gmsh.model.occ.importShapes(str(input_file), highestDimOnly=True)
+        if not dim_tags:
+            raise RuntimeError(f"Could not find any shapes in '{input_file}'")
+        # Re-sewing faces breaks closed, revolved solids, e.g. spheres
+        dim_tags = gmsh.model.occ.healShapes(dim_tags, sewFaces=False, makeSolids=False)
+        gmsh.model.occ.synchronize()
+        dimension = max(dim_tag[0] for dim_tag in dim_tags)
+        shapes = []
+        for dim_tag in gmsh.model.getEntities(dimension):
+            name = gmsh.model.getEntityName(*dim_tag).split("/")[-1]
+            # The Open CASCADE STEP writer labels every shape with the translator version
+            if not name or name.startswith("Open CASCADE STEP translator"):
+                name = input_file.stem
+            shapes.append((name, *_shape_signature(dim_tag)))
         gmsh.write(str(output_file))
+    finally:
+        gmsh.finalize()
+    return shapes
 
-    gmsh.option.setNumber("Mesh.SaveGroupsOfElements", 1)
-    gmsh.option.setNumber("Mesh.SaveGroupsOfNodes", 1)
 
-    # Output and cleanup
-    gmsh.logger.stop()
-    gmsh.finalize()
+def _shape_signature(dim_tag: tuple[int, int]) -> tuple[float, tuple[float, float, float]]:
+    """Return the mass and center of mass of a Gmsh OpenCASCADE entity.
 
+    :param dim_tag: Gmsh dimTag (dimension, tag)
 
-# TODO: Remove ``noqa: ARG001`` when this function is implemented.
-# https://re-git.lanl.gov/aea/python-projects/turbo-turtle/-/issues/216
-def merge(*args, **kwargs) -> typing.NoReturn:  # noqa: ARG001
-    raise RuntimeError("merge subcommand is not yet implemented")
+    :returns: mass, center of mass (x, y, z)
+    """
+    mass = gmsh.model.occ.getMass(*dim_tag)
+    center_of_mass = tuple(float(coordinate) for coordinate in gmsh.model.occ.getCenterOfMass(*dim_tag))
+    return float(mass), center_of_mass  # type: ignore[return-value]
 
 
-# TODO: Remove ``noqa: ARG001`` when this function is implemented.
-def export(*args, **kwargs) -> typing.NoReturn:  # noqa: ARG001
-    raise RuntimeError("export subcommand is not yet implemented")
+def _match_shapes(
+    dim_tags: typing.Sequence[tuple[int, int]], shapes: typing.Sequence[tuple[str, float, tuple[float, float, float]]]
+) -> list[str]:
+    """Return the shape names matched to imported Gmsh entities by mass and center of mass.
+
+    BRep files do not store names and the imported entity order is not guaranteed to match the serialized order.
+
+    :param dim_tags: imported Gmsh dimTags (dimension, tag)
+    :param shapes: list of (name, mass, center of mass) tuples returned by
+        :meth:`turbo_turtle._gmsh_python._load_shapes`
+
+    :returns: shape names, one per dimTag
+
+    :raises RuntimeError: if the number of imported entities does not match the number of shapes
+    """
+    if len(dim_tags) != len(shapes):
+        raise RuntimeError(f"Imported {len(dim_tags)} Gmsh entities, but expected {len(shapes)} shapes")
+    expected = numpy.array([[mass, *center_of_mass] for _name, mass, center_of_mass in shapes]).reshape(-1, 4)
+    available = numpy.ones(len(shapes), dtype=bool)
+    names = []
+    for dim_tag in dim_tags:
+        mass, center_of_mass = _shape_signature(dim_tag)
+        distance = numpy.linalg.norm(expected - numpy.array([mass, *center_of_mass]), axis=1)
+        distance[~available] = numpy.inf
+        position = int(numpy.argmin(distance))
+        available[position] = False
+        names.append(shapes[position][0])
+    return names
+
+
+def _merge(
+    serialized: typing.Sequence[pathlib.Path],
+    loaded: typing.Sequence[typing.Sequence[tuple[str, float, tuple[float, float, float]]]],
+    part_name: typing.Sequence[str] = (),
+    fragment: bool = parsers.merge_defaults["fragment"],  # type: ignore[assignment]
+) -> tuple[list[tuple[int, int]], list[str]]:
+    """Import serialized BRep files into the current Gmsh model.
+
+    :param serialized: BRep files written by :meth:`turbo_turtle._gmsh_python._load_shapes`
+    :param loaded: shape tuples returned by :meth:`turbo_turtle._gmsh_python._load_shapes`, one list per BRep file
+    :param part_name: part name prefixes to keep. If empty, keep all parts.
+    :param fragment: fragment the merged parts to create conformal part interfaces
+
+    :returns: merged Gmsh dimTags (dimension, tag), part names. One name per dimTag.
+    """
+    dim_tags = []
+    names = []
+    remove = []
+    for path, shapes in zip(serialized, loaded, strict=True):
+        imported = gmsh.model.occ.importShapes(str(path), highestDimOnly=True)
+        for dim_tag, name in zip(imported, _match_shapes(imported, shapes), strict=True):
+            if part_name and not any(name.startswith(prefix) for prefix in part_name):
+                remove.append(dim_tag)
+            else:
+                dim_tags.append(dim_tag)
+                names.append(name)
+    if remove:
+        gmsh.model.occ.remove(remove, recursive=True)
+    if not dim_tags:
+        raise RuntimeError(f"Could not find any parts matching '{part_name}' in the input files")
+
+    if fragment:
+        _out_dim_tags, out_dim_tags_map = gmsh.model.occ.fragment(dim_tags, [])
+        fragmented_dim_tags: list[tuple[int, int]] = []
+        fragmented_names = []
+        for children, name in zip(out_dim_tags_map, names, strict=True):
+            fragmented_dim_tags.extend((int(child[0]), int(child[1])) for child in children)
+            fragmented_names.extend([name] * len(children))
+        dim_tags, names = fragmented_dim_tags, fragmented_names
+
+    gmsh.model.occ.synchronize()
+    return dim_tags, names
+
+
+def _add_named_physical_groups(dim_tags: typing.Sequence[tuple[int, int]], names: typing.Sequence[str]) -> None:
+    """Add one physical group per unique name and dimension.
+
+    :param dim_tags: Gmsh dimTags (dimension, tag)
+    :param names: physical group names, one per dimTag
+    """
+    groups: dict[tuple[int, str], set[int]] = {}
+    for (dimension, tag), name in zip(dim_tags, names, strict=True):
+        groups.setdefault((dimension, name), set()).add(tag)
+    for (dimension, name), tags in groups.items():
+        gmsh.model.addPhysicalGroup(dimension, sorted(tags), name=name)
+
+
+# Gmsh element type: (Abaqus element type, Abaqus node order, Exodus element type, Exodus node order). A node order
+# of None keeps the Gmsh node order.
+_gmsh_element_types: dict[int, tuple[str, list[int] | None, str, list[int] | None]] = {
+    2: ("CPS3", None, "TRI3", None),
+    3: ("CPS4", None, "QUAD4", None),
+    4: ("C3D4", None, "TETRA4", None),
+    5: ("C3D8", None, "HEX8", None),
+    6: ("C3D6", None, "WEDGE6", None),
+    7: ("C3D5", None, "PYRAMID5", None),
+    9: ("CPS6", None, "TRI6", None),
+    11: ("C3D10", [0, 1, 2, 3, 4, 5, 6, 7, 9, 8], "TETRA10", [0, 1, 2, 3, 4, 5, 6, 7, 9, 8]),
+    16: ("CPS8", None, "QUAD8", None),
+    17: (
+        "C3D20",
+        [0, 1, 2, 3, 4, 5, 6, 7, 8, 11, 13, 9, 16, 18, 19, 17, 10, 12, 14, 15],
+        "HEX20",
+        [0, 1, 2, 3, 4, 5, 6, 7, 8, 11, 13, 9, 10, 12, 14, 15, 16, 18, 19, 17],
+    ),
+    18: (
+        "C3D15",
+        [0, 1, 2, 3, 4, 5, 6, 9, 7, 12, 14, 13, 8, 10, 11],
+        "WEDGE15",
+        [0, 1, 2, 3, 4, 5, 6, 9, 7, 8, 10, 11, 12, 14, 13],
+    ),
+}
+
+
+def export(
+    input_file: str | pathlib.Path,
+    part_name: list[str] = parsers.export_defaults["part_name"],  # type: ignore[assignment]
+    element_type: list[str | None] = parsers.export_defaults["element_type"],  # type: ignore[assignment]
+    destination: str | pathlib.Path = parsers.export_defaults["destination"],  # type: ignore[assignment]
+    output_type: typing.Literal["abaqus", "genesis", "genesis-normal", "genesis-hdf5"] = parsers.export_defaults[  # type: ignore[assignment]
+        "output_type"
+    ],
+) -> None:
+    """Open a Gmsh ``*.msh`` file and export ``part_name`` prefixed entities as orphan meshes.
+
+    Node coordinates and element connectivity are read as arrays and written directly by
+    :mod:`turbo_turtle._mesh_writers`. Element types are replaced at write time.
+
+    :param input_file: Gmsh ``*.msh`` file to open that already contains meshed parts
+    :param part_name: list of physical group or entity name prefixes to export
+    :param element_type: list of element types, one per part name or one global replacement for every part name
+    :param destination: write output orphan mesh files to this output directory
+    :param output_type: String identifying genesis output type: abaqus, genesis (large format), genesis-normal,
+        genesis-hdf5
+
+    :raises RuntimeError: if the output type is not supported or if a part is not found
+    """
+    part_name = _mixed_utilities.cubit_part_names(part_name)
+    element_type = _mixed_utilities.validate_element_type(length_part_name=len(part_name), element_type=element_type)
+    input_file = _file_with_suffix(input_file, _mesh_suffixes)
+    destination = pathlib.Path(destination)
+    if output_type not in ("abaqus", "genesis", "genesis-normal"):
+        raise RuntimeError(f"Output type '{output_type}' is not supported by the Gmsh implementation")
+
+    with _call_session():
+        gmsh.open(str(input_file))
+        if output_type == "abaqus":
+            _export_abaqus_list(part_name, element_type, destination)
+        else:
+            output_file = destination / input_file.with_suffix(".g").name
+            _export_genesis(output_file, part_name, element_type, large=output_type == "genesis")
+
+
+def _mesh_nodes() -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Return a node tag to coordinate lookup table for the whole Gmsh mesh.
+
+    :returns: [max tag + 1] array of coordinate rows by node tag, [N, 3] array of node coordinates
+    """
+    node_tags, coordinates, _parametric_coordinates = gmsh.model.mesh.getNodes()
+    node_tags = numpy.asarray(node_tags, dtype=numpy.int64)
+    lookup = numpy.full(int(node_tags.max()) + 1 if node_tags.size else 1, -1, dtype=numpy.int64)
+    lookup[node_tags] = numpy.arange(node_tags.size)
+    return lookup, numpy.asarray(coordinates, dtype=float).reshape(-1, 3)
+
+
+def _part_blocks(
+    part_name: str, element_type: str | None, output_type: typing.Literal["abaqus", "genesis"]
+) -> list[tuple[str, str, numpy.ndarray, numpy.ndarray]]:
+    """Return the element blocks of a part, one block per Gmsh element type.
+
+    :param part_name: physical group or entity name prefix
+    :param element_type: element type replacement. If None, use the default element type of the output type.
+    :param output_type: output format for the default element type and node order
+
+    :returns: element blocks (name, element type, element tags, connectivity) for :mod:`turbo_turtle._mesh_writers`
+
+    :raises RuntimeError: if the part is not found or contains an unsupported Gmsh element type
+    """
+    element_tags: dict[int, list[numpy.ndarray]] = {}
+    node_tags: dict[int, list[numpy.ndarray]] = {}
+    for dimension, tag in _part_entities(part_name):
+        types, entity_element_tags, entity_node_tags = gmsh.model.mesh.getElements(dimension, tag)
+        for gmsh_type, tags, nodes in zip(types, entity_element_tags, entity_node_tags, strict=True):
+            element_tags.setdefault(int(gmsh_type), []).append(numpy.asarray(tags, dtype=numpy.int64))
+            node_tags.setdefault(int(gmsh_type), []).append(numpy.asarray(nodes, dtype=numpy.int64))
+
+    blocks: list[tuple[str, str, numpy.ndarray, numpy.ndarray]] = []
+    for gmsh_type, tags in element_tags.items():
+        if gmsh_type not in _gmsh_element_types:
+            raise RuntimeError(f"Gmsh element type '{gmsh_type}' of part '{part_name}' is not supported for export")
+        abaqus_type, abaqus_order, genesis_type, genesis_order = _gmsh_element_types[gmsh_type]
+        if output_type == "abaqus":
+            default_type, node_order = abaqus_type, abaqus_order
+        else:
+            default_type, node_order = genesis_type, genesis_order
+        tags_array = numpy.concatenate(tags)
+        connectivity = numpy.concatenate(node_tags[gmsh_type]).reshape(tags_array.size, -1)
+        if node_order is not None:
+            connectivity = connectivity[:, node_order]
+        blocks.append((part_name, element_type or default_type, tags_array, connectivity))
+    if not blocks:
+        raise RuntimeError(f"Could not find any elements for part '{part_name}'")
+    return blocks
+
+
+def _node_sets(exported_nodes: numpy.ndarray, maximum_dimension: int) -> list[tuple[str, numpy.ndarray]]:
+    """Return the named lower dimension physical group node sets restricted to the exported nodes.
+
+    :param exported_nodes: sorted [N] array of exported node tags
+    :param maximum_dimension: exported element dimension. Only physical groups of a lower dimension are returned.
+
+    :returns: node sets (name, node tags). Empty node sets are omitted.
+    """
+    node_sets = []
+    for dimension, tag in gmsh.model.getPhysicalGroups():
+        name = gmsh.model.getPhysicalName(dimension, tag)
+        if dimension >= maximum_dimension or not name:
+            continue
+        group_nodes, _coordinates = gmsh.model.mesh.getNodesForPhysicalGroup(dimension, tag)
+        group_nodes = numpy.intersect1d(numpy.asarray(group_nodes, dtype=numpy.int64), exported_nodes)
+        if group_nodes.size > 0:
+            node_sets.append((name, group_nodes))
+    return node_sets
+
+
+def _export_arrays(
+    blocks: typing.Sequence[tuple[str, str, numpy.ndarray, numpy.ndarray]], maximum_dimension: int
+) -> tuple[numpy.ndarray, numpy.ndarray, list[tuple[str, numpy.ndarray]]]:
+    """Return the nodes and node sets referenced by element blocks.
+
+    Planar meshes with a zero third coordinate are exported with two coordinates per node.
+
+    :param blocks: element blocks (name, element type, element tags, connectivity)
+    :param maximum_dimension: highest exported element dimension
+
+    :returns: sorted [N] array of node tags, [N, D] array of node coordinates, node sets (name, node tags)
+    """
+    lookup, coordinates = _mesh_nodes()
+    node_tags = numpy.unique(numpy.concatenate([block[3].ravel() for block in blocks]))
+    node_coordinates = coordinates[lookup[node_tags]]
+    if maximum_dimension < 3 and numpy.allclose(node_coordinates[:, 2], 0.0):
+        node_coordinates = node_coordinates[:, 0:2]
+    return node_tags, node_coordinates, _node_sets(node_tags, maximum_dimension)
+
+
+def _export_abaqus_list(part_name: list[str], element_type: list[str | None], destination: pathlib.Path) -> None:
+    """Export one Abaqus orphan mesh per part in the destination directory.
+
+    :param part_name: list of physical group or entity name prefixes
+    :param element_type: list of element type strings
+    :param destination: Parent directory for orphan mesh files
+    """
+    for name, element in zip(part_name, element_type, strict=True):
+        blocks = _part_blocks(name, element, "abaqus")
+        dimension = _part_entities(name)[0][0]
+        node_tags, coordinates, node_sets = _export_arrays(blocks, dimension)
+        output_file = (destination / name).with_suffix(".inp")
+        _mesh_writers.abaqus(output_file, node_tags, coordinates, blocks, node_sets=node_sets)
+
+
+def _export_genesis(
+    output_file: pathlib.Path, part_name: list[str], element_type: list[str | None], large: bool = True
+) -> None:
+    """Export all parts to a single genesis file with one element block per part and element type.
+
+    :param output_file: Genesis file to write
+    :param part_name: list of physical group or entity name prefixes
+    :param element_type: list of element type strings
+    :param large: write the large model format
+    """
+    blocks = []
+    dimension = 0
+    for name, element in zip(part_name, element_type, strict=True):
+        blocks.extend(_part_blocks(name, element, "genesis"))
+        dimension = max(dimension, _part_entities(name)[0][0])
+    node_tags, coordinates, node_sets = _export_arrays(blocks, dimension)
+    _mesh_writers.genesis(output_file, node_tags, coordinates, blocks, node_sets=node_sets, large=large)
 
 
 def image(
@@ -446,38 +1701,171 @@ def image(
     x_angle: float = parsers.image_defaults["x_angle"],  # type: ignore[assignment]
     y_angle: float = parsers.image_defaults["y_angle"],  # type: ignore[assignment]
     z_angle: float = parsers.image_defaults["z_angle"],  # type: ignore[assignment]
-    # ARG001: Argument retained for compatibility with ``_cubit_python.image`` API
-    image_size: tuple[int, int] = parsers.image_defaults["image_size"],  # type: ignore[assignment] # noqa: ARG001
+    image_size: tuple[int, int] = parsers.image_defaults["image_size"],  # type: ignore[assignment]
+    views: typing.Sequence[tuple[str | float, str | float, str | float, str | pathlib.Path]] | None = (
+        parsers.image_defaults["views"]  # type: ignore[assignment]
+    ),
+    offscreen: bool = parsers.image_defaults["offscreen"],  # type: ignore[assignment]
 ) -> None:
-    """Open a Gmsh geometry or mesh file and save an image.
+    """Open a Gmsh geometry or mesh file and save one image per view.
 
-    Uses the Gmsh ``write`` command, which accepts gif, jpg, tex, pdf, png, pgf, ps, ppm, svg, tikz, and yuv file
-    extensions.
+    The input file is opened once for all views. With a graphical interface context, uses the Gmsh ``write`` command,
+    which accepts gif, jpg, tex, pdf, png, pgf, ps, ppm, svg, tikz, and yuv file extensions. Without a display, or when
+    ``offscreen`` is requested, renders the model surfaces with
+    :meth:`turbo_turtle._gmsh_python._render_offscreen`.
 
     :param str input_file: Gmsh input file to open
     :param str output_file: Screenshot file to write
     :param float x_angle: Rotation about 'world' X-axis in degrees
     :param float y_angle: Rotation about 'world' Y-axis in degrees
     :param float z_angle: Rotation about 'world' Z-axis in degrees
-    :param tuple image_size: Image size in pixels (width, height)
+    :param tuple image_size: Image size in pixels (width, height). Unused by the graphical interface context.
+    :param views: Additional view tuples (x angle, y angle, z angle, output file)
+    :param offscreen: Render without a graphical interface context
     """
-    # Universally required setup
-    gmsh.initialize()
-    gmsh.logger.start()
+    with _call_session():
+        # Input/Output setup
+        input_file = pathlib.Path(input_file)
+        all_views = _utilities.image_views(x_angle, y_angle, z_angle, output_file, views)
 
-    # Input/Output setup
-    input_file = pathlib.Path(input_file)
-    output_file = pathlib.Path(output_file)
+        gmsh.open(str(input_file))
 
-    gmsh.open(str(input_file))
+        if offscreen or not _display_available():
+            _render_offscreen(all_views, image_size)
+        else:
+            gmsh.fltk.initialize()
+            gmsh.option.setNumber("General.Trackball", 0)
+            for view_x_angle, view_y_angle, view_z_angle, view_output_file in all_views:
+                gmsh.option.setNumber("General.RotationX", view_x_angle)
+                gmsh.option.setNumber("General.RotationY", view_y_angle)
+                gmsh.option.setNumber("General.RotationZ", view_z_angle)
+                gmsh.write(str(view_output_file))
 
-    gmsh.fltk.initialize()
-    gmsh.option.setNumber("General.Trackball", 0)
-    gmsh.option.setNumber("General.RotationX", x_angle)
-    gmsh.option.setNumber("General.RotationY", y_angle)
-    gmsh.option.setNumber("General.RotationZ", z_angle)
 
-    # Output and cleanup
-    gmsh.write(str(output_file))
-    gmsh.logger.stop()
-    gmsh.finalize()
+def _display_available() -> bool:
+    """Return True if a graphical interface context can be created.
+
+    :returns: display availability
+    """
+    if sys.platform in ("win32", "darwin"):
+        return True
+    return bool(os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
+
+def _surface_polygons() -> tuple[numpy.ndarray, list[numpy.ndarray]]:
+    """Return the node coordinates and the visible surface polygons of the current Gmsh model.
+
+    Geometry without a mesh receives a 2D visualization mesh. Surface polygons are the 2D elements and the boundary
+    faces of the 3D elements.
+
+    :returns: [N, 3] array of node coordinates, list of [M, K] arrays of node coordinate row indices, one per polygon
+        vertex count
+    """
+    if not any(len(tags) for tags in gmsh.model.mesh.getElements(2)[1]) and not any(
+        len(tags) for tags in gmsh.model.mesh.getElements(3)[1]
+    ):
+        gmsh.model.mesh.generate(2)
+    lookup, coordinates = _mesh_nodes()
+
+    faces: dict[int, list[numpy.ndarray]] = {}
+    element_types, _element_tags, element_node_tags = gmsh.model.mesh.getElements(2)
+    for element_type, node_tags in zip(element_types, element_node_tags, strict=True):
+        _name, _dimension, _order, number_of_nodes, _coordinates, primary_nodes = gmsh.model.mesh.getElementProperties(
+            element_type
+        )
+        element_faces = numpy.asarray(node_tags, dtype=numpy.int64).reshape(-1, number_of_nodes)[:, 0:primary_nodes]
+        faces.setdefault(primary_nodes, []).append(element_faces)
+    for element_type in gmsh.model.mesh.getElementTypes(3):
+        for face_type in (3, 4):
+            face_nodes = numpy.asarray(gmsh.model.mesh.getElementFaceNodes(element_type, face_type), dtype=numpy.int64)
+            if face_nodes.size == 0:
+                continue
+            face_nodes = face_nodes.reshape(-1, face_type)
+            # Boundary faces belong to a single element
+            _unique, index, counts = numpy.unique(
+                numpy.sort(face_nodes, axis=1), axis=0, return_index=True, return_counts=True
+            )
+            faces.setdefault(face_type, []).append(face_nodes[index[counts == 1]])
+    polygons: list[numpy.ndarray] = [lookup[numpy.concatenate(arrays)] for arrays in faces.values()]
+    return coordinates, polygons
+
+
+def _rotation_matrix(x_angle: float, y_angle: float, z_angle: float) -> numpy.ndarray:
+    """Return the rotation matrix of successive rotations about the 'world' X, Y, and Z axes.
+
+    :param x_angle: Rotation about 'world' X-axis in degrees
+    :param y_angle: Rotation about 'world' Y-axis in degrees
+    :param z_angle: Rotation about 'world' Z-axis in degrees
+
+    :returns: [3, 3] rotation matrix
+    """
+    x_radians, y_radians, z_radians = numpy.radians([x_angle, y_angle, z_angle])
+    x_rotation = numpy.array(
+        [
+            [1.0, 0.0, 0.0],
+            [0.0, math.cos(x_radians), -math.sin(x_radians)],
+            [0.0, math.sin(x_radians), math.cos(x_radians)],
+        ]
+    )
+    y_rotation = numpy.array(
+        [
+            [math.cos(y_radians), 0.0, math.sin(y_radians)],
+            [0.0, 1.0, 0.0],
+            [-math.sin(y_radians), 0.0, math.cos(y_radians)],
+        ]
+    )
+    z_rotation = numpy.array(
+        [
+            [math.cos(z_radians), -math.sin(z_radians), 0.0],
+            [math.sin(z_radians), math.cos(z_radians), 0.0],
+            [0.0, 0.0, 1.0],
+        ]
+    )
+    return z_rotation @ y_rotation @ x_rotation
+
+
+def _render_offscreen(
+    views: typing.Sequence[tuple[float, float, float, pathlib.Path]],
+    image_size: tuple[int, int] = parsers.image_defaults["image_size"],  # type: ignore[assignment]
+) -> None:
+    """Render the current Gmsh model surfaces to image files without a graphical interface context.
+
+    The surface polygons are collected once and drawn for every view as a flat shaded orthographic projection with the
+    matplotlib Agg renderer. The output file extension selects the image format, e.g. png, svg, or pdf.
+
+    :param views: view tuples (x angle, y angle, z angle, output file)
+    :param image_size: Image size in pixels (width, height)
+    """
+    coordinates, polygons = _surface_polygons()
+    dpi = 100
+    for x_angle, y_angle, z_angle, output_file in views:
+        rotated = coordinates @ _rotation_matrix(x_angle, y_angle, z_angle).T
+        figure = matplotlib.figure.Figure(figsize=(image_size[0] / dpi, image_size[1] / dpi), dpi=dpi)
+        axes = figure.add_axes((0.0, 0.0, 1.0, 1.0))
+        vertices_list = []
+        depths = []
+        shades = []
+        for indices in polygons:
+            points = rotated[indices]
+            normals = numpy.cross(points[:, 1] - points[:, 0], points[:, 2] - points[:, 0])
+            lengths = numpy.linalg.norm(normals, axis=1)
+            lengths[lengths == 0.0] = 1.0
+            vertices_list.extend(points[:, :, 0:2])
+            depths.append(points[:, :, 2].mean(axis=1))
+            shades.append(numpy.abs(normals[:, 2]) / lengths)
+        if vertices_list:
+            # Painter's algorithm: draw the farthest polygons first
+            order = numpy.argsort(numpy.concatenate(depths))
+            shade = 0.35 + 0.6 * numpy.concatenate(shades)[order]
+            colors = numpy.column_stack((0.2 * shade, 0.5 * shade, 0.9 * shade, numpy.ones_like(shade)))
+            collection = matplotlib.collections.PolyCollection(
+                [vertices_list[position] for position in order],
+                facecolors=colors,
+                edgecolors=(0.0, 0.0, 0.0, 0.6),
+                linewidths=0.2,
+            )
+            axes.add_collection(collection)
+            axes.autoscale_view()
+        axes.set_aspect("equal", adjustable="datalim")
+        axes.set_axis_off()
+        figure.savefig(output_file)
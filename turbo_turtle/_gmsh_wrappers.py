@@ -12,7 +12,6 @@ The ``command`` argument is required for compatibility with :mod:`turbo_turtle._
 """
 
 import argparse
-import typing
 
 from turbo_turtle import _gmsh_python
 
@@ -87,12 +86,43 @@ def sphere(args: argparse.Namespace, command: str) -> None:  # noqa: ARG001
     )
 
 
-def partition(args: argparse.Namespace, command: str) -> typing.NoReturn:  # noqa: ARG001
-    raise RuntimeError("partition subcommand is not yet implemented")
+def partition(args: argparse.Namespace, command: str) -> None:  # noqa: ARG001
+    """Python 3 wrapper around Gmsh calling :meth:`turbo_turtle._gmsh_python.partition`.
+
+    Unpack the argument namespace into the full function interface
+
+    :param argparse.Namespace args: namespace of parsed arguments
+    :param str command: gmsh executable path, unused. Kept for API compatibility with
+        :meth:`turbo_turtle._abaqus_wrappers`
+    """
+    _gmsh_python.partition(
+        args.input_file,
+        output_file=args.output_file,
+        center=args.center,
+        xvector=args.xvector,
+        zvector=args.zvector,
+        part_name=args.part_name,
+        big_number=args.big_number,
+    )
 
 
-def sets(args: argparse.Namespace, command: str) -> typing.NoReturn:  # noqa: ARG001
-    raise RuntimeError("sets subcommand is not yet implemented")
+def sets(args: argparse.Namespace, command: str) -> None:  # noqa: ARG001
+    """Python 3 wrapper around Gmsh calling :meth:`turbo_turtle._gmsh_python.sets`.
+
+    Unpack the argument namespace into the full function interface
+
+    :param argparse.Namespace args: namespace of parsed arguments
+    :param str command: gmsh executable path, unused. Kept for API compatibility with
+        :meth:`turbo_turtle._abaqus_wrappers`
+    """
+    _gmsh_python.sets(
+        args.input_file,
+        output_file=args.output_file,
+        part_name=args.part_name,
+        face_sets=args.face_sets,
+        edge_sets=args.edge_sets,
+        vertex_sets=args.vertex_sets,
+    )
 
 
 def mesh(args: argparse.Namespace, command: str) -> None:  # noqa: ARG001
@@ -112,15 +142,52 @@ def mesh(args: argparse.Namespace, command: str) -> None:  # noqa: ARG001
         part_name=args.part_name,
         global_seed=args.global_seed,
         edge_seeds=args.edge_seeds,
+        num_threads=args.num_threads,
+        algorithm_2d=args.algorithm_2d,
+        algorithm_3d=args.algorithm_3d,
+        distance_refinements=args.distance_refinements,
+        boundary_layers=args.boundary_layers,
+        curvature_elements=args.curvature_elements,
+        verbosity=args.verbosity,
+        log_file=args.log_file,
     )
 
 
-def merge(args: argparse.Namespace, command: str) -> typing.NoReturn:  # noqa: ARG001
-    raise RuntimeError("merge subcommand is not yet implemented")
+def merge(args: argparse.Namespace, command: str) -> None:  # noqa: ARG001
+    """Python 3 wrapper around Gmsh calling :meth:`turbo_turtle._gmsh_python.merge`.
+
+    Unpack the argument namespace into the full function interface
+
+    :param argparse.Namespace args: namespace of parsed arguments
+    :param str command: gmsh executable path, unused. Kept for API compatibility with
+        :meth:`turbo_turtle._abaqus_wrappers`
+    """
+    _gmsh_python.merge(
+        args.input_file,
+        args.output_file,
+        merged_model_name=args.merged_model_name,
+        part_name=args.part_name,
+        fragment=args.fragment,
+        jobs=args.jobs,
+    )
 
 
-def export(args: argparse.Namespace, command: str) -> typing.NoReturn:  # noqa: ARG001
-    raise RuntimeError("export subcommand is not yet implemented")
+def export(args: argparse.Namespace, command: str) -> None:  # noqa: ARG001
+    """Python 3 wrapper around Gmsh calling :meth:`turbo_turtle._gmsh_python.export`.
+
+    Unpack the argument namespace into the full function interface
+
+    :param argparse.Namespace args: namespace of parsed arguments
+    :param str command: gmsh executable path, unused. Kept for API compatibility with
+        :meth:`turbo_turtle._abaqus_wrappers`
+    """
+    _gmsh_python.export(
+        args.input_file,
+        part_name=args.part_name,
+        element_type=args.element_type,
+        destination=args.destination,
+        output_type=args.output_type,
+    )
 
 
 def image(args: argparse.Namespace, command: str) -> None:  # noqa: ARG001
@@ -139,4 +206,6 @@ def image(args: argparse.Namespace, command: str) -> None:  # noqa: ARG001
         y_angle=args.y_angle,
         z_angle=args.z_angle,
         image_size=args.image_size,
+        views=args.views,
+        offscreen=args.offscreen,
     )
@@ -0,0 +1,368 @@
+"""Write orphan mesh files from node and element arrays.
+
+The writers are vectorized over NumPy arrays and write in buffered chunks. They do not require a third-party mesh or
+netCDF library.
+
+Element blocks are tuples of ``(name, element_type, element_tags, connectivity)``, where ``connectivity`` is an [M, K]
+array of node tags already ordered for the output format. Node sets are tuples of ``(name, node_tags)``.
+"""
+
+import pathlib
+import struct
+import typing
+
+import numpy
+
+_chunk_size = 100_000
+_abaqus_maximum_entries = 16
+
+_netcdf_absent = b"\x00" * 8
+_netcdf_dimension = 10
+_netcdf_variable = 11
+_netcdf_attribute = 12
+_netcdf_types = {
+    numpy.dtype("S1"): 2,
+    numpy.dtype(">i4"): 4,
+    numpy.dtype(">f4"): 5,
+    numpy.dtype(">f8"): 6,
+}
+_exodus_version = numpy.array([8.03], dtype=">f4")
+_exodus_name_length = 33
+_exodus_line_length = 81
+
+
+def _row_format(entries: typing.Sequence[str], maximum_entries: int | None = None) -> str:
+    """Return a printf style data line format with optional continuation lines.
+
+    :param entries: printf style format per entry
+    :param maximum_entries: maximum number of entries per line. None writes all entries on a single line.
+
+    :returns: data line format, including the trailing newline
+    """
+    if maximum_entries is None:
+        maximum_entries = len(entries)
+    lines = [", ".join(entries[start : start + maximum_entries]) for start in range(0, len(entries), maximum_entries)]
+    return ",\n".join(lines) + "\n"
+
+
+def _write_rows(stream: typing.TextIO, row_format: str, rows: numpy.ndarray, chunk_size: int = _chunk_size) -> None:
+    """Write array rows with a single string format operation per chunk.
+
+    :param stream: open text stream
+    :param row_format: printf style format for a single row. See :meth:`turbo_turtle._mesh_writers._row_format`.
+    :param rows: [N, K] array of rows
+    :param chunk_size: number of rows per write
+    """
+    rows = numpy.asarray(rows)
+    for start in range(0, rows.shape[0], chunk_size):
+        chunk = rows[start : start + chunk_size]
+        stream.write((row_format * chunk.shape[0]) % tuple(chunk.ravel().tolist()))
+
+
+def _write_list(stream: typing.TextIO, values: numpy.ndarray, maximum_entries: int = _abaqus_maximum_entries) -> None:
+    """Write a list of integers with a fixed number of entries per line.
+
+    :param stream: open text stream
+    :param values: [N] array of integers
+    :param maximum_entries: number of entries per line
+    """
+    values = numpy.asarray(values, dtype=numpy.int64)
+    full_rows = values.size // maximum_entries * maximum_entries
+    _write_rows(stream, _row_format(["%d"] * maximum_entries), values[:full_rows].reshape(-1, maximum_entries))
+    if values.size > full_rows:
+        remainder = values[full_rows:]
+        _write_rows(stream, _row_format(["%d"] * remainder.size), remainder.reshape(1, -1))
+
+
+def abaqus(
+    output_file: str | pathlib.Path,
+    node_tags: numpy.ndarray,
+    coordinates: numpy.ndarray,
+    blocks: typing.Sequence[tuple[str, str, numpy.ndarray, numpy.ndarray]],
+    node_sets: typing.Sequence[tuple[str, numpy.ndarray]] = (),
+) -> None:
+    """Write an Abaqus orphan mesh file.
+
+    :param output_file: Abaqus ``*.inp`` file to write
+    :param node_tags: [N] array of node tags
+    :param coordinates: [N, D] array of node coordinates
+    :param blocks: element blocks (name, element type, element tags, connectivity)
+    :param node_sets: node sets (name, node tags)
+    """
+    node_rows = numpy.column_stack((node_tags, coordinates))
+    with pathlib.Path(output_file).open("w") as stream:
+        stream.write("*NODE\n")
+        _write_rows(stream, _row_format(["%d"] + ["%.16g"] * coordinates.shape[1]), node_rows)
+        for name, element_type, element_tags, connectivity in blocks:
+            stream.write(f"*ELEMENT, TYPE={element_type}, ELSET={name}\n")
+            element_rows = numpy.column_stack((element_tags, connectivity)).astype(numpy.int64)
+            row_format = _row_format(["%d"] * element_rows.shape[1], _abaqus_maximum_entries)
+            _write_rows(stream, row_format, element_rows)
+        for name, tags in node_sets:
+            stream.write(f"*NSET, NSET={name}\n")
+            _write_list(stream, tags)
+
+
+def _netcdf_integer(value: int) -> bytes:
+    """Return a big endian 32-bit netCDF integer.
+
+    :param value: integer value
+
+    :returns: packed bytes
+    """
+    return struct.pack(">i", value)
+
+
+def _netcdf_pad(data: bytes) -> bytes:
+    """Return data padded with null bytes to a four byte boundary.
+
+    :param data: bytes to pad
+
+    :returns: padded bytes
+    """
+    return data + b"\x00" * (-len(data) % 4)
+
+
+def _netcdf_name(name: str) -> bytes:
+    """Return a netCDF name: the length followed by the padded name.
+
+    :param name: netCDF dimension, variable, or attribute name
+
+    :returns: packed bytes
+    """
+    encoded = name.encode()
+    return _netcdf_integer(len(encoded)) + _netcdf_pad(encoded)
+
+
+def _check_int32(value: numpy.ndarray, description: str) -> None:
+    """Raise an exception if any value does not fit in a 32-bit integer.
+
+    :param value: integer array
+    :param description: value description for the error message
+
+    :raises RuntimeError: if any value does not fit in a 32-bit integer
+    """
+    limits = numpy.iinfo(numpy.int32)
+    if value.size and (value.min() < limits.min or value.max() > limits.max):
+        raise RuntimeError(f"The {description} values '{value.min()}' to '{value.max()}' do not fit in 32-bit integers")
+
+
+def _netcdf_array(value: str | numpy.ndarray) -> numpy.ndarray:
+    """Return a netCDF compatible big endian array.
+
+    Integer arrays are written as 32-bit integers.
+
+    :param value: string or array
+
+    :returns: array with a dtype found in the netCDF type map
+
+    :raises RuntimeError: if an integer value does not fit in a 32-bit integer
+    """
+    if isinstance(value, str):
+        return numpy.frombuffer(value.encode(), dtype="S1")
+    value = numpy.asarray(value)
+    if value.dtype.kind == "S":
+        return value.astype("S1")
+    if value.dtype.kind in "iu":
+        _check_int32(value, "netCDF integer")
+        return value.astype(">i4")
+    return value.astype(value.dtype.newbyteorder(">"))
+
+
+def _netcdf_attributes(attributes: dict[str, str | numpy.ndarray]) -> bytes:
+    """Return a packed netCDF attribute list.
+
+    :param attributes: map of attribute name to string or array value
+
+    :returns: packed bytes
+    """
+    if not attributes:
+        return _netcdf_absent
+    header = _netcdf_integer(_netcdf_attribute) + _netcdf_integer(len(attributes))
+    for name, value in attributes.items():
+        array = _netcdf_array(value)
+        header += _netcdf_name(name) + _netcdf_integer(_netcdf_types[array.dtype]) + _netcdf_integer(array.size)
+        header += _netcdf_pad(array.tobytes())
+    return header
+
+
+def _netcdf(
+    output_file: str | pathlib.Path,
+    dimensions: dict[str, int],
+    attributes: dict[str, str | numpy.ndarray],
+    variables: typing.Sequence[tuple[str, tuple[str, ...], dict[str, str | numpy.ndarray], numpy.ndarray]],
+    large: bool = True,
+) -> None:
+    """Write a netCDF classic or 64-bit offset file.
+
+    A dimension of length zero is the unlimited record dimension. Record variables are written without records.
+
+    :param output_file: netCDF file to write
+    :param dimensions: map of dimension name to length
+    :param attributes: map of global attribute name to string or array value
+    :param variables: variables (name, dimension names, attributes, data)
+    :param large: write the 64-bit offset format instead of the classic format
+    """
+    dimension_ids = {name: number for number, name in enumerate(dimensions)}
+    offset_format = ">q" if large else ">i"
+
+    arrays = [_netcdf_array(data) for _name, _dimensions, _attributes, data in variables]
+    records = [any(dimensions[dimension] == 0 for dimension in names) for _name, names, _attributes, _data in variables]
+    sizes = []
+    for (_name, names, _attributes, _data), array in zip(variables, arrays, strict=True):
+        shape = [dimensions[dimension] for dimension in names if dimensions[dimension] != 0]
+        sizes.append(-(-int(numpy.prod(shape, dtype=numpy.int64)) * array.dtype.itemsize // 4) * 4)
+
+    def variable_header(begins: typing.Sequence[int]) -> bytes:
+        header = _netcdf_integer(_netcdf_variable) + _netcdf_integer(len(variables))
+        for (name, names, variable_attributes, _data), array, size, begin in zip(
+            variables, arrays, sizes, begins, strict=True
+        ):
+            header += _netcdf_name(name) + _netcdf_integer(len(names))
+            header += b"".join(_netcdf_integer(dimension_ids[dimension]) for dimension in names)
+            header += _netcdf_attributes(variable_attributes)
+            header += _netcdf_integer(_netcdf_types[array.dtype]) + _netcdf_integer(size)
+            header += struct.pack(offset_format, begin)
+        return header
+
+    header = b"CDF" + (b"\x02" if large else b"\x01") + _netcdf_integer(0)
+    header += _netcdf_integer(_netcdf_dimension) + _netcdf_integer(len(dimensions))
+    header += b"".join(_netcdf_name(name) + _netcdf_integer(length) for name, length in dimensions.items())
+    header += _netcdf_attributes(attributes)
+
+    # Offsets are fixed width, so the header length does not depend on the offset values
+    offset = len(header) + len(variable_header([0] * len(variables)))
+    begins = []
+    for size, record in zip(sizes, records, strict=True):
+        begins.append(offset)
+        if not record:
+            offset += size
+    # Record variables begin after all non-record variables
+    begins = [offset if record else begin for begin, record in zip(begins, records, strict=True)]
+
+    with pathlib.Path(output_file).open("wb") as stream:
+        stream.write(header + variable_header(begins))
+        for array, size, record in zip(arrays, sizes, records, strict=True):
+            if record:
+                continue
+            data = array.tobytes()
+            stream.write(data + b"\x00" * (size - len(data)))
+
+
+def _exodus_names(names: typing.Sequence[str]) -> numpy.ndarray:
+    """Return an Exodus character array of names.
+
+    :param names: names to store
+
+    :returns: [N, len_name] character array
+    """
+    array = numpy.zeros((len(names), _exodus_name_length), dtype="S1")
+    for row, name in enumerate(names):
+        encoded = name.encode()[: _exodus_name_length - 1]
+        array[row, : len(encoded)] = numpy.frombuffer(encoded, dtype="S1")
+    return array
+
+
+def genesis(
+    output_file: str | pathlib.Path,
+    node_tags: numpy.ndarray,
+    coordinates: numpy.ndarray,
+    blocks: typing.Sequence[tuple[str, str, numpy.ndarray, numpy.ndarray]],
+    node_sets: typing.Sequence[tuple[str, numpy.ndarray]] = (),
+    large: bool = True,
+    title: str = "turbo-turtle",
+) -> None:
+    """Write an Exodus II genesis mesh file.
+
+    Node and element tags are preserved in the node and element number maps. Blocks and node sets are numbered in
+    order, starting from one.
+
+    :param output_file: genesis ``*.g`` file to write
+    :param node_tags: [N] array of node tags
+    :param coordinates: [N, D] array of node coordinates
+    :param blocks: element blocks (name, element type, element tags, connectivity)
+    :param node_sets: node sets (name, node tags)
+    :param large: write the large model format, with separate coordinate arrays and 64-bit offsets
+    :param title: database title
+
+    :raises RuntimeError: if a node or element tag does not fit in the 32-bit integer maps
+    """
+    node_tags = numpy.asarray(node_tags, dtype=numpy.int64)
+    # Exodus maps are written as 32-bit integers with ``int64_status`` zero
+    _check_int32(node_tags, "node tag")
+    for _name, _type, element_tags, _connectivity in blocks:
+        _check_int32(numpy.asarray(element_tags), "element tag")
+    local_index = numpy.zeros(int(node_tags.max()) + 1, dtype=numpy.int64)
+    local_index[node_tags] = numpy.arange(1, node_tags.size + 1)
+    dimension = coordinates.shape[1]
+
+    dimensions = {
+        "len_string": _exodus_name_length,
+        "len_line": _exodus_line_length,
+        "four": 4,
+        "len_name": _exodus_name_length,
+        "time_step": 0,
+        "num_dim": dimension,
+        "num_nodes": node_tags.size,
+        "num_elem": sum(element_tags.size for _name, _type, element_tags, _connectivity in blocks),
+        "num_el_blk": len(blocks),
+    }
+    if node_sets:
+        dimensions["num_node_sets"] = len(node_sets)
+    attributes: dict[str, str | numpy.ndarray] = {
+        "api_version": _exodus_version,
+        "version": _exodus_version,
+        "floating_point_word_size": numpy.array([8]),
+        "file_size": numpy.array([1 if large else 0]),
+        "maximum_name_length": numpy.array([_exodus_name_length - 1]),
+        "int64_status": numpy.array([0]),
+        "title": title[: _exodus_line_length - 1],
+    }
+
+    variables: list[tuple[str, tuple[str, ...], dict[str, str | numpy.ndarray], numpy.ndarray]] = [
+        ("time_whole", ("time_step",), {}, numpy.zeros(0, dtype=">f8")),
+        ("eb_status", ("num_el_blk",), {}, numpy.ones(len(blocks), dtype=">i4")),
+        ("eb_prop1", ("num_el_blk",), {"name": "ID"}, numpy.arange(1, len(blocks) + 1)),
+        ("eb_names", ("num_el_blk", "len_name"), {}, _exodus_names([block[0] for block in blocks])),
+    ]
+    if node_sets:
+        variables.extend(
+            [
+                ("ns_status", ("num_node_sets",), {}, numpy.ones(len(node_sets), dtype=">i4")),
+                ("ns_prop1", ("num_node_sets",), {"name": "ID"}, numpy.arange(1, len(node_sets) + 1)),
+                ("ns_names", ("num_node_sets", "len_name"), {}, _exodus_names([name for name, _tags in node_sets])),
+            ]
+        )
+    if large:
+        for axis, name in zip(range(dimension), ("coordx", "coordy", "coordz"), strict=False):
+            variables.append((name, ("num_nodes",), {}, coordinates[:, axis].astype(">f8")))
+    else:
+        variables.append(("coord", ("num_dim", "num_nodes"), {}, coordinates.T.astype(">f8")))
+    variables.extend(
+        [
+            ("coor_names", ("num_dim", "len_name"), {}, _exodus_names(["x", "y", "z"][:dimension])),
+            ("node_num_map", ("num_nodes",), {}, node_tags),
+            (
+                "elem_num_map",
+                ("num_elem",),
+                {},
+                numpy.concatenate([element_tags for _name, _type, element_tags, _connectivity in blocks]),
+            ),
+        ]
+    )
+    for number, (_name, element_type, element_tags, connectivity) in enumerate(blocks, start=1):
+        dimensions[f"num_el_in_blk{number}"] = element_tags.size
+        dimensions[f"num_nod_per_el{number}"] = connectivity.shape[1]
+        variables.append(
+            (
+                f"connect{number}",
+                (f"num_el_in_blk{number}", f"num_nod_per_el{number}"),
+                {"elem_type": element_type},
+                local_index[connectivity],
+            )
+        )
+    for number, (_name, tags) in enumerate(node_sets, start=1):
+        dimensions[f"num_nod_ns{number}"] = tags.size
+        variables.append((f"node_ns{number}", (f"num_nod_ns{number}",), {}, local_index[tags]))
+
+    _netcdf(output_file, dimensions, attributes, variables, large=large)
@@ -10,7 +10,7 @@ _abaqus_python_abspath = _abaqus_python_parent_abspath / "turbo_turtle_abaqus"
 _installed_docs_index = _project_root_abspath / "docs/index.html"
 _default_abaqus_options = ["abaqus", "abq2025"]
 _default_cubit_options = ["cubit"]
-_backend_choices = ["abaqus", "cubit", "gmsh"]
+_backend_choices = ["abaqus", "cubit", "gmsh", "cubit-journal"]
 _default_backend = _backend_choices[0]
 _tutorials_directory = _project_root_abspath / "tutorials"
 _fetch_exclude_patterns = ["__pycache__", ".pyc", ".sconf_temp", ".sconsign.dblite", "config.log"]
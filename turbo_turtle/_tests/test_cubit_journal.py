@@ -0,0 +1,395 @@
+"""Test :mod:`turbo_turtle._cubit_journal`."""
+
+import contextlib
+import pathlib
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from turbo_turtle import _cubit_journal
+
+does_not_raise = contextlib.nullcontext()
+
+
+def test_journal() -> None:
+    journal = _cubit_journal.Journal()
+    journal.command("reset")
+    assert journal.new_id("vertex") == "{vertex1}"
+    assert journal.new_id("vertex") == "{vertex2}"
+    assert journal.new_id("curve") == "{curve1}"
+    assert journal.text() == ('reset\n#{vertex1 = Id("vertex")}\n#{vertex2 = Id("vertex")}\n#{curve1 = Id("curve")}\n')
+
+
+def test_journal_if_volumes() -> None:
+    journal = _cubit_journal.Journal()
+    with journal.if_volumes('volume with name "part*"'):
+        journal.command('mesh volume with name "part*"')
+    with journal.if_volumes("volume all"):
+        pass
+    assert journal.commands == [
+        'group "turbo_turtle_volumes1" add volume with name "part*"',
+        '#{volumes1 = NumTypeInGroup("turbo_turtle_volumes1", "volume")}',
+        'delete group with name "turbo_turtle_volumes1"',
+        "#{if(volumes1 > 0)}",
+        'mesh volume with name "part*"',
+        "#{endif}",
+        'group "turbo_turtle_volumes2" add volume all',
+        '#{volumes2 = NumTypeInGroup("turbo_turtle_volumes2", "volume")}',
+        'delete group with name "turbo_turtle_volumes2"',
+        "#{if(volumes2 > 0)}",
+        "#{endif}",
+    ]
+
+
+journal_run = {
+    "success": ("Journaling...\nWARNING: Volume 1 is not meshed\n", does_not_raise, ["run", "after"]),
+    "journal error": (
+        "Journaling...\nERROR: Cannot open file 'input.cub'\n",
+        pytest.raises(RuntimeError, match="Cannot open file"),
+        ["run"],
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "output, outcome, expected_actions",
+    journal_run.values(),
+    ids=journal_run.keys(),
+)
+def test_journal_run(
+    output: str, outcome: contextlib.nullcontext | pytest.RaisesExc, expected_actions: list[str]
+) -> None:
+    actions = []
+    journal = _cubit_journal.Journal()
+    journal.command("reset")
+    journal.after.append(lambda: actions.append("after"))
+
+    def run_command(_command: str, **_kwargs) -> str:
+        actions.append("run")
+        return output
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        journal_file = pathlib.Path(temporary_directory) / "model.cub"
+        with patch("turbo_turtle._utilities.run_command", side_effect=run_command) as mock_run, outcome:
+            try:
+                journal.run(journal_file, "cubit")
+            finally:
+                pass
+        expected_file = journal_file.with_suffix(".jou")
+        assert expected_file.read_text() == "reset\n"
+    mock_run.assert_called_once_with(f"cubit -batch -nojournal {expected_file}", capture_stderr=True)
+    assert actions == expected_actions
+
+
+volumes = {
+    "all": (None, 'volume with name "part*"'),
+    "sheet bodies": (True, 'volume with name "part*" and is_sheetbody'),
+    "volumes": (False, 'volume with name "part*" and not is_sheetbody'),
+}
+
+
+@pytest.mark.parametrize(
+    "sheet_body, expected",
+    volumes.values(),
+    ids=volumes.keys(),
+)
+def test_volumes(sheet_body: bool | None, expected: str) -> None:
+    assert _cubit_journal._volumes("part", sheet_body=sheet_body) == expected
+
+
+arc = {
+    "ordered": ((1.0, -1.0, 0.0), (1.0, 1.0, 0.0), "create vertex 1.0 -1.0 0.0"),
+    "reversed": ((1.0, 1.0, 0.0), (1.0, -1.0, 0.0), "create vertex 1.0 -1.0 0.0"),
+}
+
+
+@pytest.mark.parametrize(
+    "point1, point2, first_arc_vertex",
+    arc.values(),
+    ids=arc.keys(),
+)
+def test_arc(point1: tuple, point2: tuple, first_arc_vertex: str) -> None:
+    journal = _cubit_journal.Journal()
+    curve = _cubit_journal._arc(journal, (0.0, 0.0, 0.0), point1, point2)
+    assert curve == "{curve1}"
+    assert journal.commands[2] == first_arc_vertex
+    assert "create curve arc center vertex {vertex1} {vertex2} {vertex3} normal 0 0 1" in journal.commands
+    assert journal.commands[-1] == "delete vertex {vertex1}"
+
+
+spline = {
+    "too few points": ([(0.0, 0.0)], pytest.raises(RuntimeError)),
+    "two points": ([(0.0, 0.0), (1.0, 0.0)], does_not_raise),
+}
+
+
+@pytest.mark.parametrize(
+    "coordinates, outcome",
+    spline.values(),
+    ids=spline.keys(),
+)
+def test_spline(coordinates: list, outcome: contextlib.nullcontext | pytest.RaisesExc) -> None:
+    journal = _cubit_journal.Journal()
+    with outcome:
+        try:
+            assert _cubit_journal._spline(journal, coordinates) == "{curve1}"
+            assert "create curve spline vertex {vertex1} {vertex2} delete" in journal.commands
+        finally:
+            pass
+
+
+rename_and_sweep = {
+    "revolved": (False, 360.0, ["sweep surface {surface1} axis 0.0 0.0 0.0 0 1 0 angle 360.0 merge"]),
+    "planar": (True, 360.0, []),
+    "axisymmetric": (False, 0.0, []),
+}
+
+
+@pytest.mark.parametrize(
+    "planar, revolution_angle, sweep",
+    rename_and_sweep.values(),
+    ids=rename_and_sweep.keys(),
+)
+def test_rename_and_sweep(planar: bool, revolution_angle: float, sweep: list[str]) -> None:
+    journal = _cubit_journal.Journal()
+    _cubit_journal._rename_and_sweep(
+        journal, "{surface1}", "{volume1}", "part-name", planar=planar, revolution_angle=revolution_angle
+    )
+    regularize = ["regularize volume {volume1}"] if sweep else []
+    assert journal.commands == [*sweep, *regularize, 'volume {volume1} name "part_name"']
+
+
+def test_cylinder() -> None:
+    journal = _cubit_journal.Journal()
+    _cubit_journal.cylinder(journal, 1.0, 2.0, 1.0, "cylinder", part_name="cylinder-part")
+    assert journal.commands[0] == "reset"
+    assert sum(command.startswith("create curve vertex") for command in journal.commands) == 4
+    assert "create surface curve {curve1} {curve2} {curve3} {curve4}" in journal.commands
+    assert 'volume {volume1} name "cylinder_part"' in journal.commands
+    assert journal.commands[-1] == "save as 'cylinder.cub' overwrite"
+
+
+def test_partition() -> None:
+    journal = _cubit_journal.Journal()
+    _cubit_journal.partition(journal, "input", part_name=["one", "two"])
+    webcuts = [command for command in journal.commands if command.startswith("webcut")]
+    assert len(webcuts) == (6 + 3) * 2
+    # The 18 pyramid construction surfaces are sheet bodies: volume1 through volume18
+    assert 'webcut volume with name "one*" tool volume {volume19}' in webcuts
+    assert 'webcut volume with name "two*" tool volume {volume24}' in webcuts
+    assert "delete volume {volume19} {volume20} {volume21} {volume22} {volume23} {volume24}" in journal.commands
+    # Each pyramid is bounded by four triangular surfaces and one square surface
+    pyramid_volumes = [command for command in journal.commands if command.startswith("create volume surface")]
+    assert [len(command.split("{")) - 1 for command in pyramid_volumes] == [5] * 6
+    assert journal.commands[-3:] == [
+        'imprint volume with name "two*"',
+        'merge volume with name "two*"',
+        "save as 'input.cub' overwrite",
+    ]
+
+
+sets = {
+    "no sets": ({}, pytest.raises(RuntimeError), []),
+    "face and vertex": (
+        {"face_sets": [["top", "1"], ["bottom", "2"]], "vertex_sets": [["origin", "3"]]},
+        does_not_raise,
+        [
+            "reset",
+            "open 'input.cub'",
+            'surface 1 name "top"',
+            "nodeset 1 ADD surface 1",
+            'nodeset 1 name "top"',
+            "sideset 1 ADD surface 1",
+            'sideset 1 name "top"',
+            'surface 2 name "bottom"',
+            "nodeset 2 ADD surface 2",
+            'nodeset 2 name "bottom"',
+            "sideset 2 ADD surface 2",
+            'sideset 2 name "bottom"',
+            'vertex 3 name "origin"',
+            "nodeset 3 ADD vertex 3",
+            'nodeset 3 name "origin"',
+            "save as 'output.cub' overwrite",
+        ],
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "kwargs, outcome, expected",
+    sets.values(),
+    ids=sets.keys(),
+)
+def test_sets(kwargs: dict, outcome: contextlib.nullcontext | pytest.RaisesExc, expected: list[str]) -> None:
+    journal = _cubit_journal.Journal()
+    with outcome:
+        try:
+            _cubit_journal.sets(journal, "input", output_file="output", **kwargs)
+            assert journal.commands == expected
+        finally:
+            pass
+
+
+mesh = {
+    "tetmesh": (
+        "TETMESH",
+        None,
+        does_not_raise,
+        [
+            'group "turbo_turtle_volumes1" add volume with name "part*" and is_sheetbody',
+            '#{volumes1 = NumTypeInGroup("turbo_turtle_volumes1", "volume")}',
+            'delete group with name "turbo_turtle_volumes1"',
+            "#{if(volumes1 > 0)}",
+            'surface in volume with name "part*" and is_sheetbody size 1.0',
+            'mesh surface in volume with name "part*" and is_sheetbody',
+            "#{endif}",
+            'group "turbo_turtle_volumes2" add volume with name "part*" and not is_sheetbody',
+            '#{volumes2 = NumTypeInGroup("turbo_turtle_volumes2", "volume")}',
+            'delete group with name "turbo_turtle_volumes2"',
+            "#{if(volumes2 > 0)}",
+            'volume with name "part*" and not is_sheetbody scheme tetmesh',
+            'volume with name "part*" and not is_sheetbody size 1.0',
+            'mesh volume with name "part*" and not is_sheetbody',
+            "#{endif}",
+        ],
+    ),
+    "edge seeds": (
+        "trimesh",
+        [["edge", 2], ["other", 0.5]],
+        does_not_raise,
+        [
+            'curve with name "edge*" interval 2',
+            'curve with name "other*" size 0.5',
+            'group "turbo_turtle_volumes1" add volume with name "part*" and is_sheetbody',
+            '#{volumes1 = NumTypeInGroup("turbo_turtle_volumes1", "volume")}',
+            'delete group with name "turbo_turtle_volumes1"',
+            "#{if(volumes1 > 0)}",
+            'surface in volume with name "part*" and is_sheetbody scheme trimesh',
+            'surface in volume with name "part*" and is_sheetbody size 1.0',
+            'mesh surface in volume with name "part*" and is_sheetbody',
+            "#{endif}",
+            'group "turbo_turtle_volumes2" add volume with name "part*" and not is_sheetbody',
+            '#{volumes2 = NumTypeInGroup("turbo_turtle_volumes2", "volume")}',
+            'delete group with name "turbo_turtle_volumes2"',
+            "#{if(volumes2 > 0)}",
+            'volume with name "part*" and not is_sheetbody size 1.0',
+            'mesh volume with name "part*" and not is_sheetbody',
+            "#{endif}",
+        ],
+    ),
+    "negative seed": ("trimesh", [["edge", -1]], pytest.raises(ValueError, match="positive"), []),
+}
+
+
+@pytest.mark.parametrize(
+    "element_type, edge_seeds, outcome, expected",
+    mesh.values(),
+    ids=mesh.keys(),
+)
+def test_mesh(
+    element_type: str, edge_seeds: list | None, outcome: contextlib.nullcontext | pytest.RaisesExc, expected: list[str]
+) -> None:
+    journal = _cubit_journal.Journal()
+    with outcome:
+        try:
+            _cubit_journal.mesh(
+                journal, "input", element_type, part_name="part", global_seed=1.0, edge_seeds=edge_seeds
+            )
+            assert journal.commands == ["reset", "open 'input.cub'", *expected, "save as 'input.cub' overwrite"]
+        finally:
+            pass
+
+
+def test_merge() -> None:
+    journal = _cubit_journal.Journal()
+    _cubit_journal.merge(journal, ["one.cub", "two"], "merged")
+    assert journal.commands == [
+        "reset",
+        "import cubit 'one.cub' unique_genesis_ids",
+        "import cubit 'two.cub' unique_genesis_ids",
+        "save as 'merged.cub' overwrite",
+    ]
+
+
+def test_export_abaqus() -> None:
+    journal = _cubit_journal.Journal()
+    with patch("turbo_turtle._cubit_journal._mixed_utilities.substitute_element_type") as mock_substitute:
+        _cubit_journal.export(
+            journal, "input", part_name=["one", "two"], element_type=["C3D8", None], destination="out"
+        )
+        journal.after[0]()
+    assert "export abaqus 'out/one.inp' block 1 partial overwrite" in journal.commands
+    assert "export abaqus 'out/two.inp' block 2 partial overwrite" in journal.commands
+    assert "block 2 name 'two'" in journal.commands
+    # Blocks only add the volume kinds found at run time
+    block_add = journal.commands.index('block 1 add surface in volume with name "one*" and is_sheetbody')
+    assert journal.commands[block_add - 1] == "#{if(volumes1 > 0)}"
+    assert journal.commands[block_add + 1] == "#{endif}"
+    assert len(journal.after) == 1
+    mock_substitute.assert_called_once_with(pathlib.Path("out/one.inp"), "C3D8")
+
+
+export_genesis = {
+    "genesis": ("genesis", does_not_raise, "set large exodus file on"),
+    "genesis-normal": ("genesis-normal", does_not_raise, "set large exodus file off"),
+    "genesis-hdf5": ("genesis-hdf5", does_not_raise, "set exodus netcdf4 on"),
+    "unknown": ("unknown", pytest.raises(RuntimeError), None),
+}
+
+
+@pytest.mark.parametrize(
+    "output_type, outcome, option",
+    export_genesis.values(),
+    ids=export_genesis.keys(),
+)
+def test_export_genesis(
+    output_type: str, outcome: contextlib.nullcontext | pytest.RaisesExc, option: str | None
+) -> None:
+    journal = _cubit_journal.Journal()
+    with outcome:
+        try:
+            _cubit_journal.export(
+                journal, "input", part_name=["one"], element_type=["HEX"], destination=".", output_type=output_type
+            )
+            assert journal.commands[-3:] == [
+                "block 1 element type HEX",
+                option,
+                "export mesh 'input.g' block 1 overwrite",
+            ]
+            assert not journal.after
+        finally:
+            pass
+
+
+def test_image() -> None:
+    journal = _cubit_journal.Journal()
+    _cubit_journal.image(journal, "input", "image.png", x_angle=1.0, y_angle=2.0, z_angle=3.0, image_size=(4, 5))
+    assert journal.commands == [
+        "reset",
+        "open 'input.cub'",
+        "graphics windowsize 4 5",
+        "rotate 1.0 about world x",
+        "rotate 2.0 about world y",
+        "rotate 3.0 about world z",
+        "hardcopy 'image.png' png",
+    ]
+
+
+def test_image_views() -> None:
+    journal = _cubit_journal.Journal()
+    _cubit_journal.image(journal, "input", "image.png", views=[("90", "0", "0", "top.jpg"), (0, 90, 0, "side.png")])
+    assert journal.commands.count("open 'input.cub'") == 1
+    assert journal.commands.count("view reset") == 2
+    assert [command for command in journal.commands if command.startswith("hardcopy")] == [
+        "hardcopy 'image.png' png",
+        "hardcopy 'top.jpg' jpg",
+        "hardcopy 'side.png' png",
+    ]
+    assert journal.commands[-5:] == [
+        "view reset",
+        "rotate 0.0 about world x",
+        "rotate 90.0 about world y",
+        "rotate 0.0 about world z",
+        "hardcopy 'side.png' png",
+    ]
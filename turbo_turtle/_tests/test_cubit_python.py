@@ -1,12 +1,16 @@
 import contextlib
 import math
+import pathlib
+import tempfile
+from unittest.mock import Mock, call, patch
 
 import numpy
 import pytest
 
 cubit = pytest.importorskip("cubit", reason="Could not import Cubit")
 
-from turbo_turtle import _cubit_python  # noqa: E402
+from turbo_turtle import _cubit_python, _settings  # noqa: E402
+from turbo_turtle._abaqus_python.turbo_turtle_abaqus import _mixed_utilities, parsers, vertices  # noqa: E402
 
 pytestmark = pytest.mark.cubit_python
 
@@ -33,6 +37,21 @@ def test_cubit_command_or_exception(command: str, outcome: contextlib.nullcontex
             pass
 
 
+def test_session() -> None:
+    with patch("turbo_turtle._cubit_python.cubit") as mock_cubit:
+        with _cubit_python.session():
+            _cubit_python._initialize()
+            _cubit_python._initialize()
+            with pytest.raises(RuntimeError), _cubit_python.session():
+                pass
+        mock_cubit.init.assert_called_once_with(["cubit", "-nojournal"])
+        assert mock_cubit.cmd.call_args_list == [call("reset")] * 3
+        assert not _cubit_python._session["open"]
+
+        _cubit_python._initialize()
+        assert mock_cubit.init.call_count == 2
+
+
 create_curve_from_coordinates = {
     "float": (
         (0.0, 0.0, 0.0),
@@ -161,3 +180,578 @@ def test_create_surface_from_coordinates(
             assert len(surface.vertices()) == coordinates.shape[0]
         finally:
             pass
+
+
+create_vertices = {
+    "shared": (
+        numpy.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.5, 1.0, 0.0]]),
+        None,
+        [7, 8, 9],
+        ["create vertex 0.0 0.0 0.0", "create vertex 0.5 1.0 0.0", "create vertex 1.0 0.0 0.0"],
+        [7, 9, 7, 8],
+    ),
+    "separate": (
+        numpy.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 0.0]]),
+        numpy.array([[1.0, 0.0, 0.0], [0.0, 0.0, 0.0]]),
+        [7, 8, 9, 10],
+        [
+            "create vertex 0.0 0.0 0.0",
+            "create vertex 1.0 0.0 0.0",
+            "create vertex 1.0 0.0 0.0",
+            "create vertex 0.0 0.0 0.0",
+        ],
+        [7, 8, 7, 9, 10],
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "coordinates, separate, new_ids, expected_commands, expected",
+    create_vertices.values(),
+    ids=create_vertices.keys(),
+)
+def test_create_vertices(
+    coordinates: numpy.ndarray,
+    separate: numpy.ndarray | None,
+    new_ids: list[int],
+    expected_commands: list[str],
+    expected: list[int],
+) -> None:
+    with patch("turbo_turtle._cubit_python._playback_new_ids", return_value=new_ids) as mock_new_ids:
+        vertex_ids = _cubit_python._create_vertices(coordinates, separate=separate)
+    mock_new_ids.assert_called_once_with("vertex", expected_commands)
+    assert vertex_ids == expected
+
+
+create_curves = {
+    "separate spline vertices": (
+        [numpy.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0]])],
+        [numpy.array([[1.0, 0.0, 0.0], [0.5, 0.5, 0.0], [0.0, 0.0, 0.0]])],
+        does_not_raise,
+        [1, 2, 3, 4, 5],
+        ["create curve vertex 1 2", "create curve spline vertex 3 4 5 delete"],
+    ),
+    "too few spline points": ([], [numpy.array([[0.0, 0.0, 0.0]])], pytest.raises(RuntimeError), [], []),
+}
+
+
+@pytest.mark.parametrize(
+    "lines, splines, outcome, vertex_ids, expected",
+    create_curves.values(),
+    ids=create_curves.keys(),
+)
+def test_create_curves(
+    lines: list[numpy.ndarray],
+    splines: list[numpy.ndarray],
+    outcome: contextlib.nullcontext | pytest.RaisesExc,
+    vertex_ids: list[int],
+    expected: list[str],
+) -> None:
+    with (
+        patch("turbo_turtle._cubit_python.cubit") as mock_cubit,
+        patch("turbo_turtle._cubit_python._create_vertices", return_value=vertex_ids) as mock_vertices,
+        patch("turbo_turtle._cubit_python._playback_new_ids", return_value=[4, 5]) as mock_new_ids,
+        outcome,
+    ):
+        try:
+            curves = _cubit_python._create_curves(lines, splines)
+            numpy.testing.assert_array_equal(mock_vertices.call_args.args[0], numpy.concatenate(lines))
+            numpy.testing.assert_array_equal(mock_vertices.call_args.kwargs["separate"], numpy.concatenate(splines))
+            mock_new_ids.assert_called_once_with("curve", expected)
+            assert len(curves) == 2
+            mock_cubit.curve.assert_has_calls([call(4), call(5)])
+        finally:
+            pass
+
+
+def test_draw_surface_lines_and_splines() -> None:
+    coordinates = _mixed_utilities.return_genfromtxt(
+        _settings._project_root_abspath / "_tests" / "vase.csv", expected_dimensions=2, expected_columns=2
+    )
+    lines, splines = vertices.lines_and_splines(coordinates, parsers.geometry_defaults["euclidean_distance"])
+    assert lines
+    assert splines
+    surface = _cubit_python._draw_surface(lines, splines)
+    assert len(surface.surfaces()) == 1
+    assert len(surface.curves()) == len(lines) + len(splines)
+    assert len(surface.vertices()) == len(lines) + len(splines)
+
+
+def _mock_volume(volume_id: int, surface_ids: list[int]) -> Mock:
+    volume = Mock()
+    volume.id.return_value = volume_id
+    volume.surfaces.return_value = [Mock(**{"id.return_value": surface_id}) for surface_id in surface_ids]
+    return volume
+
+
+mesh_multiple_volumes = {
+    "trimesh": (
+        "trimesh",
+        [
+            call("surface 3 4 5 scheme trimesh"),
+            call("surface 3 4 5 size 1.0"),
+            call("mesh surface 3 4 5"),
+            call("volume 1 size 1.0"),
+            call("mesh volume 1"),
+        ],
+    ),
+    "tetmesh": (
+        "tetmesh",
+        [
+            call("surface 3 4 5 size 1.0"),
+            call("mesh surface 3 4 5"),
+            call("volume 1 scheme tetmesh"),
+            call("volume 1 size 1.0"),
+            call("mesh volume 1"),
+        ],
+    ),
+    "default": (
+        None,
+        [
+            call("surface 3 4 5 size 1.0"),
+            call("mesh surface 3 4 5"),
+            call("volume 1 size 1.0"),
+            call("mesh volume 1"),
+        ],
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "element_type, expected_calls",
+    mesh_multiple_volumes.values(),
+    ids=mesh_multiple_volumes.keys(),
+)
+def test_mesh_multiple_volumes(element_type: str | None, expected_calls: list) -> None:
+    volumes = [_mock_volume(1, [1, 2]), _mock_volume(2, [3, 4]), _mock_volume(3, [5])]
+    with (
+        patch("turbo_turtle._cubit_python.cubit") as mock_cubit,
+        patch("turbo_turtle._cubit_python.cubit_command_or_exception") as mock_command,
+    ):
+        mock_cubit.is_sheet_body.side_effect = lambda volume_id: volume_id != 1
+        _cubit_python._mesh_multiple_volumes(volumes, 1.0, element_type=element_type)
+    assert mock_command.call_args_list == expected_calls
+
+
+set_commands = {
+    "surface": (
+        "surface",
+        "top",
+        "1 2",
+        3,
+        4,
+        [
+            'surface 1 2 name "top"',
+            "nodeset 3 ADD surface 1 2",
+            'nodeset 3 name "top"',
+            "sideset 4 ADD surface 1 2",
+            'sideset 4 name "top"',
+        ],
+    ),
+    "vertex": (
+        "vertex",
+        "origin",
+        5,
+        1,
+        None,
+        ['vertex 5 name "origin"', "nodeset 1 ADD vertex 5", 'nodeset 1 name "origin"'],
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "feature, name, mask, nodeset_id, sideset_id, expected",
+    set_commands.values(),
+    ids=set_commands.keys(),
+)
+def test_set_commands(
+    feature: str, name: str, mask: str | int, nodeset_id: int, sideset_id: int | None, expected: list[str]
+) -> None:
+    assert _cubit_python._set_commands(feature, name, mask, nodeset_id, sideset_id) == expected
+
+
+playback = {
+    "success": (True, [0, 0], True),
+    "new errors": (True, [0, 2], False),
+    "failed playback": (False, [0, 0], False),
+}
+
+
+@pytest.mark.parametrize(
+    "cmd_return, error_counts, expected",
+    playback.values(),
+    ids=playback.keys(),
+)
+def test_playback(cmd_return: bool, error_counts: list[int], expected: bool) -> None:
+    journals = []
+
+    def read_journal(command: str) -> bool:
+        journals.append(pathlib.Path(command.split("'")[1]).read_text())
+        return cmd_return
+
+    with patch("turbo_turtle._cubit_python.cubit") as mock_cubit:
+        mock_cubit.get_error_count.side_effect = error_counts
+        mock_cubit.cmd.side_effect = read_journal
+        assert _cubit_python._playback(["reset", "brick x 1"]) is expected
+    assert journals == ["reset\nbrick x 1\n"]
+
+
+set_from_mask = {
+    "surface batches": (
+        "surface",
+        [("one", "1"), ("two", "2"), ("three", "3")],
+        [
+            [
+                'surface 1 name "one"',
+                "nodeset 4 ADD surface 1",
+                'nodeset 4 name "one"',
+                "sideset 7 ADD surface 1",
+                'sideset 7 name "one"',
+                'surface 2 name "two"',
+                "nodeset 5 ADD surface 2",
+                'nodeset 5 name "two"',
+                "sideset 8 ADD surface 2",
+                'sideset 8 name "two"',
+            ],
+            [
+                'surface 3 name "three"',
+                "nodeset 6 ADD surface 3",
+                'nodeset 6 name "three"',
+                "sideset 9 ADD surface 3",
+                'sideset 9 name "three"',
+            ],
+        ],
+    ),
+    "vertex": (
+        "VERTEX",
+        [("origin", "1")],
+        [['vertex 1 name "origin"', "nodeset 4 ADD vertex 1", 'nodeset 4 name "origin"']],
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "feature, name_mask, expected",
+    set_from_mask.values(),
+    ids=set_from_mask.keys(),
+)
+def test_set_from_mask(feature: str, name_mask: list[tuple[str, str]], expected: list[list[str]]) -> None:
+    with (
+        patch("turbo_turtle._cubit_python.cubit") as mock_cubit,
+        patch("turbo_turtle._cubit_python._playback", return_value=True) as mock_playback,
+        patch("turbo_turtle._cubit_python._set_batch_size", 2),
+    ):
+        mock_cubit.get_next_nodeset_id.return_value = 4
+        mock_cubit.get_next_sideset_id.return_value = 7
+        _cubit_python._set_from_mask(feature, name_mask)
+    assert mock_playback.call_args_list == [call(commands) for commands in expected]
+
+
+def test_set_from_mask_error() -> None:
+    name_mask = [("good", "1"), ("bad", "999"), ("also good", "2")]
+    with (
+        patch("turbo_turtle._cubit_python.cubit") as mock_cubit,
+        patch("turbo_turtle._cubit_python._playback", return_value=False),
+        pytest.raises(RuntimeError, match=r"set\(s\) 'bad' \(surface 999\)\. Please"),
+    ):
+        mock_cubit.get_next_nodeset_id.return_value = 1
+        mock_cubit.get_next_sideset_id.return_value = 1
+        mock_cubit.get_nodeset_id_list.return_value = [1, 3]
+        mock_cubit.get_sideset_id_list.return_value = [1, 3]
+        _cubit_python._set_from_mask("surface", name_mask)
+
+
+bounding_boxes_overlap = {
+    "overlap": ((0.0, 0.0, 0.0, 1.0, 1.0, 1.0), (0.5, 0.5, 0.5, 2.0, 2.0, 2.0), True),
+    "touching": ((0.0, 0.0, 0.0, 1.0, 1.0, 1.0), (1.0, 0.0, 0.0, 2.0, 1.0, 1.0), True),
+    "contained": ((0.0, 0.0, 0.0, 3.0, 3.0, 3.0), (1.0, 1.0, 1.0, 2.0, 2.0, 2.0), True),
+    "separate x": ((0.0, 0.0, 0.0, 1.0, 1.0, 1.0), (1.5, 0.0, 0.0, 2.0, 1.0, 1.0), False),
+    "separate z": ((0.0, 0.0, 0.0, 1.0, 1.0, 1.0), (0.0, 0.0, -2.0, 1.0, 1.0, -1.5), False),
+}
+
+
+@pytest.mark.parametrize(
+    "first, second, expected",
+    bounding_boxes_overlap.values(),
+    ids=bounding_boxes_overlap.keys(),
+)
+def test_bounding_boxes_overlap(first: tuple, second: tuple, expected: bool) -> None:
+    assert _cubit_python._bounding_boxes_overlap(first, second) is expected
+    assert _cubit_python._bounding_boxes_overlap(second, first) is expected
+
+
+def _mock_box_volume(volume_id: int, bounding_box: tuple) -> Mock:
+    volume = Mock()
+    volume.id.return_value = volume_id
+    volume.bounding_box.return_value = bounding_box
+    return volume
+
+
+intersection_pairs = {
+    "filter": (True, [(10, 1), (11, 1), (11, 2)]),
+    "no filter": (False, [(10, 1), (10, 2), (11, 1), (11, 2)]),
+}
+
+
+@pytest.mark.parametrize(
+    "bounding_box_filter, expected",
+    intersection_pairs.values(),
+    ids=intersection_pairs.keys(),
+)
+def test_intersection_pairs(bounding_box_filter: bool, expected: list[tuple[int, int]]) -> None:
+    pyramids = [
+        _mock_box_volume(10, (0.0, 0.0, 0.0, 1.0, 1.0, 1.0)),
+        _mock_box_volume(11, (0.0, 0.0, 0.0, 5.0, 5.0, 5.0)),
+    ]
+    parts = [
+        _mock_box_volume(1, (0.5, 0.5, 0.5, 2.0, 2.0, 2.0)),
+        _mock_box_volume(2, (3.0, 3.0, 3.0, 4.0, 4.0, 4.0)),
+    ]
+    pairs = _cubit_python._intersection_pairs(pyramids, parts, bounding_box_filter=bounding_box_filter)
+    assert pairs == expected
+
+
+def test_entity_registry() -> None:
+    model = {1: "cylinder", 2: "cylinder@A", 3: "sphere", 4: "cylinder_two"}
+    with patch("turbo_turtle._cubit_python.cubit") as mock_cubit:
+        mock_cubit.get_entities.side_effect = lambda _entity_type: list(model)
+        mock_cubit.get_entity_name.side_effect = lambda _entity_type, entity_id: model[entity_id]
+        registry = _cubit_python._EntityRegistry("volume")
+
+        assert registry.ids("cylinder") == [1, 2, 4]
+        assert registry.ids("sphere") == [3]
+        assert registry.ids("cube") == []
+        assert mock_cubit.get_entity_name.call_count == 4
+
+        # Only new entities are queried for their names
+        del model[2]
+        model[5] = "cylinder@B"
+        assert registry.ids("cylinder@") == [5]
+        assert mock_cubit.get_entity_name.call_count == 5
+
+
+def test_entity_ids_from_name() -> None:
+    with patch("turbo_turtle._cubit_python.cubit") as mock_cubit:
+        mock_cubit.get_entities.return_value = [1, 2]
+        mock_cubit.get_entity_name.side_effect = lambda _entity_type, entity_id: f"part{entity_id}"
+        _cubit_python._registries.clear()
+        assert _cubit_python._entity_ids_from_name("Volume", "part") == [1, 2]
+        assert _cubit_python._entity_ids_from_name("volume", "part2") == [2]
+        assert list(_cubit_python._registries) == ["volume"]
+        mock_cubit.get_all_ids_from_name.assert_not_called()
+
+        _cubit_python._initialize()
+        assert not _cubit_python._registries
+
+
+export_jobs = {
+    "serial": (1, "abaqus", False),
+    "parallel": (2, "abaqus", True),
+    "cpu count": (0, "abaqus", True),
+    "genesis": (2, "genesis", False),
+}
+
+
+@pytest.mark.parametrize(
+    "jobs, output_type, parallel",
+    export_jobs.values(),
+    ids=export_jobs.keys(),
+)
+def test_export_jobs(jobs: int, output_type: str, parallel: bool) -> None:
+    with (
+        patch("turbo_turtle._cubit_python.cubit") as mock_cubit,
+        patch("turbo_turtle._cubit_python.os.cpu_count", return_value=4),
+        patch("turbo_turtle._cubit_python._export_abaqus_parallel") as mock_parallel,
+        patch("turbo_turtle._cubit_python._export_abaqus_list") as mock_list,
+        patch("turbo_turtle._cubit_python._export_genesis") as mock_genesis,
+    ):
+        _cubit_python.export(
+            "input", part_name=["one", "two", "three"], destination="out", output_type=output_type, jobs=jobs
+        )
+    if parallel:
+        mock_parallel.assert_called_once_with(
+            pathlib.Path("input.cub"),
+            ["one", "two", "three"],
+            [None, None, None],
+            pathlib.Path("out"),
+            min(jobs or 4, 3),
+        )
+        mock_cubit.init.assert_not_called()
+    else:
+        mock_parallel.assert_not_called()
+        assert mock_list.called or mock_genesis.called
+
+
+def test_export_abaqus_parallel() -> None:
+    with patch("turbo_turtle._cubit_python.concurrent.futures.ProcessPoolExecutor") as mock_executor:
+        executor = mock_executor.return_value.__enter__.return_value
+        with patch("turbo_turtle._cubit_python._export_abaqus_worker") as mock_worker:
+            executor.map.side_effect = lambda _function, *iterables: map(mock_worker, *iterables)
+            _cubit_python._export_abaqus_parallel(
+                pathlib.Path("input.cub"), ["one", "two", "three"], ["C3D8", None, "C3D4"], pathlib.Path("out"), 2
+            )
+    assert mock_executor.call_args.kwargs["max_workers"] == 2
+    mock_worker.assert_has_calls(
+        [
+            call(pathlib.Path("input.cub"), ["one", "three"], ["C3D8", "C3D4"], pathlib.Path("out")),
+            call(pathlib.Path("input.cub"), ["two"], [None], pathlib.Path("out")),
+        ]
+    )
+
+
+def test_image() -> None:
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        output_file = pathlib.Path(temporary_directory) / "image.png"
+        top_file = pathlib.Path(temporary_directory) / "top.jpg"
+        with patch("turbo_turtle._utilities.run_command") as mock_run:
+            _cubit_python.image(
+                "input", output_file, "cubit", image_size=(4, 5), views=[("90", "0", "0", str(top_file))]
+            )
+        journal_path = output_file.with_suffix(".jou")
+        assert journal_path.read_text().splitlines() == [
+            "open 'input.cub'",
+            "graphics windowsize 4 5",
+            "rotate 0.0 about world x",
+            "rotate 0.0 about world y",
+            "rotate 0.0 about world z",
+            f"hardcopy '{output_file}' png",
+            "view reset",
+            "rotate 90.0 about world x",
+            "rotate 0.0 about world y",
+            "rotate 0.0 about world z",
+            f"hardcopy '{top_file}' jpg",
+        ]
+    mock_run.assert_called_once_with(f"cubit -batch {journal_path}")
+
+
+merge_groups = {
+    "pairs": (5, 4, [[0, 1], [2, 3], [4]]),
+    "k-ary": (10, 3, [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]),
+}
+
+
+@pytest.mark.parametrize(
+    "number_of_files, max_workers, expected",
+    merge_groups.values(),
+    ids=merge_groups.keys(),
+)
+def test_merge_groups(number_of_files: int, max_workers: int, expected: list[list[int]]) -> None:
+    input_file = [pathlib.Path(f"{number}.cub") for number in range(number_of_files)]
+    groups = _cubit_python._merge_groups(input_file, max_workers)
+    assert groups == [[input_file[number] for number in group] for group in expected]
+
+
+merge_jobs = {
+    "serial": (None, False),
+    "one job": (1, False),
+    "parallel": (2, True),
+    "cpu count": (0, True),
+}
+
+
+@pytest.mark.parametrize(
+    "jobs, tree",
+    merge_jobs.values(),
+    ids=merge_jobs.keys(),
+)
+def test_merge_jobs(jobs: int | None, tree: bool) -> None:
+    with (
+        patch("turbo_turtle._cubit_python.cubit") as mock_cubit,
+        patch("turbo_turtle._cubit_python.os.cpu_count", return_value=4),
+        patch("turbo_turtle._cubit_python._merge_tree") as mock_tree,
+    ):
+        _cubit_python.merge(["one", "two", "three"], "merged", jobs=jobs)
+    input_file = [pathlib.Path("one.cub"), pathlib.Path("two.cub"), pathlib.Path("three.cub")]
+    if tree:
+        mock_tree.assert_called_once_with(input_file, pathlib.Path("merged.cub"), 3 if jobs == 0 else jobs)
+        mock_cubit.cmd.assert_not_called()
+    else:
+        mock_tree.assert_not_called()
+        mock_cubit.cmd.assert_any_call("import cubit 'three.cub' unique_genesis_ids")
+        mock_cubit.cmd.assert_called_with("save as 'merged.cub' overwrite")
+
+
+def test_merge_tree() -> None:
+    input_file = [pathlib.Path(f"{number}.cub") for number in range(5)]
+    output_file = pathlib.Path("merged.cub")
+    rounds = []
+    with (
+        patch("turbo_turtle._cubit_python.concurrent.futures.ProcessPoolExecutor") as mock_executor,
+        patch("turbo_turtle._cubit_python.tempfile.TemporaryDirectory") as mock_temporary_directory,
+    ):
+        mock_temporary_directory.return_value.__enter__.return_value = "temporary"
+        executor = mock_executor.return_value.__enter__.return_value
+        executor.map.side_effect = lambda _function, groups, outputs: (
+            rounds.append(list(zip(groups, outputs, strict=True))) or []
+        )
+        _cubit_python._merge_tree(input_file, output_file, 2)
+    temporary = pathlib.Path("temporary")
+    assert rounds == [
+        [(input_file[0:3], temporary / "round0_group0.cub"), (input_file[3:5], temporary / "round0_group1.cub")],
+        [([temporary / "round0_group0.cub", temporary / "round0_group1.cub"], output_file)],
+    ]
+
+
+def _mock_surface(surface_id: int) -> Mock:
+    surface = Mock()
+    surface.surfaces.return_value = [surface]
+    surface.id.return_value = surface_id
+    return surface
+
+
+def test_surfaces_by_vectors() -> None:
+    centroids = {1: (1.0, 0.0, 0.0), 2: (-1.0, 0.0, 0.0), 3: (0.0, 1.0, 0.0), 4: (1.0, 1.0, 1.0e-12)}
+    surfaces = [_mock_surface(surface_id) for surface_id in centroids]
+    principal_vectors = [(1.0, 0.0, 0.0), (-1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0)]
+    with patch("turbo_turtle._cubit_python.cubit") as mock_cubit:
+        mock_cubit.get_surface_centroid.side_effect = lambda surface_id: centroids[surface_id]
+        classified = _cubit_python._surfaces_by_vectors(surfaces, principal_vectors)
+    assert mock_cubit.get_surface_centroid.call_count == len(surfaces)
+    assert [list(selected) for selected in classified] == [
+        [surfaces[0], surfaces[3]],
+        [surfaces[1]],
+        [surfaces[2], surfaces[3]],
+        [],
+    ]
+
+
+imprint_and_merge = {
+    "together": (False, ["imprint volume 1 2 3", "merge volume 1 2 3"]),
+    "independent": (True, ["imprint volume 1 2", "merge volume 1 2", "imprint volume 3", "merge volume 3"]),
+}
+
+
+@pytest.mark.parametrize(
+    "independent, expected",
+    imprint_and_merge.values(),
+    ids=imprint_and_merge.keys(),
+)
+def test_imprint_and_merge(independent: bool, expected: list[str]) -> None:
+    volumes = {"one": [1, 2], "two": [3]}
+    with (
+        patch(
+            "turbo_turtle._cubit_python._get_volumes_from_name",
+            side_effect=lambda names: [_mock_volume(number, []) for name in names for number in volumes[name]],
+        ),
+        patch("turbo_turtle._cubit_python._playback", return_value=True) as mock_playback,
+    ):
+        _cubit_python.imprint_and_merge(["one", "two"], independent=independent)
+    mock_playback.assert_called_once_with(expected)
+
+
+def test_webcut_local_coordinate_primary_planes() -> None:
+    with (
+        patch("turbo_turtle._cubit_python._get_volumes_from_name") as mock_volumes,
+        patch("turbo_turtle._cubit_python._playback", side_effect=[True, False]) as mock_playback,
+    ):
+        volumes = _cubit_python.webcut_local_coordinate_primary_planes(
+            (0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 0.0, 1.0), ["one"]
+        )
+        assert volumes == mock_volumes.return_value
+        commands = mock_playback.call_args.args[0]
+        assert len(commands) == 3
+        assert all(command.startswith('webcut volume with name "one*" with plane normal') for command in commands)
+        with pytest.raises(RuntimeError):
+            _cubit_python.webcut_local_coordinate_primary_planes(
+                (0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 0.0, 1.0), ["one"]
+            )
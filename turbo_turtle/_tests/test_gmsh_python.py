@@ -0,0 +1,1000 @@
+"""Test :mod:`turbo_turtle._gmsh_python`."""
+
+import contextlib
+import logging
+import logging.handlers
+import pathlib
+import tempfile
+from unittest.mock import call, patch
+
+import numpy
+import pytest
+
+gmsh = pytest.importorskip("gmsh", reason="Could not import Gmsh")
+
+from turbo_turtle import _gmsh_python  # noqa: E402
+
+does_not_raise = contextlib.nullcontext()
+
+
+def test_session() -> None:
+    with patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh:
+        mock_gmsh.isInitialized.return_value = False
+        with _gmsh_python.session():
+            mock_gmsh.initialize.assert_called_once()
+            mock_gmsh.logger.start.assert_called_once()
+        # The remaining messages are drained before the logger is stopped
+        mock_gmsh.logger.get.assert_called_once()
+        assert mock_gmsh.logger.stop.call_count == 2
+        mock_gmsh.finalize.assert_called_once()
+
+    with patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh, pytest.raises(RuntimeError):
+        mock_gmsh.isInitialized.return_value = True
+        with _gmsh_python.session():
+            pass
+
+
+@pytest.mark.parametrize("initialized", [True, False], ids=["open session", "dedicated session"])
+def test_call_session(initialized: bool) -> None:
+    with patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh:
+        mock_gmsh.isInitialized.return_value = initialized
+        with pytest.raises(RuntimeError), _gmsh_python._call_session():
+            raise RuntimeError("Finalize a dedicated session on errors")
+    assert mock_gmsh.initialize.called is not initialized
+    assert mock_gmsh.finalize.called is not initialized
+    assert mock_gmsh.clear.called is initialized
+    assert mock_gmsh.option.restoreDefaults.called is initialized
+
+
+def test_call_session_verbosity() -> None:
+    with (
+        patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh,
+        patch("turbo_turtle._gmsh_python._log_file_handler") as mock_handler,
+    ):
+        mock_gmsh.isInitialized.return_value = False
+        with _gmsh_python.session(verbosity="quiet", log_file="session.log"):
+            mock_gmsh.isInitialized.return_value = True
+            mock_gmsh.option.setNumber.reset_mock()
+            mock_handler.reset_mock()
+            with _gmsh_python._call_session(log_file="session.log"):
+                pass
+            # The open session verbosity is re-applied after restoring the Gmsh default options
+            mock_gmsh.option.restoreDefaults.assert_called_once()
+            assert mock_gmsh.option.setNumber.call_args_list == [
+                call("General.Verbosity", 2),
+                call("General.Terminal", 1),
+            ]
+            # The open session log file is not attached twice
+            mock_handler.assert_called_once_with(None, "quiet")
+    assert _gmsh_python._session_options == {"verbosity": None, "log_file": None}
+
+
+set_verbosity = {
+    "default": (None, [], does_not_raise),
+    "quiet": ("quiet", [call("General.Verbosity", 2), call("General.Terminal", 1)], does_not_raise),
+    "verbose": ("verbose", [call("General.Verbosity", 99), call("General.Terminal", 1)], does_not_raise),
+    "unknown": ("loud", [], pytest.raises(RuntimeError)),
+}
+
+
+@pytest.mark.parametrize(
+    "verbosity, expected_calls, outcome",
+    set_verbosity.values(),
+    ids=set_verbosity.keys(),
+)
+def test_set_verbosity(
+    verbosity: str | None, expected_calls: list, outcome: contextlib.nullcontext | pytest.RaisesExc
+) -> None:
+    with patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh, outcome:
+        try:
+            _gmsh_python._set_verbosity(verbosity)  # type: ignore[arg-type]
+        finally:
+            assert mock_gmsh.option.setNumber.call_args_list == expected_calls
+
+
+def test_drain_log() -> None:
+    messages = ["Info: Meshing 1D...", "Warning: Degenerate curve", "Debug: Decoded option", "Unlabeled message"]
+    with (
+        patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh,
+        patch("turbo_turtle._gmsh_python._logger") as mock_logger,
+    ):
+        mock_gmsh.logger.get.return_value = messages
+        _gmsh_python._drain_log()
+    mock_gmsh.logger.stop.assert_called_once()
+    mock_gmsh.logger.start.assert_called_once()
+    assert mock_logger.log.call_args_list == [
+        call(logging.INFO, "Meshing 1D...", extra={"gmsh": True}),
+        call(logging.WARNING, "Degenerate curve", extra={"gmsh": True}),
+        call(logging.DEBUG, "Decoded option", extra={"gmsh": True}),
+        call(logging.INFO, "Unlabeled message", extra={"gmsh": True}),
+    ]
+
+
+stream_handler = {
+    "default": (None, ["INFO: Meshing", "WARNING: Degenerate curve"]),
+    "quiet": ("quiet", ["WARNING: Degenerate curve"]),
+    "verbose": ("verbose", ["DEBUG: Decoded option", "INFO: Meshing", "WARNING: Degenerate curve"]),
+}
+
+
+@pytest.mark.parametrize(
+    "verbosity, expected",
+    stream_handler.values(),
+    ids=stream_handler.keys(),
+)
+def test_stream_handler(verbosity: str | None, expected: list[str], capsys: pytest.CaptureFixture) -> None:
+    with _gmsh_python._stream_handler(verbosity):  # type: ignore[arg-type]
+        _gmsh_python._logger.debug("Decoded option")
+        _gmsh_python._logger.info("Meshing")
+        _gmsh_python._logger.warning("Degenerate curve")
+        # Gmsh prints the forwarded Gmsh messages to the terminal
+        _gmsh_python._logger.warning("Gmsh message", extra={"gmsh": True})
+    # Messages after the context are not reported
+    _gmsh_python._logger.warning("Finalize")
+    assert capsys.readouterr().err.splitlines() == expected
+    assert _gmsh_python._logger.level == logging.NOTSET
+
+
+log_file_handler = {
+    "default": (None, ["INFO: Meshing", "WARNING: Degenerate curve"]),
+    "quiet": ("quiet", ["WARNING: Degenerate curve"]),
+    "verbose": ("verbose", ["DEBUG: Decoded option", "INFO: Meshing", "WARNING: Degenerate curve"]),
+}
+
+
+@pytest.mark.parametrize(
+    "verbosity, expected",
+    log_file_handler.values(),
+    ids=log_file_handler.keys(),
+)
+def test_log_file_handler(verbosity: str | None, expected: list[str]) -> None:
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        log_file = pathlib.Path(temporary_directory) / "gmsh.log"
+        with _gmsh_python._log_file_handler(log_file, verbosity):  # type: ignore[arg-type]
+            _gmsh_python._logger.debug("Decoded option")
+            _gmsh_python._logger.info("Meshing")
+            _gmsh_python._logger.warning("Degenerate curve")
+        # Messages after the context are not written to the log file
+        _gmsh_python._logger.warning("Finalize")
+        lines = log_file.read_text().splitlines()
+    assert [line.split(" ", 2)[2] for line in lines] == expected
+    assert not any(
+        isinstance(handler, logging.handlers.RotatingFileHandler) for handler in _gmsh_python._logger.handlers
+    )
+
+
+def test_generate_mesh() -> None:
+    with (
+        patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh,
+        patch("turbo_turtle._gmsh_python._drain_log") as mock_drain,
+        patch("turbo_turtle._gmsh_python._logger") as mock_logger,
+    ):
+        mock_gmsh.model.mesh.getElements.return_value = ([4], [[1, 2, 3]], [[]])
+        number_of_elements = _gmsh_python._generate_mesh(3)
+    assert number_of_elements == 3
+    assert mock_gmsh.model.mesh.generate.call_args_list == [call(1), call(2), call(3)]
+    assert "Meshed 3 3D elements" in mock_logger.info.call_args[0][0]
+    assert mock_drain.call_count == 3
+
+
+file_with_suffix = {
+    "step": ("part.step", {}, "part.step"),
+    "brep": ("part.brep", {}, "part.brep"),
+    "xao": ("part.xao", {}, "part.xao"),
+    "uppercase": ("part.BREP", {}, "part.BREP"),
+    "unsupported": ("part.cae", {}, "part.step"),
+    "no extension": ("part", {}, "part.step"),
+    "mesh": ("part.msh", {"suffixes": _gmsh_python._mesh_suffixes}, "part.msh"),
+    "mesh unsupported": ("part.step", {"suffixes": _gmsh_python._mesh_suffixes}, "part.msh"),
+}
+
+
+@pytest.mark.parametrize(
+    "path, kwargs, expected",
+    file_with_suffix.values(),
+    ids=file_with_suffix.keys(),
+)
+def test_file_with_suffix(path: str, kwargs: dict, expected: str) -> None:
+    assert _gmsh_python._file_with_suffix(path, **kwargs) == pathlib.Path(expected)
+
+
+write = {
+    "geometry": ("part.xao", None, []),
+    "small mesh": ("part.msh", 10, [call("Mesh.MshFileVersion", 4.1), call("Mesh.Binary", 0)]),
+    "large mesh": (
+        "part.msh",
+        _gmsh_python._binary_mesh_nodes + 1,
+        [call("Mesh.MshFileVersion", 4.1), call("Mesh.Binary", 1)],
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "output_file, number_of_nodes, expected_options",
+    write.values(),
+    ids=write.keys(),
+)
+def test_write(output_file: str, number_of_nodes: int | None, expected_options: list) -> None:
+    with patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh:
+        mock_gmsh.model.mesh.getNodes.return_value = (numpy.arange(number_of_nodes or 0), [], [])
+        _gmsh_python._write(output_file)
+    assert mock_gmsh.option.setNumber.call_args_list == expected_options
+    mock_gmsh.write.assert_called_once_with(output_file)
+
+
+set_mesh_options = {
+    "defaults": (
+        {},
+        [],
+        does_not_raise,
+    ),
+    "threads": (
+        {"num_threads": 4},
+        [
+            call("General.NumThreads", 4),
+            call("Mesh.MaxNumThreads1D", 4),
+            call("Mesh.MaxNumThreads2D", 4),
+            call("Mesh.MaxNumThreads3D", 4),
+        ],
+        does_not_raise,
+    ),
+    "algorithms": (
+        {"algorithm_2d": "frontal-delaunay", "algorithm_3d": "hxt"},
+        [call("Mesh.Algorithm", 6), call("Mesh.Algorithm3D", 10)],
+        does_not_raise,
+    ),
+    "unknown 2D algorithm": (
+        {"algorithm_2d": "notanalgorithm"},
+        [],
+        pytest.raises(RuntimeError),
+    ),
+    "unknown 3D algorithm": (
+        {"algorithm_3d": "notanalgorithm"},
+        [],
+        pytest.raises(RuntimeError),
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected_calls, outcome",
+    set_mesh_options.values(),
+    ids=set_mesh_options.keys(),
+)
+def test_set_mesh_options(
+    kwargs: dict, expected_calls: list, outcome: contextlib.nullcontext | pytest.RaisesExc
+) -> None:
+    with patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh, outcome:
+        try:
+            _gmsh_python._set_mesh_options(**kwargs)
+            assert mock_gmsh.option.setNumber.call_args_list == expected_calls
+        finally:
+            pass
+
+
+part_entities = {
+    "no part name: highest dimension": (
+        None,
+        False,
+        [],
+        [(0, 1), (1, 1), (2, 1), (2, 2), (3, 1)],
+        {},
+        [(3, 1)],
+        does_not_raise,
+    ),
+    "no part name: planar": (
+        None,
+        False,
+        [],
+        [(0, 1), (1, 1), (2, 1), (2, 2)],
+        {},
+        [(2, 1), (2, 2)],
+        does_not_raise,
+    ),
+    "physical group": (
+        "washer",
+        False,
+        [(2, 1), (3, 2)],
+        [(0, 1), (2, 1), (2, 2), (3, 1), (3, 2)],
+        {(2, 1): "washer_top", (3, 2): "vase"},
+        [(2, 1)],
+        does_not_raise,
+    ),
+    "missing part name: fall back to model": (
+        "missing",
+        True,
+        [(3, 1)],
+        [(0, 1), (2, 1), (3, 1), (3, 2)],
+        {(3, 1): "washer"},
+        [(3, 1), (3, 2)],
+        does_not_raise,
+    ),
+    "missing part name": (
+        "missing",
+        False,
+        [(3, 1)],
+        [(0, 1), (2, 1), (3, 1), (3, 2)],
+        {(3, 1): "washer"},
+        None,
+        pytest.raises(RuntimeError),
+    ),
+    "empty model": (
+        None,
+        False,
+        [],
+        [],
+        {},
+        None,
+        pytest.raises(RuntimeError),
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "part_name, fallback, physical_groups, entities, physical_names, expected, outcome",
+    part_entities.values(),
+    ids=part_entities.keys(),
+)
+def test_part_entities(
+    part_name: str | None,
+    fallback: bool,
+    physical_groups: list[tuple[int, int]],
+    entities: list[tuple[int, int]],
+    physical_names: dict[tuple[int, int], str],
+    expected: list[tuple[int, int]] | None,
+    outcome: contextlib.nullcontext | pytest.RaisesExc,
+) -> None:
+    with patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh, outcome:
+        mock_gmsh.model.getPhysicalGroups.return_value = physical_groups
+        mock_gmsh.model.getPhysicalName.side_effect = lambda dimension, tag: physical_names[(dimension, tag)]
+        mock_gmsh.model.getEntitiesForPhysicalGroup.side_effect = lambda dimension, tag: [tag]  # noqa: ARG005
+        mock_gmsh.model.getEntities.return_value = entities
+        mock_gmsh.model.getEntityName.return_value = ""
+        try:
+            dim_tags = _gmsh_python._part_entities(part_name, fallback=fallback)
+            assert dim_tags == expected
+        finally:
+            pass
+
+
+edge_seeds = {
+    "number": (
+        [("edge", "4")],
+        10.0,
+        [call(1, 5), call(2, 5)],
+        does_not_raise,
+    ),
+    "size": (
+        [("edge", "0.3")],
+        1.0,
+        [call(1, 5), call(2, 5)],
+        does_not_raise,
+    ),
+    "negative": (
+        [("edge", "-1")],
+        1.0,
+        [],
+        pytest.raises(ValueError),
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "name_number, curve_length, expected_calls, outcome",
+    edge_seeds.values(),
+    ids=edge_seeds.keys(),
+)
+def test_edge_seeds(
+    name_number: list[tuple[str, str]],
+    curve_length: float,
+    expected_calls: list,
+    outcome: contextlib.nullcontext | pytest.RaisesExc,
+) -> None:
+    with (
+        patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh,
+        patch("turbo_turtle._gmsh_python._entities_of_dimension", return_value=[1, 2]),
+        outcome,
+    ):
+        mock_gmsh.model.occ.getMass.return_value = curve_length
+        try:
+            _gmsh_python._edge_seeds(name_number)
+            assert mock_gmsh.model.mesh.setTransfiniteCurve.call_args_list == expected_calls
+        finally:
+            pass
+
+
+def test_entities_of_dimension() -> None:
+    with (
+        patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh,
+        patch("turbo_turtle._gmsh_python._entities_from_name", return_value=[(1, 7), (3, 1)]),
+    ):
+        mock_gmsh.model.getBoundary.side_effect = [[(2, -1), (2, 2)], [(1, 3), (1, -4), (1, 7)]]
+        tags = _gmsh_python._entities_of_dimension("name", 1)
+    assert tags == [3, 4, 7]
+
+    with (
+        patch("turbo_turtle._gmsh_python.gmsh"),
+        patch("turbo_turtle._gmsh_python._entities_from_name", return_value=[]),
+        pytest.raises(RuntimeError),
+    ):
+        _gmsh_python._entities_of_dimension("name", 1)
+
+
+partition_tool_coordinates = {
+    "3D": (
+        {},
+        15,
+        does_not_raise,
+    ),
+    "planar: exclude XY plane": (
+        {"planar": True},
+        14,
+        does_not_raise,
+    ),
+    "non-orthogonal vectors": (
+        {"xvector": (1.0, 0.0, 1.0)},
+        None,
+        pytest.raises(RuntimeError),
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected_length, outcome",
+    partition_tool_coordinates.values(),
+    ids=partition_tool_coordinates.keys(),
+)
+def test_partition_tool_coordinates(
+    kwargs: dict, expected_length: int | None, outcome: contextlib.nullcontext | pytest.RaisesExc
+) -> None:
+    arguments = {"center": (0.0, 0.0, 0.0), "xvector": (1.0, 0.0, 0.0), "zvector": (0.0, 0.0, 1.0), "big_number": 2.0}
+    arguments.update(kwargs)
+    with outcome:
+        try:
+            surfaces = _gmsh_python._partition_tool_coordinates(**arguments)
+            assert len(surfaces) == expected_length
+            squares = [surface for surface in surfaces if len(surface) == 4]
+            triangles = [surface for surface in surfaces if len(surface) == 3]
+            assert len(squares) == expected_length - 12
+            assert len(triangles) == 12
+            for square in squares:
+                assert numpy.allclose(numpy.mean(square, axis=0), arguments["center"])
+                assert numpy.allclose(numpy.max(numpy.abs(square)), arguments["big_number"])
+            for triangle in triangles:
+                assert numpy.allclose(triangle[0], arguments["center"])
+        finally:
+            pass
+
+
+def test_partition() -> None:
+    dim_tags = [(3, 1), (3, 2)]
+    with (
+        patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh,
+        patch("turbo_turtle._gmsh_python._part_entities", return_value=dim_tags),
+        patch("turbo_turtle._gmsh_python._create_surface_from_coordinates", side_effect=range(100, 115)),
+        patch("turbo_turtle._gmsh_python._restore_physical_groups") as mock_restore,
+        patch("turbo_turtle._gmsh_python._entity_closure", return_value={(3, 1), (3, 2), (2, 1)}),
+    ):
+        mock_gmsh.model.getPhysicalGroups.return_value = [(3, 7)]
+        mock_gmsh.model.getPhysicalName.return_value = "washer"
+        mock_gmsh.model.getEntitiesForPhysicalGroup.return_value = [1, 2]
+        tool_map = [[(2, 20)]] * 14 + [[(2, 21), (2, 30)]]
+        mock_gmsh.model.occ.fragment.return_value = ([], [[(3, 3), (3, 4)], [(3, 5)], *tool_map])
+        part_dim_tags = _gmsh_python._partition(part_name=["washer", "vase"], big_number=2.0)
+
+    mock_gmsh.model.occ.fragment.assert_called_once_with(dim_tags, [(2, tag) for tag in range(100, 115)])
+    mock_gmsh.model.occ.remove.assert_called_once_with([(2, 20), (2, 21), (2, 30)], recursive=True)
+    mock_restore.assert_called_once_with(
+        [(3, 7, "washer", [1, 2])], {(3, 1): [(3, 3), (3, 4)], (3, 2): [(3, 5)]}, {(3, 1), (3, 2), (2, 1)}
+    )
+    assert part_dim_tags == [(3, 3), (3, 4), (3, 5)]
+
+
+def test_entity_closure() -> None:
+    boundaries = {
+        ((3, 1),): [(2, 1), (2, -2)],
+        ((2, 1), (2, 2)): [(1, 1), (1, -2), (1, 2)],
+        ((1, 1), (1, 2)): [(0, 1), (0, 2)],
+    }
+    with patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh:
+        mock_gmsh.model.getBoundary.side_effect = lambda dim_tags, **_kwargs: boundaries[tuple(dim_tags)]
+        closure = _gmsh_python._entity_closure([(3, 1)])
+    assert closure == {(3, 1), (2, 1), (2, 2), (1, 1), (1, 2), (0, 1), (0, 2)}
+
+
+def test_restore_physical_groups() -> None:
+    physical_groups = [
+        (3, 7, "washer", [1, 2]),
+        (2, 8, "top", [9]),
+        (1, 9, "missing", [4]),
+        (2, 10, "renumbered", [3]),
+    ]
+    dim_tags_map = {(3, 1): [(3, 3), (3, 4)], (3, 2): [(3, 5)]}
+    touched = {(3, 1), (3, 2), (2, 3)}
+    entities = {3: [(3, 3), (3, 4), (3, 5)], 2: [(2, 3), (2, 9)], 1: [(1, 1)]}
+    with patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh:
+        mock_gmsh.model.getEntities.side_effect = lambda dimension: entities[dimension]
+        _gmsh_python._restore_physical_groups(physical_groups, dim_tags_map, touched)
+    mock_gmsh.model.removePhysicalGroups.assert_called_once()
+    assert mock_gmsh.model.removePhysicalName.call_args_list == [
+        call("washer"),
+        call("top"),
+        call("missing"),
+        call("renumbered"),
+    ]
+    assert mock_gmsh.model.addPhysicalGroup.call_args_list == [
+        call(3, [3, 4, 5], tag=7, name="washer"),
+        call(2, [9], tag=8, name="top"),
+    ]
+
+
+mask_tags = numpy.array([1, 2, 3])
+mask_boxes = numpy.array(
+    [
+        [0.0, 0.0, 0.0, 1.0, 1.0, 0.0],
+        [0.0, 0.0, 1.0, 1.0, 1.0, 1.0],
+        [0.0, 0.0, 0.0, 0.0, 1.0, 1.0],
+    ]
+)
+mask_entities = {
+    "tags": ("3 1", [1, 3], does_not_raise),
+    "comma separated tags": ("1,2", [1, 2], does_not_raise),
+    "box": ("box -1 -1 -0.1 2 2 0.1", [1], does_not_raise),
+    "box: uppercase keyword": ("BOX -1 -1 0.9 2 2 1.1", [2], does_not_raise),
+    "near": ("near 0.5 0.5 -0.1 0.5 0.5 1.1", [1, 2], does_not_raise),
+    "missing tag": ("4", None, pytest.raises(RuntimeError)),
+    "empty box": ("box 5 5 5 6 6 6", None, pytest.raises(RuntimeError)),
+    "short box": ("box 1 2 3", None, pytest.raises(RuntimeError)),
+    "partial near point": ("near 1 2", None, pytest.raises(RuntimeError)),
+    "not a number": ("top", None, pytest.raises(RuntimeError)),
+    "empty": ("", None, pytest.raises(RuntimeError)),
+}
+
+
+@pytest.mark.parametrize(
+    "mask, expected, outcome",
+    mask_entities.values(),
+    ids=mask_entities.keys(),
+)
+def test_mask_entities(
+    mask: str, expected: list[int] | None, outcome: contextlib.nullcontext | pytest.RaisesExc
+) -> None:
+    # Planar entities are exactly represented by their bounding boxes
+    def closest_point(dimension: int, tag: int, point: numpy.ndarray) -> tuple[numpy.ndarray, numpy.ndarray]:  # noqa: ARG001
+        box = mask_boxes[tag - 1]
+        return numpy.clip(point, box[0:3], box[3:6]), numpy.array([])
+
+    with patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh, outcome:
+        mock_gmsh.model.getClosestPoint.side_effect = closest_point
+        try:
+            tags = _gmsh_python._mask_entities(mask, mask_tags, mask_boxes, dimension=2)
+            assert tags == expected
+        finally:
+            pass
+
+
+def test_nearest_entity() -> None:
+    point = numpy.array([0.5, 0.5, 0.1])
+    with patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh:
+        mock_gmsh.model.getClosestPoint.return_value = (numpy.array([0.5, 0.5, 0.0]), numpy.array([]))
+        tag = _gmsh_python._nearest_entity(point, mask_tags, mask_boxes, dimension=2)
+    assert tag == 1
+    # The bounding box lower bound of the remaining entities exceeds the nearest distance found
+    mock_gmsh.model.getClosestPoint.assert_called_once()
+
+    with patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh:
+        tag = _gmsh_python._nearest_entity(point, mask_tags, mask_boxes, dimension=0)
+    assert tag == 1
+    mock_gmsh.model.getClosestPoint.assert_not_called()
+
+    with pytest.raises(RuntimeError):
+        _gmsh_python._nearest_entity(point, numpy.array([], dtype=int), numpy.empty((0, 6)), dimension=2)
+
+
+def test_sets() -> None:
+    with (
+        patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh,
+        patch("turbo_turtle._gmsh_python._entity_index", return_value=(mask_tags, mask_boxes)) as mock_index,
+    ):
+        groups = _gmsh_python._sets(face_sets=[("bottom", "1"), ("top", "2")], vertex_sets=[("origin", "3")])
+    mock_gmsh.model.occ.synchronize.assert_called_once()
+    assert mock_index.call_args_list == [call(2), call(0)]
+    assert groups == {(2, "bottom"): [1], (2, "top"): [2], (0, "origin"): [3]}
+    assert mock_gmsh.model.addPhysicalGroup.call_args_list == [
+        call(2, [1], name="bottom"),
+        call(2, [2], name="top"),
+        call(0, [3], name="origin"),
+    ]
+
+
+sets_output_file = {
+    "default": (None, "box.xao", does_not_raise),
+    "xao": ("groups.xao", "groups.xao", does_not_raise),
+    "unsupported suffix": ("groups.cae", "groups.xao", does_not_raise),
+    "step": ("groups.step", None, pytest.raises(RuntimeError)),
+    "brep": ("groups.brep", None, pytest.raises(RuntimeError)),
+}
+
+
+@pytest.mark.parametrize(
+    "output_file, expected_file, outcome",
+    sets_output_file.values(),
+    ids=sets_output_file.keys(),
+)
+def test_sets_round_trip(
+    output_file: str | None, expected_file: str | None, outcome: contextlib.nullcontext | pytest.RaisesExc
+) -> None:
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        directory = pathlib.Path(temporary_directory)
+        input_file = directory / "box.step"
+        with _gmsh_python.session():
+            gmsh.model.occ.addBox(0.0, 0.0, 0.0, 1.0, 1.0, 1.0)
+            gmsh.model.occ.synchronize()
+            gmsh.write(str(input_file))
+        with outcome:
+            try:
+                _gmsh_python.sets(
+                    input_file,
+                    output_file=directory / output_file if output_file is not None else None,
+                    face_sets=[("bottom", "box -1 -1 -0.1 2 2 0.1")],
+                )
+                with _gmsh_python.session():
+                    gmsh.open(str(directory / expected_file))
+                    groups = {
+                        gmsh.model.getPhysicalName(dimension, tag): (
+                            dimension,
+                            len(gmsh.model.getEntitiesForPhysicalGroup(dimension, tag)),
+                        )
+                        for dimension, tag in gmsh.model.getPhysicalGroups()
+                    }
+                assert groups == {"bottom": (2, 1)}
+            finally:
+                pass
+
+
+def test_match_shapes() -> None:
+    shapes = [("washer", 1.0, (0.0, 0.0, 0.0)), ("vase", 2.0, (0.0, 1.0, 0.0)), ("vase", 2.0, (0.0, -1.0, 0.0))]
+    signatures = {
+        (3, 1): (2.0, (0.0, -1.0, 0.0)),
+        (3, 2): (1.0, (0.0, 0.0, 0.0)),
+        (3, 3): (2.0, (0.0, 1.0, 0.0)),
+    }
+    with patch("turbo_turtle._gmsh_python._shape_signature", side_effect=lambda dim_tag: signatures[dim_tag]):
+        names = _gmsh_python._match_shapes([(3, 1), (3, 2), (3, 3)], shapes)
+    assert names == ["vase", "washer", "vase"]
+
+    with pytest.raises(RuntimeError):
+        _gmsh_python._match_shapes([(3, 1)], shapes)
+
+
+merge_shapes = {
+    "all parts": (
+        [],
+        False,
+        [(3, 1), (3, 2), (3, 3)],
+        ["sphere", "washer", "vase"],
+        [],
+        does_not_raise,
+    ),
+    "part name": (
+        ["vase", "sphere"],
+        False,
+        [(3, 1), (3, 3)],
+        ["sphere", "vase"],
+        [(3, 2)],
+        does_not_raise,
+    ),
+    "fragment": (
+        ["washer", "vase"],
+        True,
+        [(3, 4), (3, 5), (3, 6)],
+        ["washer", "washer", "vase"],
+        [(3, 1)],
+        does_not_raise,
+    ),
+    "missing part name": (
+        ["missing"],
+        False,
+        None,
+        None,
+        [(3, 1), (3, 2), (3, 3)],
+        pytest.raises(RuntimeError),
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "part_name, fragment, expected_dim_tags, expected_names, expected_remove, outcome",
+    merge_shapes.values(),
+    ids=merge_shapes.keys(),
+)
+def test_merge(
+    part_name: list[str],
+    fragment: bool,
+    expected_dim_tags: list[tuple[int, int]] | None,
+    expected_names: list[str] | None,
+    expected_remove: list[tuple[int, int]],
+    outcome: contextlib.nullcontext | pytest.RaisesExc,
+) -> None:
+    serialized = ["sphere.brep", "multi.brep"]
+    loaded = [[("sphere", 1.0, (0.0, 0.0, 0.0))], [("washer", 2.0, (0.0, 0.0, 0.0)), ("vase", 3.0, (0.0, 0.0, 0.0))]]
+    imported = {"sphere.brep": [(3, 1)], "multi.brep": [(3, 2), (3, 3)]}
+    with (
+        patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh,
+        patch("turbo_turtle._gmsh_python._match_shapes", side_effect=[["sphere"], ["washer", "vase"]]),
+        outcome,
+    ):
+        mock_gmsh.model.occ.importShapes.side_effect = lambda path, highestDimOnly: imported[path]  # noqa: ARG005, N803
+        mock_gmsh.model.occ.fragment.return_value = ([], [[(3, 4), (3, 5)], [(3, 6)]])
+        try:
+            dim_tags, names = _gmsh_python._merge(serialized, loaded, part_name=part_name, fragment=fragment)
+            assert dim_tags == expected_dim_tags
+            assert names == expected_names
+            if fragment:
+                mock_gmsh.model.occ.fragment.assert_called_once_with([(3, 2), (3, 3)], [])
+            else:
+                mock_gmsh.model.occ.fragment.assert_not_called()
+        finally:
+            if expected_remove:
+                mock_gmsh.model.occ.remove.assert_called_once_with(expected_remove, recursive=True)
+            else:
+                mock_gmsh.model.occ.remove.assert_not_called()
+
+
+merge_output_file = {
+    "xao": ("merge.xao", "merge.xao", {"box": (3, 1)}, False),
+    "unsupported suffix": ("merge.cae", "merge.xao", {"box": (3, 1)}, False),
+    "step": ("merge.step", "merge.step", {}, True),
+}
+
+
+@pytest.mark.parametrize(
+    "output_file, expected_file, expected_groups, warning",
+    merge_output_file.values(),
+    ids=merge_output_file.keys(),
+)
+def test_merge_output_file(
+    output_file: str,
+    expected_file: str,
+    expected_groups: dict[str, tuple[int, int]],
+    warning: bool,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        directory = pathlib.Path(temporary_directory)
+        input_file = directory / "box.step"
+        with _gmsh_python.session():
+            gmsh.model.occ.addBox(0.0, 0.0, 0.0, 1.0, 1.0, 1.0)
+            gmsh.model.occ.synchronize()
+            gmsh.write(str(input_file))
+        with caplog.at_level(logging.WARNING, logger=_gmsh_python._logger.name):
+            _gmsh_python.merge([input_file], directory / output_file, jobs=1)
+        with _gmsh_python.session():
+            gmsh.open(str(directory / expected_file))
+            groups = {
+                gmsh.model.getPhysicalName(dimension, tag): (
+                    dimension,
+                    len(gmsh.model.getEntitiesForPhysicalGroup(dimension, tag)),
+                )
+                for dimension, tag in gmsh.model.getPhysicalGroups()
+            }
+    assert groups == expected_groups
+    assert ("Merged part names are not preserved" in caplog.text) is warning
+
+
+merge_jobs = {
+    "serial": (None, 1),
+    "cpu count": (0, 3),
+    "jobs": (2, 2),
+}
+
+
+@pytest.mark.parametrize(
+    "jobs, expected_workers",
+    merge_jobs.values(),
+    ids=merge_jobs.keys(),
+)
+def test_merge_jobs(jobs: int | None, expected_workers: int) -> None:
+    with (
+        patch("turbo_turtle._gmsh_python.gmsh"),
+        patch("concurrent.futures.ProcessPoolExecutor") as mock_executor,
+        patch("os.cpu_count", return_value=4),
+        patch("turbo_turtle._gmsh_python._call_session"),
+        patch("turbo_turtle._gmsh_python._merge", return_value=([], [])),
+        patch("turbo_turtle._gmsh_python._add_named_physical_groups"),
+        patch("turbo_turtle._gmsh_python._write"),
+    ):
+        _gmsh_python.merge(["one.step", "two.step", "three.step"], "merge.xao", jobs=jobs)
+    assert mock_executor.call_args.kwargs["max_workers"] == expected_workers
+
+
+def test_add_named_physical_groups() -> None:
+    with patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh:
+        _gmsh_python._add_named_physical_groups(
+            [(3, 2), (3, 1), (2, 5), (3, 1)], ["washer", "washer", "washer", "vase"]
+        )
+    assert mock_gmsh.model.addPhysicalGroup.call_args_list == [
+        call(3, [1, 2], name="washer"),
+        call(2, [5], name="washer"),
+        call(3, [1], name="vase"),
+    ]
+
+
+@pytest.mark.parametrize("gmsh_type", _gmsh_python._gmsh_element_types.keys())
+def test_gmsh_element_types(gmsh_type: int) -> None:
+    _abaqus_type, abaqus_order, _exodus_type, exodus_order = _gmsh_python._gmsh_element_types[gmsh_type]
+    number_of_nodes = {11: 10, 17: 20, 18: 15}
+    for node_order in (abaqus_order, exodus_order):
+        if node_order is not None:
+            assert sorted(node_order) == list(range(number_of_nodes[gmsh_type]))
+
+
+part_blocks = {
+    "abaqus default": (
+        None,
+        "abaqus",
+        [("washer", "C3D10", [1, 2], [[1, 2, 3, 4, 5, 6, 7, 8, 10, 9], [11, 12, 13, 14, 15, 16, 17, 18, 20, 19]])],
+        does_not_raise,
+    ),
+    "genesis replacement": (
+        "TETRA",
+        "genesis",
+        [("washer", "TETRA", [1, 2], [[1, 2, 3, 4, 5, 6, 7, 8, 10, 9], [11, 12, 13, 14, 15, 16, 17, 18, 20, 19]])],
+        does_not_raise,
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "element_type, output_type, expected, outcome",
+    part_blocks.values(),
+    ids=part_blocks.keys(),
+)
+def test_part_blocks(
+    element_type: str | None,
+    output_type: str,
+    expected: list[tuple[str, str, list[int], list[list[int]]]],
+    outcome: contextlib.nullcontext | pytest.RaisesExc,
+) -> None:
+    elements = {
+        (3, 1): ([11], [[1]], [list(range(1, 11))]),
+        (3, 2): ([11], [[2]], [list(range(11, 21))]),
+    }
+    with (
+        patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh,
+        patch("turbo_turtle._gmsh_python._part_entities", return_value=[(3, 1), (3, 2)]),
+        outcome,
+    ):
+        mock_gmsh.model.mesh.getElements.side_effect = lambda dimension, tag: elements[(dimension, tag)]
+        try:
+            blocks = _gmsh_python._part_blocks("washer", element_type, output_type)
+            assert len(blocks) == len(expected)
+            for block, expected_block in zip(blocks, expected, strict=True):
+                assert block[0:2] == expected_block[0:2]
+                numpy.testing.assert_array_equal(block[2], expected_block[2])
+                numpy.testing.assert_array_equal(block[3], expected_block[3])
+        finally:
+            pass
+
+
+def test_part_blocks_unsupported() -> None:
+    with (
+        patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh,
+        patch("turbo_turtle._gmsh_python._part_entities", return_value=[(1, 1)]),
+        pytest.raises(RuntimeError),
+    ):
+        mock_gmsh.model.mesh.getElements.return_value = ([1], [[1]], [[1, 2]])
+        _gmsh_python._part_blocks("edge", None, "abaqus")
+
+
+def test_node_sets() -> None:
+    names = {(2, 1): "top", (2, 2): "", (3, 3): "washer", (0, 4): "far"}
+    nodes = {(2, 1): [3, 4, 9], (0, 4): [9]}
+    with patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh:
+        mock_gmsh.model.getPhysicalGroups.return_value = list(names.keys())
+        mock_gmsh.model.getPhysicalName.side_effect = lambda dimension, tag: names[(dimension, tag)]
+        mock_gmsh.model.mesh.getNodesForPhysicalGroup.side_effect = lambda dimension, tag: (nodes[(dimension, tag)], [])
+        node_sets = _gmsh_python._node_sets(numpy.array([1, 2, 3, 4]), maximum_dimension=3)
+    assert [name for name, _tags in node_sets] == ["top"]
+    numpy.testing.assert_array_equal(node_sets[0][1], [3, 4])
+
+
+@pytest.mark.parametrize("output_type", ["abaqus", "genesis"])
+def test_export_unknown_part(output_type: str) -> None:
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        directory = pathlib.Path(temporary_directory)
+        input_file = directory / "box.msh"
+        with _gmsh_python.session():
+            gmsh.model.occ.addBox(0.0, 0.0, 0.0, 1.0, 1.0, 1.0)
+            gmsh.model.occ.synchronize()
+            gmsh.model.addPhysicalGroup(3, [1], name="box")
+            gmsh.model.mesh.generate(3)
+            gmsh.write(str(input_file))
+        with pytest.raises(RuntimeError, match="Could not find any entities with prefix 'bxo'"):
+            _gmsh_python.export(input_file, part_name=["bxo"], destination=directory, output_type=output_type)  # type: ignore[arg-type]
+        assert sorted(path.name for path in directory.iterdir()) == ["box.msh"]
+
+
+def test_export_output_type() -> None:
+    with patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh, pytest.raises(RuntimeError):
+        _gmsh_python.export("input.msh", output_type="genesis-hdf5")
+    mock_gmsh.initialize.assert_not_called()
+
+
+display_available = {
+    "linux display": ("linux", {"DISPLAY": ":0"}, True),
+    "linux wayland": ("linux", {"WAYLAND_DISPLAY": "wayland-0"}, True),
+    "linux headless": ("linux", {}, False),
+    "windows": ("win32", {}, True),
+}
+
+
+@pytest.mark.parametrize(
+    "platform, environment, expected",
+    display_available.values(),
+    ids=display_available.keys(),
+)
+def test_display_available(platform: str, environment: dict[str, str], expected: bool) -> None:
+    with patch("sys.platform", platform), patch.dict("os.environ", environment, clear=True):
+        assert _gmsh_python._display_available() is expected
+
+
+rotation_matrix = {
+    "identity": ((0.0, 0.0, 0.0), numpy.eye(3)),
+    "x": ((90.0, 0.0, 0.0), numpy.array([[1.0, 0.0, 0.0], [0.0, 0.0, -1.0], [0.0, 1.0, 0.0]])),
+    "x then z": ((90.0, 0.0, 90.0), numpy.array([[0.0, 0.0, 1.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])),
+}
+
+
+@pytest.mark.parametrize(
+    "angles, expected",
+    rotation_matrix.values(),
+    ids=rotation_matrix.keys(),
+)
+def test_rotation_matrix(angles: tuple[float, float, float], expected: numpy.ndarray) -> None:
+    assert numpy.allclose(_gmsh_python._rotation_matrix(*angles), expected)
+
+
+image = {
+    "display": (False, True, False),
+    "no display": (False, False, True),
+    "offscreen": (True, True, True),
+}
+
+
+@pytest.mark.parametrize(
+    "offscreen, display, expected_offscreen",
+    image.values(),
+    ids=image.keys(),
+)
+def test_image(offscreen: bool, display: bool, expected_offscreen: bool) -> None:
+    views = [("90", "0", "0", "top.png")]
+    expected_views = [(0.0, 0.0, 0.0, pathlib.Path("image.png")), (90.0, 0.0, 0.0, pathlib.Path("top.png"))]
+    with (
+        patch("turbo_turtle._gmsh_python.gmsh") as mock_gmsh,
+        patch("turbo_turtle._gmsh_python._display_available", return_value=display),
+        patch("turbo_turtle._gmsh_python._render_offscreen") as mock_render,
+    ):
+        _gmsh_python.image("input.msh", "image.png", views=views, offscreen=offscreen, image_size=(10, 20))
+    mock_gmsh.open.assert_called_once_with("input.msh")
+    if expected_offscreen:
+        mock_render.assert_called_once_with(expected_views, (10, 20))
+        mock_gmsh.fltk.initialize.assert_not_called()
+    else:
+        mock_render.assert_not_called()
+        mock_gmsh.fltk.initialize.assert_called_once()
+        assert mock_gmsh.write.call_args_list == [call("image.png"), call("top.png")]
+
+
+def test_render_offscreen() -> None:
+    coordinates = numpy.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [1.0, 1.0, 0.0]])
+    polygons = [numpy.array([[0, 1, 2]]), numpy.array([[0, 1, 3, 2]])]
+    with (
+        tempfile.TemporaryDirectory() as temporary_directory,
+        patch("turbo_turtle._gmsh_python._surface_polygons", return_value=(coordinates, polygons)),
+    ):
+        front = pathlib.Path(temporary_directory) / "front.png"
+        isometric = pathlib.Path(temporary_directory) / "isometric.svg"
+        _gmsh_python._render_offscreen([(0.0, 0.0, 0.0, front), (45.0, -45.0, 0.0, isometric)], image_size=(40, 20))
+        assert front.read_bytes().startswith(b"\x89PNG")
+        assert "<svg" in isometric.read_text()
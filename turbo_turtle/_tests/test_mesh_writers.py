@@ -0,0 +1,135 @@
+"""Test :mod:`turbo_turtle._mesh_writers`."""
+
+import io
+import pathlib
+import struct
+import tempfile
+
+import numpy
+import pytest
+
+from turbo_turtle import _mesh_writers
+
+row_format = {
+    "single line": (["%d", "%d"], None, "%d, %d\n"),
+    "continuation": (["%d"] * 3, 2, "%d, %d,\n%d\n"),
+    "exact line": (["%d"] * 2, 2, "%d, %d\n"),
+}
+
+
+@pytest.mark.parametrize(
+    "entries, maximum_entries, expected",
+    row_format.values(),
+    ids=row_format.keys(),
+)
+def test_row_format(entries: list[str], maximum_entries: int | None, expected: str) -> None:
+    assert _mesh_writers._row_format(entries, maximum_entries) == expected
+
+
+def test_write_rows() -> None:
+    stream = io.StringIO()
+    _mesh_writers._write_rows(stream, "%d, %d\n", numpy.array([[1, 2], [3, 4], [5, 6]]), chunk_size=2)
+    assert stream.getvalue() == "1, 2\n3, 4\n5, 6\n"
+
+
+write_list = {
+    "short": (numpy.array([1, 2, 3]), 2, "1, 2\n3\n"),
+    "full lines": (numpy.array([1, 2, 3, 4]), 2, "1, 2\n3, 4\n"),
+    "empty": (numpy.array([], dtype=int), 2, ""),
+}
+
+
+@pytest.mark.parametrize(
+    "values, maximum_entries, expected",
+    write_list.values(),
+    ids=write_list.keys(),
+)
+def test_write_list(values: numpy.ndarray, maximum_entries: int, expected: str) -> None:
+    stream = io.StringIO()
+    _mesh_writers._write_list(stream, values, maximum_entries=maximum_entries)
+    assert stream.getvalue() == expected
+
+
+def test_abaqus() -> None:
+    node_tags = numpy.array([1, 2, 3, 4])
+    coordinates = numpy.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.5]])
+    blocks = [("plate", "CPS4R", numpy.array([10]), numpy.array([[1, 2, 3, 4]]))]
+    node_sets = [("left", numpy.array([1, 4]))]
+    expected = (
+        "*NODE\n"
+        "1, 0, 0\n"
+        "2, 1, 0\n"
+        "3, 1, 1\n"
+        "4, 0, 0.5\n"
+        "*ELEMENT, TYPE=CPS4R, ELSET=plate\n"
+        "10, 1, 2, 3, 4\n"
+        "*NSET, NSET=left\n"
+        "1, 4\n"
+    )
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        output_file = pathlib.Path(temporary_directory) / "plate.inp"
+        _mesh_writers.abaqus(output_file, node_tags, coordinates, blocks, node_sets=node_sets)
+        assert output_file.read_text() == expected
+
+
+def test_abaqus_continuation() -> None:
+    node_tags = numpy.arange(1, 21)
+    coordinates = numpy.zeros((20, 3))
+    blocks = [("brick", "C3D20", numpy.array([1]), numpy.arange(1, 21).reshape(1, -1))]
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        output_file = pathlib.Path(temporary_directory) / "brick.inp"
+        _mesh_writers.abaqus(output_file, node_tags, coordinates, blocks)
+        lines = output_file.read_text().splitlines()
+    element_lines = lines[lines.index("*ELEMENT, TYPE=C3D20, ELSET=brick") + 1 :]
+    assert element_lines == [", ".join(str(number) for number in [1, *range(1, 16)]) + ",", "16, 17, 18, 19, 20"]
+
+
+def test_netcdf() -> None:
+    variables = [("a", ("x",), {}, numpy.array([1, 2]))]
+    header = b"CDF\x01" + struct.pack(">i", 0)
+    header += struct.pack(">ii", 10, 1) + struct.pack(">i", 1) + b"x\x00\x00\x00" + struct.pack(">i", 2)
+    header += b"\x00" * 8
+    header += struct.pack(">ii", 11, 1) + struct.pack(">i", 1) + b"a\x00\x00\x00" + struct.pack(">ii", 1, 0)
+    header += b"\x00" * 8 + struct.pack(">ii", 4, 8)
+    begin = len(header) + 4
+    expected = header + struct.pack(">i", begin) + struct.pack(">ii", 1, 2)
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        output_file = pathlib.Path(temporary_directory) / "test.nc"
+        _mesh_writers._netcdf(output_file, {"x": 2}, {}, variables, large=False)
+        assert output_file.read_bytes() == expected
+
+
+@pytest.mark.parametrize("large, magic", [(True, b"CDF\x02"), (False, b"CDF\x01")], ids=["large", "normal"])
+def test_genesis(large: bool, magic: bytes) -> None:
+    node_tags = numpy.array([5, 6, 7, 8])
+    coordinates = numpy.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+    blocks = [("tetra", "TETRA4", numpy.array([3]), numpy.array([[5, 6, 7, 8]]))]
+    node_sets = [("bottom", numpy.array([5, 6, 7]))]
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        output_file = pathlib.Path(temporary_directory) / "tetra.g"
+        _mesh_writers.genesis(output_file, node_tags, coordinates, blocks, node_sets=node_sets, large=large)
+        data = output_file.read_bytes()
+    assert data.startswith(magic)
+    for name in (b"connect1", b"elem_type", b"TETRA4", b"node_ns1", b"node_num_map", b"elem_num_map"):
+        assert name in data
+    assert (b"coordx" in data) is large
+    # Connectivity is written with one-based local node indices as the final variable
+    assert data.endswith(struct.pack(">4i", 1, 2, 3, 4) + struct.pack(">3i", 1, 2, 3))
+
+
+genesis_int32_overflow = {
+    "node tag": (numpy.array([5, 6, 7, 2**31]), numpy.array([3])),
+    "element tag": (numpy.array([5, 6, 7, 8]), numpy.array([2**31])),
+}
+
+
+@pytest.mark.parametrize(
+    "node_tags, element_tags",
+    genesis_int32_overflow.values(),
+    ids=genesis_int32_overflow.keys(),
+)
+def test_genesis_int32_overflow(node_tags: numpy.ndarray, element_tags: numpy.ndarray) -> None:
+    coordinates = numpy.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+    blocks = [("tetra", "TETRA4", element_tags, node_tags.reshape(1, -1))]
+    with tempfile.TemporaryDirectory() as temporary_directory, pytest.raises(RuntimeError):
+        _mesh_writers.genesis(pathlib.Path(temporary_directory) / "tetra.g", node_tags, coordinates, blocks)
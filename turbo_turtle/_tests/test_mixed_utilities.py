@@ -7,8 +7,11 @@
 """
 
 import contextlib
+import pathlib
+import stat
 import sys
-from unittest.mock import mock_open, patch
+import tempfile
+from unittest.mock import patch
 
 import numpy
 import pytest
@@ -349,26 +352,101 @@ def test_element_type_regex(content: str, element_type: str, expected: str) -> N
     assert new_contents == expected
 
 
-def test_substitute_element_type() -> None:
+substitute_element_type = {
+    "changed": (
+        "*Part\n*Element, type=C3D8\n1, 1, 2, 3, 4, 5, 6, 7, 8\n*ELEMENT, TYPE=C3D8\n",
+        "C3D8R",
+        "*Part\n*Element, type=C3D8R\n1, 1, 2, 3, 4, 5, 6, 7, 8\n*ELEMENT, TYPE=C3D8R\n",
+    ),
+    "unchanged": (
+        "*Part\n*Element, type=C3D8R\n1, 1, 2, 3, 4, 5, 6, 7, 8\n",
+        "C3D8R",
+        "*Part\n*Element, type=C3D8R\n1, 1, 2, 3, 4, 5, 6, 7, 8\n",
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "content, element_type, expected",
+    substitute_element_type.values(),
+    ids=substitute_element_type.keys(),
+)
+def test_substitute_element_type(content: str, element_type: str, expected: str) -> None:
     """Test :func:`turbo_turtle._abaqus_python._mixed_utilities.substitute_element_type`."""
-    with (
-        patch("builtins.open", mock_open(read_data="old_content")) as open_mock,
-        patch(
-            "turbo_turtle._abaqus_python.turbo_turtle_abaqus._mixed_utilities._element_type_regex",
-            return_value="old_content",
-        ),
-    ):
-        _mixed_utilities.substitute_element_type("dummy.inp", "dummy_element_type")
-        open_mock.assert_called_once()
-    with (
-        patch("builtins.open", mock_open(read_data="old_content")) as open_mock,
-        patch(
-            "turbo_turtle._abaqus_python.turbo_turtle_abaqus._mixed_utilities._element_type_regex",
-            return_value="new_content",
-        ),
-    ):
-        _mixed_utilities.substitute_element_type("dummy.inp", "dummy_element_type")
-        assert open_mock.call_count == 2
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        mesh_file = pathlib.Path(temporary_directory) / "mesh.inp"
+        mesh_file.write_text(content)
+        mesh_file.chmod(0o644)
+        inode = mesh_file.stat().st_ino
+        _mixed_utilities.substitute_element_type(str(mesh_file), element_type)
+        assert mesh_file.read_text() == expected
+        assert stat.S_IMODE(mesh_file.stat().st_mode) == 0o644
+        # Unchanged files are not rewritten. Changed files are replaced by a renamed temporary file.
+        assert (mesh_file.stat().st_ino == inode) == (content == expected)
+        assert [path.name for path in pathlib.Path(temporary_directory).iterdir()] == ["mesh.inp"]
+
+
+keyword_blocks = {
+    "parts and assembly": (
+        [
+            "*Heading",
+            "*Part, name=Part-1\n*Node\n1, 0., 0.\n*End Part",
+            "*PART, NAME=part-2",
+            "*Element, type=CAX4\n1, 1, 2, 3, 4",
+            "*End Part",
+            "*Assembly, name=Assembly\n*Instance, name=Part-1, part=Part-1\n*End Instance\n*End Assembly",
+        ],
+        ["Part-1", "Part-2"],
+        {"Part-1": "*Node\n1, 0., 0.", "Part-2": "*Element, type=CAX4\n1, 1, 2, 3, 4"},
+        "*Instance, name=Part-1, part=Part-1\n*End Instance",
+    ),
+    "unrequested and missing parts": (
+        ["*Part, name=Part-10\n*Node\n*End Part", "*Part, name=Part-1\n*Node\n1, 0., 0.\n*End Part"],
+        ["Part-1", "Part-3"],
+        {"Part-1": "*Node\n1, 0., 0."},
+        None,
+    ),
+    "first part definition": (
+        ["*Part, name=Part-1\n*Node\nfirst\n*End Part\n*Part, name=Part-1\n*Node\nsecond\n*End Part"],
+        ["Part-1"],
+        {"Part-1": "*Node\nfirst"},
+        None,
+    ),
+    "quoted names and parameters": (
+        [
+            '*Part, name="Part 1"\n*Node\n1, 0., 0.\n*End Part',
+            "*Part, name=Part-2, instance=Part-2-1\n*Node\n2, 0., 0.\n*End Part",
+            '*PART,NAME="PART-3" ,INSTANCE=PART-3-1\n*Node\n3, 0., 0.\n*End Part',
+        ],
+        ["Part 1", "Part-2", "Part-3"],
+        {"Part 1": "*Node\n1, 0., 0.", "Part-2": "*Node\n2, 0., 0.", "Part-3": "*Node\n3, 0., 0."},
+        None,
+    ),
+    "part without mesh data": (
+        [
+            "*Part, name=Part-1\n*End Part",
+            "*Part, name=Part-2\n*Surface, name=Outer\n*End Part",
+            "*Part, name=Part-3\n*Element, type=CAX4\n1, 1, 2, 3, 4\n*End Part",
+        ],
+        ["Part-1", "Part-2", "Part-3"],
+        {"Part-3": "*Element, type=CAX4\n1, 1, 2, 3, 4"},
+        None,
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "blocks, part_name, expected_parts, expected_assembly",
+    keyword_blocks.values(),
+    ids=keyword_blocks.keys(),
+)
+def test_keyword_blocks(
+    blocks: list[str], part_name: list[str], expected_parts: dict[str, str], expected_assembly: str | None
+) -> None:
+    """Test :func:`turbo_turtle._abaqus_python._mixed_utilities.keyword_blocks`."""
+    parts, assembly = _mixed_utilities.keyword_blocks(blocks, part_name)
+    assert parts == expected_parts
+    assert assembly == expected_assembly
 
 
 cubit_part_names = {
@@ -76,7 +76,7 @@ def test_construct_prog(basename: str, expected_prog: str) -> None:
 
 
 subcommand_parser = {
-    "geometry": ("geometry", ["--input-file", "input_file", "--output-file", "output_file"], []),
+    "geometry": ("geometry", ["--input-file", "input_file", "--output-file", "output_file"], ["jobs"]),
     "cylinder": (
         "cylinder",
         ["--inner-radius", "1.", "--outer-radius", "2.", "--height", "1.", "--output-file", "output_file"],
@@ -85,10 +85,23 @@ subcommand_parser = {
     "sphere": ("sphere", ["--inner-radius", "1.", "--outer-radius", "2.", "--output-file", "output_file"], ["center"]),
     "partition": ("partition", ["--input-file", "input_file"], []),
     "sets": ("sets", ["--input-file", "input_file"], []),
-    "mesh": ("mesh", ["--input-file", "input_file", "--element-type", "C3D8"], []),
-    "merge": ("merge", ["--input-file", "input_file", "--output-file", "output_file"], []),
-    "export": ("export", ["--input-file", "input_file"], ["output_type"]),
-    "image": ("image", ["--input-file", "input_file", "--output-file", "output_file"], []),
+    "mesh": (
+        "mesh",
+        ["--input-file", "input_file", "--element-type", "C3D8"],
+        [
+            "num_threads",
+            "algorithm_2d",
+            "algorithm_3d",
+            "distance_refinements",
+            "boundary_layers",
+            "curvature_elements",
+            "verbosity",
+            "log_file",
+        ],
+    ),
+    "merge": ("merge", ["--input-file", "input_file", "--output-file", "output_file"], ["fragment", "jobs"]),
+    "export": ("export", ["--input-file", "input_file"], ["output_type", "jobs"]),
+    "image": ("image", ["--input-file", "input_file", "--output-file", "output_file"], ["views", "offscreen"]),
 }
 
 
@@ -844,19 +844,25 @@ for test in gmsh_sphere_2D:
             "--backend gmsh"
         )
     )
-    if not missing_display:
+    for output_type in ("abaqus", "genesis"):
         test.append(
             string.Template(
-                "${turbo_turtle_command} image ${abaqus_command} ${cubit_command} "
-                "--input-file sphere.step --output-file sphere.step.png --x-angle 0 --y-angle 0 --backend gmsh"
+                "${turbo_turtle_command} export ${abaqus_command} ${cubit_command} "
+                f"--input-file sphere.msh --part-name sphere --output-type {output_type} --backend gmsh"
             )
         )
-        test.append(
-            string.Template(
-                "${turbo_turtle_command} image ${abaqus_command} ${cubit_command} "
-                "--input-file sphere.msh --output-file sphere.msh.png --x-angle 0 --y-angle 0 --backend gmsh"
-            )
+    test.append(
+        string.Template(
+            "${turbo_turtle_command} image ${abaqus_command} ${cubit_command} "
+            "--input-file sphere.step --output-file sphere.step.png --x-angle 0 --y-angle 0 --backend gmsh"
         )
+    )
+    test.append(
+        string.Template(
+            "${turbo_turtle_command} image ${abaqus_command} ${cubit_command} "
+            "--input-file sphere.msh --output-file sphere.msh.png --x-angle 0 --y-angle 0 --backend gmsh"
+        )
+    )
     commands_list.append(pytest.param(test, marks=pytest.mark.gmsh))
 gmsh_sphere_3D = [  # noqa: N816
     [
@@ -899,6 +905,12 @@ gmsh_sphere_3D = [  # noqa: N816
     ],
 ]
 for test in gmsh_sphere_3D:
+    test.append(
+        string.Template(
+            "${turbo_turtle_command} partition ${abaqus_command} ${cubit_command} "
+            "--input-file sphere.step --output-file sphere.step --backend gmsh"
+        )
+    )
     test.append(
         string.Template(
             "${turbo_turtle_command} mesh ${abaqus_command} ${cubit_command} "
@@ -906,23 +918,92 @@ for test in gmsh_sphere_3D:
             "--backend gmsh"
         )
     )
-    if not missing_display:
+    for output_type in ("abaqus", "genesis"):
         test.append(
             string.Template(
-                "${turbo_turtle_command} image ${abaqus_command} ${cubit_command} "
-                "--input-file sphere.step --output-file sphere.step.png --x-angle 45.0 --y-angle -45.0 "
-                "--backend gmsh"
+                "${turbo_turtle_command} export ${abaqus_command} ${cubit_command} "
+                f"--input-file sphere.msh --part-name sphere --output-type {output_type} --backend gmsh"
             )
         )
-        test.append(
-            string.Template(
-                "${turbo_turtle_command} image ${abaqus_command} ${cubit_command} "
-                "--input-file sphere.msh --output-file sphere.msh.png --x-angle 45.0 --y-angle -45.0 --backend gmsh"
-            )
+    test.append(
+        string.Template(
+            "${turbo_turtle_command} image ${abaqus_command} ${cubit_command} "
+            "--input-file sphere.step --output-file sphere.step.png --x-angle 45.0 --y-angle -45.0 "
+            "--backend gmsh"
         )
+    )
+    test.append(
+        string.Template(
+            "${turbo_turtle_command} image ${abaqus_command} ${cubit_command} "
+            "--input-file sphere.msh --output-file sphere.msh.png --x-angle 45.0 --y-angle -45.0 "
+            "--view 0. 0. 0. sphere.msh.front.png --view 90. 0. 0. sphere.msh.top.svg --offscreen --backend gmsh"
+        )
+    )
     commands_list.append(pytest.param(test, marks=pytest.mark.gmsh))
 
 # Merge tests
+commands_list.append(
+    pytest.param(
+        [
+            string.Template(
+                "${turbo_turtle_command} sphere ${abaqus_command} ${cubit_command} "
+                "--inner-radius 1. --outer-radius 2. --output-file merge-sphere.step --revolution-angle=360. "
+                "--backend gmsh"
+            ),
+            string.Template(
+                "${turbo_turtle_command} cylinder ${abaqus_command} ${cubit_command} "
+                "--inner-radius 2. --outer-radius 3. --height 1. --output-file merge-cylinder.step "
+                "--backend gmsh"
+            ),
+            string.Template(
+                "${turbo_turtle_command} merge ${abaqus_command} ${cubit_command} "
+                "--input-file merge-sphere.step merge-cylinder.step --output-file merge.step --fragment "
+                "--backend gmsh"
+            ),
+        ],
+        marks=pytest.mark.gmsh,
+    )
+)
+# Native Gmsh formats tests
+commands_list.append(
+    pytest.param(
+        [
+            string.Template(
+                "${turbo_turtle_command} sphere ${abaqus_command} ${cubit_command} "
+                "--inner-radius 1. --outer-radius 2. --output-file native-sphere.xao --revolution-angle=360. "
+                "--part-name native-sphere --backend gmsh"
+            ),
+            string.Template(
+                "${turbo_turtle_command} cylinder ${abaqus_command} ${cubit_command} "
+                "--inner-radius 2. --outer-radius 3. --height 1. --output-file native-cylinder.brep "
+                "--backend gmsh"
+            ),
+            string.Template(
+                "${turbo_turtle_command} partition ${abaqus_command} ${cubit_command} "
+                "--input-file native-sphere.xao --part-name native-sphere --backend gmsh"
+            ),
+            string.Template(
+                "${turbo_turtle_command} sets ${abaqus_command} ${cubit_command} "
+                '--input-file native-sphere.xao --vertex-set origin "near 0 2 0" --backend gmsh'
+            ),
+            string.Template(
+                "${turbo_turtle_command} merge ${abaqus_command} ${cubit_command} "
+                "--input-file native-sphere.xao native-cylinder.brep --output-file native-merge.xao --fragment "
+                "--backend gmsh"
+            ),
+            string.Template(
+                "${turbo_turtle_command} mesh ${abaqus_command} ${cubit_command} "
+                "--input-file native-sphere.xao --output-file native-sphere.msh --part-name native-sphere "
+                "--global-seed 1. --element-type unused --backend gmsh"
+            ),
+            string.Template(
+                "${turbo_turtle_command} export ${abaqus_command} ${cubit_command} "
+                "--input-file native-sphere.msh --part-name native-sphere --backend gmsh"
+            ),
+        ],
+        marks=pytest.mark.gmsh,
+    )
+)
 for part_name in ("washer vase merge-sphere", ""):
     commands_list.append(setup_merge_commands(part_name, backend="abaqus"))
     commands_list.append(setup_merge_commands(part_name, backend="cubit"))
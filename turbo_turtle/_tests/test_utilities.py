@@ -1,6 +1,7 @@
 """Test the :mod:`turbo_turtle._utilities` module."""
 
 import contextlib
+import pathlib
 import subprocess
 import typing
 from unittest.mock import MagicMock, patch
@@ -67,6 +68,20 @@ def test_run_command() -> None:
     ):
         _utilities.run_command("dummy")
 
+    with patch("subprocess.check_output", return_value=b"output") as mock_check_output:
+        output = _utilities.run_command("dummy")
+    mock_check_output.assert_called_once_with(["dummy"], stderr=None)
+    assert output == "output"
+
+    with (
+        patch(
+            "subprocess.check_output", side_effect=subprocess.CalledProcessError(1, "dummy", b"stdout\nstderr")
+        ) as mock_check_output,
+        pytest.raises(RuntimeError, match="stderr"),
+    ):
+        _utilities.run_command("dummy", capture_stderr=True)
+    mock_check_output.assert_called_once_with(["dummy"], stderr=subprocess.STDOUT)
+
 
 def test_cubit_os_bin() -> None:
     """Test :func:`turbo_turtle._utilities.cubit_os_bin`."""
@@ -180,3 +195,57 @@ def test_character_delimited_list(sequence: typing.Sequence, character: str, exp
     """Test :func:`turbo_turtle._utilities.character_delimited_list`."""
     string = _utilities.character_delimited_list(sequence, character=character)
     assert string == expected
+
+
+def test_cubit_primary_plane_webcuts() -> None:
+    """Test :func:`turbo_turtle._utilities.cubit_primary_plane_webcuts`."""
+    commands = _utilities.cubit_primary_plane_webcuts((1.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 0.0, 1.0), ["one", "two"])
+    assert commands == [
+        'webcut volume with name "one*" with plane normal 0.0 0.0 1.0 center 1.0 0.0 0.0',
+        'webcut volume with name "two*" with plane normal 0.0 0.0 1.0 center 1.0 0.0 0.0',
+        'webcut volume with name "one*" with plane normal 1.0 0.0 0.0 center 1.0 0.0 0.0',
+        'webcut volume with name "two*" with plane normal 1.0 0.0 0.0 center 1.0 0.0 0.0',
+        'webcut volume with name "one*" with plane normal 0.0 1.0 0.0 center 1.0 0.0 0.0',
+        'webcut volume with name "two*" with plane normal 0.0 1.0 0.0 center 1.0 0.0 0.0',
+    ]
+
+
+image_views = {
+    "primary": (
+        (1.0, 2.0, 3.0, "image.png"),
+        None,
+        [(1.0, 2.0, 3.0, pathlib.Path("image.png"))],
+        does_not_raise,
+    ),
+    "additional views": (
+        (1.0, 2.0, 3.0, "image.png"),
+        [("0", "90", "-45.", "top.svg")],
+        [(1.0, 2.0, 3.0, pathlib.Path("image.png")), (0.0, 90.0, -45.0, pathlib.Path("top.svg"))],
+        does_not_raise,
+    ),
+    "not a number": (
+        (1.0, 2.0, 3.0, "image.png"),
+        [("0", "top", "0", "top.svg")],
+        None,
+        pytest.raises(RuntimeError),
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "arguments, views, expected, outcome",
+    image_views.values(),
+    ids=image_views.keys(),
+)
+def test_image_views(
+    arguments: tuple[float, float, float, str],
+    views: list[tuple[str, str, str, str]] | None,
+    expected: list[tuple[float, float, float, pathlib.Path]] | None,
+    outcome: contextlib.nullcontext | pytest.RaisesExc,
+) -> None:
+    """Test :func:`turbo_turtle._utilities.image_views`."""
+    with outcome:
+        try:
+            assert _utilities.image_views(*arguments, views=views) == expected
+        finally:
+            pass
@@ -2,12 +2,13 @@
 
 import argparse
 import copy
+import pathlib
 import typing
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 import pytest
 
-from turbo_turtle import _abaqus_wrappers, _gmsh_wrappers
+from turbo_turtle import _abaqus_wrappers, _cubit_journal_wrappers, _gmsh_wrappers
 
 command = "/dummy/command"
 
@@ -25,6 +26,7 @@ geometry_namespace_sparse = {
     "y_offset": 0.0,
     "rtol": None,
     "atol": None,
+    "jobs": 1,
 }
 geometry_namespace_full = copy.deepcopy(geometry_namespace_sparse)
 (geometry_namespace_full.update({"planar": True, "part_name": ["part_name"], "rtol": 1.0e-9, "atol": 1.0e-9}),)
@@ -142,6 +144,14 @@ mesh_namespace_sparse = {
     "part_name": "part_name",
     "global_seed": "global_seed",
     "edge_seeds": None,
+    "num_threads": None,
+    "algorithm_2d": None,
+    "algorithm_3d": None,
+    "distance_refinements": None,
+    "boundary_layers": None,
+    "curvature_elements": None,
+    "verbosity": None,
+    "log_file": None,
 }
 mesh_namespace_full = copy.deepcopy(mesh_namespace_sparse)
 (mesh_namespace_full.update({"output_file": "output_file", "edge_seeds": [["name", "1"]]}),)
@@ -161,6 +171,8 @@ merge_namespace_sparse = {
     "merged_model_name": "merged_model_name",
     "model_name": [None],
     "part_name": [None],
+    "fragment": False,
+    "jobs": None,
 }
 merge_namespace_full = copy.deepcopy(merge_namespace_sparse)
 (
@@ -185,6 +197,7 @@ export_namespace_sparse = {
     "element_type": [None],
     "destination": ".",
     "assembly": None,
+    "single_pass": False,
 }
 export_namespace_full = copy.deepcopy(export_namespace_sparse)
 (
@@ -192,11 +205,12 @@ export_namespace_full = copy.deepcopy(export_namespace_sparse)
         {
             "element_type": ["element_type"],
             "assembly": True,
+            "single_pass": True,
         }
     ),
 )
 export_expected_options_sparse = ["--input-file", "--model-name", "--part-name", "--destination"]
-export_unexpected_options_sparse = ["--element-type", "--assembly"]
+export_unexpected_options_sparse = ["--element-type", "--assembly", "--single-pass"]
 
 image_namespace_sparse = {
     "input_file": "input_file",
@@ -208,6 +222,8 @@ image_namespace_sparse = {
     "model_name": "model_name",
     "part_name": None,
     "color_map": "color_map",
+    "views": None,
+    "offscreen": False,
 }
 image_namespace_full = copy.deepcopy(image_namespace_sparse)
 (image_namespace_full.update({"part_name": "part_name"}),)
@@ -346,6 +362,104 @@ def test_abaqus_wrappers(
         assert option not in command_string
 
 
+geometry_sharded = {
+    "two jobs, even": (
+        ["one.csv", "two.csv", "three.csv", "four.csv"],
+        [None],
+        2,
+        [["one.csv two.csv", "one two"], ["three.csv four.csv", "three four"]],
+    ),
+    "two jobs, uneven": (
+        ["one.csv", "two.csv", "three.csv"],
+        ["a", "b", "c"],
+        2,
+        [["one.csv two.csv", "a b"], ["three.csv", "c"]],
+    ),
+    "more jobs than files": (
+        ["one.csv", "two.csv"],
+        [None],
+        4,
+        [["one.csv", "one"], ["two.csv", "two"]],
+    ),
+    "cpu count": (
+        ["one.csv", "two.csv", "three.csv", "four.csv"],
+        [None],
+        0,
+        [["one.csv", "one"], ["two.csv", "two"], ["three.csv", "three"], ["four.csv", "four"]],
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "input_file, part_name, jobs, expected_shards",
+    geometry_sharded.values(),
+    ids=geometry_sharded.keys(),
+)
+def test_abaqus_geometry_sharded(
+    input_file: list[str], part_name: list[str | None], jobs: int, expected_shards: list[list[str]]
+) -> None:
+    """Test the sharded :func:`turbo_turtle._abaqus_wrappers.geometry` commands."""
+    namespace = copy.deepcopy(geometry_namespace_sparse)
+    namespace.update({"input_file": input_file, "part_name": part_name, "jobs": jobs})
+    args = argparse.Namespace(**namespace)
+    with (
+        patch("turbo_turtle._utilities.run_command") as mock_run,
+        patch("os.cpu_count", return_value=4),
+    ):
+        _abaqus_wrappers.geometry(args, command)
+    commands = [call.args[0] for call in mock_run.call_args_list]
+    assert len(commands) == len(expected_shards) + 1
+    for shard_command, (shard_input, shard_part) in zip(commands[:-1], expected_shards, strict=True):
+        assert "geometry.py" in shard_command
+        assert f"--input-file {shard_input} " in shard_command
+        assert f"--part-name {shard_part} " in shard_command
+        assert "--output-file output_file " not in shard_command
+    merge_command = commands[-1]
+    assert "merge.py" in merge_command
+    assert "--output-file output_file " in merge_command
+    assert "--merged-model-name model_name " in merge_command
+    assert merge_command.count("shard") == len(expected_shards)
+
+
+geometry_sharded_failure = {
+    "reported parts": (
+        "Error: failed to create the following parts from input files.\n    three, three.csv\n",
+        ["    three, three.csv"],
+    ),
+    "unreported parts": (
+        "license error",
+        ["    three, three.csv", "    four, four.csv", "license error"],
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "shard_message, expected_message",
+    geometry_sharded_failure.values(),
+    ids=geometry_sharded_failure.keys(),
+)
+def test_abaqus_geometry_sharded_failure(shard_message: str, expected_message: list[str]) -> None:
+    """Test the aggregated failed parts message of the sharded :func:`turbo_turtle._abaqus_wrappers.geometry`."""
+    namespace = copy.deepcopy(geometry_namespace_sparse)
+    namespace.update({"input_file": ["one.csv", "two.csv", "three.csv", "four.csv"], "jobs": 2})
+    args = argparse.Namespace(**namespace)
+
+    def run_command(command: str, **_kwargs) -> None:
+        if "three.csv" in command:
+            raise RuntimeError(shard_message)
+
+    with (
+        patch("turbo_turtle._utilities.run_command", side_effect=run_command) as mock_run,
+        pytest.raises(RuntimeError) as err,
+    ):
+        _abaqus_wrappers.geometry(args, command)
+    assert mock_run.call_count == 2
+    assert all(call.kwargs == {"capture_stderr": True} for call in mock_run.call_args_list)
+    message = str(err.value).split("\n")
+    assert message[0].startswith("Error: failed to create the following parts")
+    assert message[1:] == expected_message
+
+
 def trim_namespace(original: dict, pop_keys: typing.Sequence[str]) -> dict:
     """Create a modified dictionary deepcopy by removing the provided keys.
 
@@ -367,7 +481,7 @@ def test_trim_namespace() -> None:
 
 
 geometry_positional = ("input_file", "output_file")
-geometry_unused = ("model_name",)
+geometry_unused = ("model_name", "jobs")
 geometry_keywords = trim_namespace(geometry_namespace_sparse, geometry_positional + geometry_unused)
 
 cylinder_positional = ("inner_radius", "outer_radius", "height", "output_file")
@@ -383,21 +497,32 @@ partition_unused = ("model_name",)
 partition_keywords = trim_namespace(partition_namespace_sparse, partition_positional + partition_unused)
 
 mesh_positional = ("input_file", "element_type")
-mesh_unused = ("model_name",)
+mesh_unused = (
+    "model_name",
+    "num_threads",
+    "algorithm_2d",
+    "algorithm_3d",
+    "distance_refinements",
+    "boundary_layers",
+    "curvature_elements",
+    "verbosity",
+    "log_file",
+)
 mesh_keywords = trim_namespace(mesh_namespace_sparse, mesh_positional + mesh_unused)
 
 merge_positional = ("input_file", "output_file")
-merge_unused = ("model_name", "merged_model_name", "part_name")
+merge_unused = ("model_name", "merged_model_name", "part_name", "fragment")
 merge_keywords = trim_namespace(merge_namespace_sparse, merge_positional + merge_unused)
 
 export_namespace_cubit = copy.deepcopy(export_namespace_sparse)
 export_namespace_cubit["output_type"] = "output_type"
+export_namespace_cubit["jobs"] = 1
 export_positional = ("input_file",)
-export_unused = ("model_name", "assembly")
+export_unused = ("model_name", "assembly", "single_pass")
 export_keywords = trim_namespace(export_namespace_cubit, export_positional + export_unused)
 
 image_positional = ("input_file", "output_file", "command")
-image_unused = ("model_name", "part_name", "color_map")
+image_unused = ("model_name", "part_name", "color_map", "offscreen")
 image_keywords = trim_namespace(image_namespace_sparse, image_positional + image_unused)
 
 cubit_wrapper_tests = {
@@ -438,14 +563,82 @@ def test_cubit_wrappers(
     assert call_keywords == keywords
 
 
-geometry_keywords = trim_namespace(geometry_namespace_sparse, geometry_positional)
+cubit_journal_wrapper_tests = {
+    subcommand: (function, namespace, (ANY, *positional), keywords)
+    for subcommand, (function, namespace, positional, keywords) in cubit_wrapper_tests.items()
+}
+cubit_journal_wrapper_tests["sets"] = (
+    "sets",
+    sets_namespace_sparse,
+    (ANY, "input_file"),
+    trim_namespace(sets_namespace_sparse, ("input_file", "model_name")),
+)
+cubit_journal_wrapper_tests["merge"] = (
+    "merge",
+    merge_namespace_sparse,
+    (ANY, ["input_file"], "output_file"),
+    trim_namespace(merge_namespace_sparse, (*merge_positional, *merge_unused, "jobs")),
+)
+cubit_journal_wrapper_tests["export"] = (
+    "export",
+    export_namespace_cubit,
+    (ANY, "input_file"),
+    trim_namespace(export_namespace_cubit, (*export_positional, *export_unused, "jobs")),
+)
+cubit_journal_wrapper_tests["image"] = (
+    "image",
+    image_namespace_sparse,
+    (ANY, "input_file", "output_file"),
+    image_keywords,
+)
+cubit_journal_files = {
+    "geometry": "output_file.jou",
+    "cylinder": "output_file.jou",
+    "sphere": "output_file.jou",
+    "partition": "input_file.jou",
+    "mesh": "input_file.jou",
+    "merge": "output_file.jou",
+    "export": "input_file.jou",
+    "image": "output_file.jou",
+    "sets": "input_file.jou",
+}
+
+
+@pytest.mark.parametrize(
+    "subcommand, namespace, positional, keywords",
+    cubit_journal_wrapper_tests.values(),
+    ids=cubit_journal_wrapper_tests.keys(),
+)
+def test_cubit_journal_wrappers(
+    subcommand: str, namespace: dict[str, typing.Any], positional: tuple[str], keywords: dict[str, typing.Any]
+) -> None:
+    """Test the :mod:`turbo_turtle._cubit_journal_wrappers` module."""
+    args = argparse.Namespace(**namespace)
+    with (
+        patch(f"turbo_turtle._cubit_journal.{subcommand}") as mock_function,
+        patch("turbo_turtle._cubit_journal.Journal.run") as mock_run,
+    ):
+        subcommand_wrapper = getattr(_cubit_journal_wrappers, subcommand)
+        subcommand_wrapper(args, command)
+    mock_function.assert_called_once()
+    call_positional = mock_function.call_args[0]
+    call_keywords = mock_function.call_args[1]
+    assert call_positional == positional
+    assert call_keywords == keywords
+    mock_run.assert_called_once_with(pathlib.Path(cubit_journal_files[subcommand]), command)
+
+
+geometry_keywords = trim_namespace(geometry_namespace_sparse, (*geometry_positional, "jobs"))
 cylinder_keywords = trim_namespace(cylinder_namespace, cylinder_positional)
 sphere_keywords = trim_namespace(sphere_namespace_sparse, sphere_positional)
-partition_keywords = trim_namespace(partition_namespace_sparse, partition_positional)
+partition_keywords = trim_namespace(partition_namespace_sparse, partition_positional + partition_unused)
+sets_positional = ("input_file",)
+sets_unused = ("model_name",)
+sets_keywords = trim_namespace(sets_namespace_sparse, sets_positional + sets_unused)
 mesh_keywords = trim_namespace(mesh_namespace_sparse, mesh_positional)
-merge_keywords = trim_namespace(merge_namespace_sparse, merge_positional)
-export_keywords = trim_namespace(export_namespace_cubit, export_positional)
-image_keywords = trim_namespace(image_namespace_sparse, image_positional + image_unused)
+merge_keywords = trim_namespace(merge_namespace_sparse, (*merge_positional, "model_name"))
+export_keywords = trim_namespace(export_namespace_cubit, (*export_positional, *export_unused, "jobs"))
+image_keywords = trim_namespace(image_namespace_sparse, (*image_positional, "model_name", "part_name", "color_map"))
 gmsh_wrapper_tests = {
     "geometry": (
         "geometry",
@@ -471,6 +664,12 @@ gmsh_wrapper_tests = {
         ("input_file",),
         partition_keywords,
     ),
+    "sets": (
+        "sets",
+        sets_namespace_sparse,
+        ("input_file",),
+        sets_keywords,
+    ),
     "mesh": (
         "mesh",
         mesh_namespace_sparse,
@@ -508,24 +707,14 @@ def test_gmsh_wrappers(
 ) -> None:
     """Test the :mod:`turbo_turtle._gmsh_wrappers` module."""
     args = argparse.Namespace(**namespace)
-    implemented = ["geometry", "cylinder", "sphere", "mesh", "image"]
-    if subcommand in implemented:
-        with (
-            patch("turbo_turtle._utilities.import_gmsh"),
-            patch(f"turbo_turtle._gmsh_python.{subcommand}") as mock_function,
-        ):
-            subcommand_wrapper = getattr(_gmsh_wrappers, subcommand)
-            subcommand_wrapper(args, command)
-        mock_function.assert_called_once()
-        call_positional = mock_function.call_args[0]
-        call_keywords = mock_function.call_args[1]
-        assert call_positional == positional
-        assert call_keywords == keywords
-    else:
-        with (
-            patch("turbo_turtle._utilities.import_gmsh"),
-            patch(f"turbo_turtle._gmsh_python.{subcommand}") as mock_function,
-            pytest.raises(RuntimeError),
-        ):
-            subcommand_wrapper = getattr(_gmsh_wrappers, subcommand)
-            subcommand_wrapper(args, command)
+    with (
+        patch("turbo_turtle._utilities.import_gmsh"),
+        patch(f"turbo_turtle._gmsh_python.{subcommand}") as mock_function,
+    ):
+        subcommand_wrapper = getattr(_gmsh_wrappers, subcommand)
+        subcommand_wrapper(args, command)
+    mock_function.assert_called_once()
+    call_positional = mock_function.call_args[0]
+    call_keywords = mock_function.call_args[1]
+    assert call_positional == positional
+    assert call_keywords == keywords
@@ -10,6 +10,8 @@ import tempfile
 import types
 import typing
 
+import numpy
+
 from turbo_turtle._abaqus_python.turbo_turtle_abaqus._mixed_utilities import print_exception_message
 
 
@@ -153,16 +155,19 @@ def import_cubit() -> types.ModuleType:
     return cubit
 
 
-def run_command(command: str) -> None:
+def run_command(command: str, capture_stderr: bool = False) -> str:
     """Split command on whitespace, execute shell command, raise RuntimeError with any error message.
 
     :param command: String to run on the shell
+    :param capture_stderr: Merge STDERR into the captured output, so the output and error message include STDERR
+
+    :returns: captured command output
     """
     system = platform.system().lower()
     posix = False if system == "windows" else True
     command_list = shlex.split(command, posix=posix)
     try:
-        subprocess.check_output(command_list)
+        return subprocess.check_output(command_list, stderr=subprocess.STDOUT if capture_stderr else None).decode()
     except subprocess.CalledProcessError as err:
         raise RuntimeError(err.output.decode()) from err
 
@@ -189,6 +194,9 @@ def set_wrappers_and_command(args: argparse.Namespace) -> tuple[types.ModuleType
         if importlib.util.find_spec("cubit") is None:
             sys.path.append(str(cubit_bin))
         from turbo_turtle import _cubit_wrappers as _wrappers  # type: ignore[no-redef] # noqa: PLC0415
+    elif "backend" in keys and args.backend == "cubit-journal":
+        command = find_command_or_exit(args.cubit_command)
+        from turbo_turtle import _cubit_journal_wrappers as _wrappers  # type: ignore[no-redef] # noqa: PLC0415
     elif "abaqus_command" in keys:
         command = find_command_or_exit(args.abaqus_command)
         from turbo_turtle import _abaqus_wrappers as _wrappers  # type: ignore[no-redef] # noqa: PLC0415
@@ -235,3 +243,63 @@ def character_delimited_list(sequence: typing.Iterable, character: str = " ") ->
     :returns: string delimited by specified character
     """
     return character.join(map(str, sequence))
+
+
+def cubit_primary_plane_webcuts(
+    center: tuple[float, float, float] | numpy.ndarray,
+    xvector: tuple[float, float, float] | numpy.ndarray,
+    zvector: tuple[float, float, float] | numpy.ndarray,
+    names: typing.Iterable[str],
+) -> list[str]:
+    """Return the Cubit commands to webcut all volumes with a name prefix on the local coordinate system primary planes.
+
+    The planes are defined by their normal vector and the center point, so no construction surfaces are required.
+    Shared by the :mod:`turbo_turtle._cubit_python` and :mod:`turbo_turtle._cubit_journal` implementations.
+
+    :param center: center location of the geometry
+    :param xvector: Local x-axis vector defined in global coordinates
+    :param zvector: Local z-axis vector defined in global coordinates
+    :param names: volume name prefixes
+
+    :returns: list of Cubit APREPRO commands. The XY, YZ, and ZX planes are cut in order for every name prefix.
+    """
+    names = list(names)
+    center = numpy.array(center, dtype=float)
+    xvector = numpy.array(xvector, dtype=float)
+    zvector = numpy.array(zvector, dtype=float)
+    yvector = numpy.cross(zvector, xvector)
+    center_string = character_delimited_list(center)
+    return [
+        f'webcut volume with name "{name}*" with plane normal {character_delimited_list(normal)} center {center_string}'
+        for normal in (zvector, xvector, yvector)
+        for name in names
+    ]
+
+
+def image_views(
+    x_angle: float,
+    y_angle: float,
+    z_angle: float,
+    output_file: str | pathlib.Path,
+    views: typing.Sequence[tuple[str | float, str | float, str | float, str | pathlib.Path]] | None = None,
+) -> list[tuple[float, float, float, pathlib.Path]]:
+    """Return the primary view followed by the additional views with numeric angles.
+
+    :param x_angle: Rotation about 'world' X-axis in degrees
+    :param y_angle: Rotation about 'world' Y-axis in degrees
+    :param z_angle: Rotation about 'world' Z-axis in degrees
+    :param output_file: Screenshot file to write
+    :param views: Additional view tuples (x angle, y angle, z angle, output file)
+
+    :returns: view tuples (x angle, y angle, z angle, output file)
+
+    :raises RuntimeError: if an additional view angle is not a number
+    """
+    all_views = [(float(x_angle), float(y_angle), float(z_angle), pathlib.Path(output_file))]
+    for view in views or []:
+        try:
+            angles = [float(angle) for angle in view[0:3]]
+        except ValueError as err:
+            raise RuntimeError(f"View angles must be numbers: '{view}'") from err
+        all_views.append((*angles, pathlib.Path(view[3])))  # type: ignore[arg-type]
+    return all_views  # type: ignore[return-value]